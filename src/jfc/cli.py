@@ -218,11 +218,12 @@ def schedule(
                 logger.error(f"Scheduled collection sync failed: {e}")
 
     async def posters_regeneration():
-        """Monthly poster regeneration - always forces regeneration of all posters.
+        """Monthly poster regeneration.
 
-        The scheduled job always regenerates all posters because collection content
-        changes over time. Use the manual 'regenerate-posters --missing-only' command
-        if you only want to generate missing posters.
+        With OPENAI_SMART_REGENERATE (default), a poster is only regenerated when
+        its inputs (top items, category, theme, templates, logo text) changed since
+        it was generated, or when it is older than OPENAI_POSTER_MAX_AGE_DAYS.
+        Otherwise every poster is regenerated.
 
         Always ignores collection schedules to process all collections.
         """
@@ -232,11 +233,14 @@ def schedule(
             return
 
         async with run_lock:
-            logger.info("Starting scheduled poster regeneration (force all, ignore schedules)...")
+            smart = settings.openai.smart_regenerate
+            mode = "changed inputs only" if smart else "force all"
+            logger.info(f"Starting scheduled poster regeneration ({mode}, ignore schedules)...")
             try:
                 await runner.run(
                     scheduled=True,
-                    force_posters=True,  # Always force on scheduled runs
+                    force_posters=not smart,
+                    smart_posters=smart,
                     posters_only=True,
                     ignore_schedule=True,  # Always process all collections for poster regen
                 )
@@ -248,6 +252,9 @@ def schedule(
         # Ensure Trakt is authenticated if configured (at startup)
         await ensure_trakt_auth(settings)
 
+        # Patch the library index from Jellyfin events between runs
+        runner.start_library_watcher()
+
         # Schedule collection sync job
         scheduler.add_cron_job(
             name="collection_sync",
@@ -270,7 +277,11 @@ def schedule(
                 func=posters_regeneration,
                 cron_expression=post_cron,
             )
-            console.print(f"[green]✓[/green] Poster regeneration scheduled: [cyan]{post_cron}[/cyan] (force all)")
+            poster_mode = "smart" if settings.openai.smart_regenerate else "force all"
+            console.print(
+                f"[green]✓[/green] Poster regeneration scheduled: "
+                f"[cyan]{post_cron}[/cyan] ({poster_mode})"
+            )
         else:
             console.print("[yellow]![/yellow] Poster regeneration disabled (no cron set)")
 
@@ -541,6 +552,10 @@ def test_connections() -> None:
 
         console.print(table)
 
+        from jfc.clients.transport import get_transport
+
+        await get_transport().aclose()
+
     asyncio.run(_test())
 
 
@@ -639,17 +654,23 @@ def regenerate_posters(
         True, "--ignore-schedule/--respect-schedule",
         help="Ignore collection schedules (default: ignore)"
     ),
+    smart: bool = typer.Option(
+        False, "--smart", "-s",
+        help="Only regenerate posters whose inputs changed (or older than max age)"
+    ),
 ) -> None:
     """Regenerate AI posters for collections.
 
     By default, uses the 'missing_only' setting from config.yml (openai.missing_only).
     Use --missing-only to only generate posters for collections that don't have one yet.
     Use --force-all to regenerate all posters regardless of existing ones.
+    Use --smart to regenerate only posters whose inputs changed since generation.
 
     By default, ignores collection schedules to process all collections.
     Use --respect-schedule to only process collections scheduled for today.
 
-    Note: The scheduled poster job always uses --force-all and --ignore-schedule.
+    Note: The scheduled poster job uses --smart (or --force-all if
+    openai.smart_regenerate is disabled) and --ignore-schedule.
     """
     settings = get_settings()
     log_dir = settings.get_log_path()
@@ -671,7 +692,9 @@ def regenerate_posters(
 
         runner = Runner(settings)
         try:
-            if use_missing_only:
+            if smart:
+                console.print("[cyan]Regenerating posters whose inputs changed...[/cyan]")
+            elif use_missing_only:
                 console.print("[cyan]Generating missing posters only...[/cyan]")
             else:
                 console.print("[cyan]Regenerating all posters (force)...[/cyan]")
@@ -680,7 +703,8 @@ def regenerate_posters(
                 libraries=libraries,
                 collections=collections,
                 scheduled=False,
-                force_posters=not use_missing_only,  # Force only if not missing_only
+                force_posters=not (smart or use_missing_only),  # Force only if not missing_only
+                smart_posters=smart,
                 posters_only=True,  # Skip collection sync, only do posters
                 ignore_schedule=ignore_schedule,
             )
@@ -0,0 +1,56 @@
+"""Helpers shared by the Radarr and Sonarr clients."""
+
+import asyncio
+import math
+from typing import Any, Optional
+
+from jfc.clients.base import BaseClient
+
+# Pages of a paged *arr resource fetched at the same time
+PAGE_CONCURRENCY = 4
+
+
+async def fetch_paged_records(
+    client: BaseClient,
+    endpoint: str,
+    page_size: int = 1000,
+    params: Optional[dict[str, Any]] = None,
+    concurrency: int = PAGE_CONCURRENCY,
+) -> list[dict[str, Any]]:
+    """
+    Fetch every record of a paged *arr resource (e.g. /api/v3/blocklist).
+
+    Page 1 gives the total record count; the remaining pages are then
+    fetched concurrently and returned in page order.
+
+    Args:
+        client: Radarr or Sonarr client
+        endpoint: Paged API endpoint
+        page_size: Records per page
+        params: Extra query parameters
+        concurrency: Pages fetched at the same time
+
+    Returns:
+        All records
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_page(page: int) -> dict[str, Any]:
+        async with semaphore:
+            response = await client.get(
+                endpoint,
+                params={**(params or {}), "page": page, "pageSize": page_size},
+            )
+            response.raise_for_status()
+            return response.json()
+
+    first = await fetch_page(1)
+    records = list(first.get("records", []))
+
+    pages = math.ceil(first.get("totalRecords", 0) / page_size)
+    if pages > 1:
+        rest = await asyncio.gather(*(fetch_page(page) for page in range(2, pages + 1)))
+        for data in rest:
+            records.extend(data.get("records", []))
+
+    return records
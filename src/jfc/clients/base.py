@@ -1,14 +1,26 @@
 """Base client with common HTTP functionality."""
 
-from typing import Any, Optional
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Union
 
 import httpx
 from loguru import logger
 
+from jfc.clients.cache import CachedResponse, ResponseCache, make_cache_key
+from jfc.clients.ratelimit import TokenBucket, get_rate_limiter
+from jfc.clients.retry import RetryPolicy, RetryStats
+from jfc.clients.transport import get_transport
+
 
 class BaseClient:
     """Base HTTP client with common functionality."""
 
+    # Name of the shared rate-limit bucket (None = not rate limited)
+    rate_limit_bucket: Optional[str] = None
+
+    # GET endpoint prefix -> seconds a cached response stays fresh
+    cache_ttls: dict[str, float] = {}
+
     def __init__(
         self,
         base_url: str,
@@ -29,7 +41,16 @@ class BaseClient:
         self.api_key = api_key
         self.timeout = timeout
         self._headers = headers or {}
-        self._client: Optional[httpx.AsyncClient] = None
+
+        # Retry behaviour and counters (budget is tracked per client)
+        self.retry_policy = RetryPolicy()
+        self.retry_stats = RetryStats()
+
+        # Disk response cache for endpoints listed in cache_ttls (set by the runner)
+        self.response_cache: Optional[ResponseCache] = None
+
+        # In-flight GET requests, keyed like the response cache (single-flight)
+        self._inflight: dict[str, asyncio.Future[httpx.Response]] = {}
 
     @property
     def headers(self) -> dict[str, str]:
@@ -40,32 +61,201 @@ class BaseClient:
             **self._headers,
         }
 
+    @property
+    def rate_limiter(self) -> Optional[TokenBucket]:
+        """Get the rate-limit bucket shared by all clients of this class."""
+        if not self.rate_limit_bucket:
+            return None
+        return get_rate_limiter(self.rate_limit_bucket)
+
+    def _cache_ttl(self, endpoint: str) -> float:
+        """Get cache TTL for an endpoint (longest matching prefix, 0 = not cached)."""
+        matches = [prefix for prefix in self.cache_ttls if endpoint.startswith(prefix)]
+        if not matches:
+            return 0
+        return self.cache_ttls[max(matches, key=len)]
+
+    def _cached_response(
+        self,
+        cached: CachedResponse,
+        endpoint: str,
+        params: Optional[dict[str, Any]],
+    ) -> httpx.Response:
+        """Rebuild an httpx response from a cache entry."""
+        headers = {"Content-Type": cached.content_type} if cached.content_type else {}
+        return httpx.Response(
+            200,
+            headers=headers,
+            content=cached.body,
+            request=httpx.Request("GET", self._url(endpoint), params=params),
+        )
+
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                headers=self.headers,
-                timeout=self.timeout,
-            )
-        return self._client
+        """Get the pooled HTTP client for this client's host."""
+        return get_transport().get_client(self.base_url)
+
+    def _url(self, endpoint: str) -> str:
+        """Build absolute URL for an endpoint."""
+        return f"{self.base_url}{endpoint}"
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """
+        Release the client.
+
+        Connections live in the shared transport pool and are closed by
+        TransportManager.aclose(), so there is nothing to release per client.
+        """
+
+    def _retry_allowed(self, attempt: int) -> bool:
+        """Check attempt count and the client's retry budget."""
+        if attempt >= self.retry_policy.max_attempts:
+            return False
+
+        budget = self.retry_policy.budget
+        if budget and self.retry_stats.retries >= budget:
+            self.retry_stats.budget_exhausted += 1
+            if self.retry_stats.budget_exhausted == 1:
+                logger.warning(
+                    f"[{self.__class__.__name__}] Retry budget exhausted "
+                    f"({budget} retries), failing fast"
+                )
+            return False
+
+        return True
+
+    async def _send_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """
+        Send a request through the rate limiter, retrying transient failures.
+
+        Args:
+            method: HTTP method (decides whether replaying is safe)
+            endpoint: API endpoint (for logging)
+            send: Callable performing one attempt
+
+        Returns:
+            Last HTTP response
+
+        Raises:
+            httpx.TransportError: If the last attempt failed at transport level
+        """
+        policy = self.retry_policy
+        limiter = self.rate_limiter
+        self.retry_stats.requests += 1
+        attempt = 1
+
+        while True:
+            # Every attempt, retries included, consumes a rate-limit token
+            if limiter:
+                await limiter.acquire()
+
+            response: Optional[httpx.Response] = None
+            try:
+                response = await send()
+            except httpx.TransportError as e:
+                if not policy.should_retry_error(method, e) or not self._retry_allowed(attempt):
+                    raise
+                reason = f"{type(e).__name__}"
+            else:
+                if not policy.should_retry_status(method, response.status_code):
+                    return response
+                if not self._retry_allowed(attempt):
+                    return response
+                reason = f"HTTP {response.status_code}"
+
+            delay = policy.delay_for(attempt, response)
+            self.retry_stats.retries += 1
+            self.retry_stats.backoff_seconds += delay
+
+            logger.warning(
+                f"[{self.__class__.__name__}] {method} {endpoint} {reason}, "
+                f"retrying in {delay:.1f}s (attempt {attempt + 1}/{policy.max_attempts})"
+            )
+
+            await asyncio.sleep(delay)
+            attempt += 1
 
     async def _request(
         self,
         method: str,
         endpoint: str,
         params: Optional[dict[str, Any]] = None,
-        json: Optional[dict[str, Any]] = None,
+        json: Any = None,
         **kwargs,
     ) -> httpx.Response:
         """
         Make HTTP request.
 
+        Concurrent identical GET requests (same endpoint and params) are
+        coalesced: the first caller performs the request and the others
+        await its response.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            params: Query parameters
+            json: JSON body
+            **kwargs: Additional httpx arguments
+
+        Returns:
+            HTTP response
+        """
+        # Only plain GETs are shared; extra arguments may change the request
+        if method.upper() != "GET" or kwargs:
+            return await self._perform_request(method, endpoint, params, json, **kwargs)
+
+        key = make_cache_key(self.base_url, endpoint, params)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                response = await asyncio.shield(inflight)
+                self.retry_stats.coalesced += 1
+                logger.debug(f"[{self.__class__.__name__}] {method} {endpoint} (coalesced)")
+                return response
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leading caller was cancelled, not us: send our own request
+
+        future: asyncio.Future[httpx.Response] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await self._perform_request(method, endpoint, params, json)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+        return response
+
+    async def _perform_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        json: Any = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Send one logical request (cache, rate limit and retries included).
+
+        Transient failures (429, 5xx, dropped connections) are retried
+        according to the client's retry policy. GET requests on endpoints
+        listed in cache_ttls are served from the response cache while fresh,
+        and revalidated with ETag/Last-Modified once stale.
+
         Args:
             method: HTTP method
             endpoint: API endpoint
@@ -80,12 +270,38 @@ class BaseClient:
 
         logger.debug(f"[{self.__class__.__name__}] {method} {endpoint}")
 
-        response = await client.request(
-            method=method,
-            url=endpoint,
-            params=params,
-            json=json,
-            **kwargs,
+        kwargs.setdefault("timeout", self.timeout)
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+
+        # Response cache lookup
+        cache = self.response_cache if method.upper() == "GET" else None
+        ttl = self._cache_ttl(endpoint) if cache else 0
+        cache_key: Optional[str] = None
+        cached: Optional[CachedResponse] = None
+
+        if cache and ttl:
+            cache_key = make_cache_key(self.base_url, endpoint, params)
+            cached = cache.get(cache_key)
+            if cached and cached.fresh:
+                cache.stats.hits += 1
+                logger.debug(f"[{self.__class__.__name__}] {method} {endpoint} (cached)")
+                return self._cached_response(cached, endpoint, params)
+            if cached and cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached and cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = await self._send_with_retry(
+            method,
+            endpoint,
+            lambda: client.request(
+                method=method,
+                url=self._url(endpoint),
+                params=params,
+                json=json,
+                headers=headers,
+                **kwargs,
+            ),
         )
 
         if response.status_code >= 400:
@@ -94,6 +310,23 @@ class BaseClient:
                 f"failed with {response.status_code}: {response.text}"
             )
 
+        if cache and cache_key:
+            if response.status_code == 304 and cached:
+                cache.refresh(cache_key, ttl)
+                cache.stats.revalidated += 1
+                return self._cached_response(cached, endpoint, params)
+
+            cache.stats.misses += 1
+            if response.status_code == 200:
+                cache.put(
+                    cache_key,
+                    response.content,
+                    ttl,
+                    content_type=response.headers.get("Content-Type"),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+
         return response
 
     async def get(
@@ -108,7 +341,7 @@ class BaseClient:
     async def post(
         self,
         endpoint: str,
-        json: Optional[dict[str, Any]] = None,
+        json: Any = None,
         **kwargs,
     ) -> httpx.Response:
         """Make POST request."""
@@ -117,7 +350,7 @@ class BaseClient:
     async def put(
         self,
         endpoint: str,
-        json: Optional[dict[str, Any]] = None,
+        json: Any = None,
         **kwargs,
     ) -> httpx.Response:
         """Make PUT request."""
@@ -134,40 +367,48 @@ class BaseClient:
     async def post_binary(
         self,
         endpoint: str,
-        content: bytes,
+        content: Union[bytes, Callable[[], AsyncIterator[bytes]]],
         content_type: str,
         params: Optional[dict[str, Any]] = None,
+        content_length: Optional[int] = None,
     ) -> httpx.Response:
         """
         Make POST request with binary content.
 
-        Uses a separate client without JSON content-type headers.
+        Sends only the auth headers, without the JSON content-type defaults.
 
         Args:
             endpoint: API endpoint
-            content: Binary content to send
+            content: Binary content to send, or a factory of async byte
+                streams (called again for each retry)
             content_type: MIME type of the content
             params: Query parameters
+            content_length: Body size of streamed content (avoids chunked encoding)
 
         Returns:
             HTTP response
         """
         logger.debug(f"[{self.__class__.__name__}] POST {endpoint} (binary)")
 
-        # Use a fresh client for binary uploads to avoid header conflicts
-        async with httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-        ) as client:
-            response = await client.post(
-                endpoint,
-                content=content,
+        headers = {
+            "Content-Type": content_type,
+            **self._headers,  # Include auth headers like X-Emby-Token
+        }
+        if content_length is not None:
+            headers["Content-Length"] = str(content_length)
+
+        client = await self._get_client()
+        response = await self._send_with_retry(
+            "POST",
+            endpoint,
+            lambda: client.post(
+                self._url(endpoint),
+                content=content() if callable(content) else content,
                 params=params,
-                headers={
-                    "Content-Type": content_type,
-                    **self._headers,  # Include auth headers like X-Emby-Token
-                },
-            )
+                headers=headers,
+                timeout=self.timeout,
+            ),
+        )
 
         if response.status_code >= 400:
             logger.error(
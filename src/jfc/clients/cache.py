@@ -0,0 +1,245 @@
+"""Disk-backed HTTP response cache (SQLite)."""
+
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+# Query parameters that never take part in cache keys
+SECRET_PARAMS = frozenset({"api_key", "apikey", "access_token", "token"})
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body with its validators."""
+
+    body: bytes
+    content_type: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be served without asking upstream."""
+        return time.time() < self.expires_at
+
+
+@dataclass
+class CacheStats:
+    """Cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stored: int = 0
+    evicted: int = 0
+
+    def reset(self) -> None:
+        """Reset all counters (e.g. at the start of a run)."""
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stored = 0
+        self.evicted = 0
+
+
+def make_cache_key(namespace: str, endpoint: str, params: Optional[dict[str, Any]] = None) -> str:
+    """
+    Build a cache key from endpoint and normalized params.
+
+    Params are sorted and stringified, and secrets like api_key are dropped
+    so the key is stable across runs and safe to store.
+
+    Args:
+        namespace: Upstream identifier (base URL)
+        endpoint: API endpoint
+        params: Query parameters
+
+    Returns:
+        Cache key
+    """
+    normalized = sorted(
+        (str(k), str(v))
+        for k, v in (params or {}).items()
+        if v is not None and str(k).lower() not in SECRET_PARAMS
+    )
+    return f"{namespace}{endpoint}?{json.dumps(normalized, separators=(',', ':'))}"
+
+
+class ResponseCache:
+    """
+    SQLite response cache with TTL, HTTP validators and LRU eviction.
+
+    Entries past their TTL are kept so they can be revalidated with
+    If-None-Match / If-Modified-Since. Once the total body size exceeds
+    max_bytes, least recently used entries are evicted.
+    """
+
+    def __init__(self, db_path: Path, max_bytes: int = 100 * 1024 * 1024):
+        """
+        Initialize cache.
+
+        Args:
+            db_path: SQLite database file
+            max_bytes: Maximum total size of stored bodies
+        """
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    content_type TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up an entry, fresh or stale.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response or None
+        """
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT body, content_type, etag, last_modified, expires_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[Cache] Lookup failed: {e}")
+            return None
+
+        return CachedResponse(
+            body=row[0],
+            content_type=row[1],
+            etag=row[2],
+            last_modified=row[3],
+            expires_at=row[4],
+        )
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        ttl: float,
+        content_type: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """
+        Store a response body.
+
+        Args:
+            key: Cache key
+            body: Raw response body
+            ttl: Seconds the entry stays fresh
+            content_type: Response Content-Type
+            etag: ETag validator
+            last_modified: Last-Modified validator
+        """
+        now = time.time()
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, body, content_type, etag, last_modified, expires_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, body, content_type, etag, last_modified, now + ttl, now, len(body)),
+            )
+            conn.commit()
+            self.stats.stored += 1
+            self._evict()
+        except sqlite3.Error as e:
+            logger.warning(f"[Cache] Store failed: {e}")
+
+    def refresh(self, key: str, ttl: float) -> None:
+        """
+        Extend an entry after a 304 Not Modified.
+
+        Args:
+            key: Cache key
+            ttl: Seconds the entry stays fresh
+        """
+        now = time.time()
+        try:
+            conn = self._connect()
+            conn.execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ? WHERE key = ?",
+                (now + ttl, now, key),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[Cache] Refresh failed: {e}")
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under max_bytes."""
+        conn = self._connect()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+
+        conn.commit()
+        self.stats.evicted += evicted
+        logger.debug(f"[Cache] Evicted {evicted} entries ({total / 1024 / 1024:.1f} MB left)")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        try:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[Cache] Clear failed: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -5,9 +5,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
-import httpx
 from loguru import logger
 
+from jfc.clients.transport import get_transport
+
 if TYPE_CHECKING:
     from jfc.models.report import CollectionReport, RunReport
 
@@ -69,15 +70,15 @@ class DiscordWebhook:
             payload["embeds"] = embeds
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload)
+            client = get_transport().get_client(url)
+            response = await client.post(url, json=payload, timeout=30.0)
 
-                if response.status_code == 204:
-                    logger.debug("Discord notification sent successfully")
-                    return True
-                else:
-                    logger.warning(f"Discord webhook returned {response.status_code}")
-                    return False
+            if response.status_code == 204:
+                logger.debug("Discord notification sent successfully")
+                return True
+            else:
+                logger.warning(f"Discord webhook returned {response.status_code}")
+                return False
 
         except Exception as e:
             logger.error(f"Failed to send Discord notification: {e}")
@@ -128,15 +129,15 @@ class DiscordWebhook:
                 "payload_json": json.dumps(payload),
             }
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, data=data, files=files)
+            client = get_transport().get_client(url)
+            response = await client.post(url, data=data, files=files, timeout=30.0)
 
-                if response.status_code == 200:
-                    logger.debug(f"Discord notification with image sent successfully")
-                    return True
-                else:
-                    logger.warning(f"Discord webhook returned {response.status_code}: {response.text}")
-                    return False
+            if response.status_code == 200:
+                logger.debug(f"Discord notification with image sent successfully")
+                return True
+            else:
+                logger.warning(f"Discord webhook returned {response.status_code}: {response.text}")
+                return False
 
         except Exception as e:
             logger.error(f"Failed to send Discord notification with file: {e}")
@@ -0,0 +1,130 @@
+"""Persistent map between TMDb, TVDB and IMDb IDs (SQLite)."""
+
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+
+@dataclass
+class ExternalIds:
+    """Known IDs of one title."""
+
+    tmdb_id: int
+    tvdb_id: Optional[int] = None
+    imdb_id: Optional[str] = None
+
+
+class IdMapStore:
+    """
+    Cross-ID map filled from every TMDb details/external_ids response.
+
+    IDs of a title never change, so entries are kept without expiry. A
+    value that is unknown (None) never overwrites a known one.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize store.
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS ids (
+                    media_type TEXT NOT NULL,
+                    tmdb_id INTEGER NOT NULL,
+                    tvdb_id INTEGER,
+                    imdb_id TEXT,
+                    PRIMARY KEY (media_type, tmdb_id)
+                );
+                CREATE INDEX IF NOT EXISTS ids_tvdb ON ids (media_type, tvdb_id);
+                CREATE INDEX IF NOT EXISTS ids_imdb ON ids (media_type, imdb_id);
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def record(
+        self,
+        media_type: str,
+        tmdb_id: int,
+        tvdb_id: Optional[int] = None,
+        imdb_id: Optional[str] = None,
+    ) -> None:
+        """
+        Store the external IDs of a title.
+
+        Args:
+            media_type: "movie" or "series"
+            tmdb_id: TMDb ID
+            tvdb_id: TVDB ID, if known
+            imdb_id: IMDb ID, if known
+        """
+        if not tmdb_id or not (tvdb_id or imdb_id):
+            return
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO ids (media_type, tmdb_id, tvdb_id, imdb_id) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (media_type, tmdb_id) DO UPDATE SET
+                        tvdb_id = COALESCE(excluded.tvdb_id, tvdb_id),
+                        imdb_id = COALESCE(excluded.imdb_id, imdb_id)
+                    """,
+                    (media_type, tmdb_id, tvdb_id or None, imdb_id or None),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"[TMDb] Failed to save external IDs: {e}")
+
+    def get(self, media_type: str, tmdb_id: int) -> Optional[ExternalIds]:
+        """
+        Get the known IDs of a title by TMDb ID.
+
+        Args:
+            media_type: "movie" or "series"
+            tmdb_id: TMDb ID
+
+        Returns:
+            Known IDs, or None if the title was never seen
+        """
+        return self._find(media_type, "tmdb_id", tmdb_id)
+
+    def find_by_tvdb(self, media_type: str, tvdb_id: int) -> Optional[ExternalIds]:
+        """Get the known IDs of a title by TVDB ID."""
+        return self._find(media_type, "tvdb_id", tvdb_id)
+
+    def find_by_imdb(self, media_type: str, imdb_id: str) -> Optional[ExternalIds]:
+        """Get the known IDs of a title by IMDb ID."""
+        return self._find(media_type, "imdb_id", imdb_id)
+
+    def _find(self, media_type: str, column: str, value: object) -> Optional[ExternalIds]:
+        """Look up one row by an ID column."""
+        try:
+            row = self._connect().execute(
+                f"SELECT tmdb_id, tvdb_id, imdb_id FROM ids WHERE media_type = ? AND {column} = ?",
+                (media_type, value),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"[TMDb] Ignoring unreadable ID map: {e}")
+            return None
+        return ExternalIds(*row) if row else None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,9 +1,13 @@
 """Jellyfin API client for managing collections and media."""
 
+import asyncio
 import base64
 import mimetypes
+import mmap
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 from loguru import logger
 
@@ -14,22 +18,62 @@ from jfc.models.media import LibraryItem, MediaType
 SUPPORTED_IMAGE_FORMATS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 
 
+# Raw bytes encoded per chunk when streaming base64 (multiple of 3: no padding mid-stream)
+BASE64_CHUNK_SIZE = 3 * 64 * 1024
+
+
+async def _stream_base64(path: Path) -> AsyncIterator[bytes]:
+    """Yield the base64 encoding of a file, chunk by chunk, from a memory map."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for start in range(0, len(data), BASE64_CHUNK_SIZE):
+            yield base64.b64encode(data[start : start + BASE64_CHUNK_SIZE])
+
+
+@dataclass
+class CollectionWriteResult:
+    """Outcome of one chunk of a collection membership write."""
+
+    item_ids: list[str]
+    ok: bool
+    status_code: Optional[int] = None
+
+
 class JellyfinClient(BaseClient):
     """Client for Jellyfin API."""
 
-    def __init__(self, url: str, api_key: str):
+    rate_limit_bucket = "jellyfin"
+
+    # Library paging for full scans
+    LIBRARY_PAGE_SIZE = 1000
+    LIBRARY_PAGE_CONCURRENCY = 4
+    # Stable order for offset paging (Id breaks ties between equal sort names)
+    LIBRARY_SORT = {"SortBy": "SortName,Id", "SortOrder": "Ascending"}
+    # Fields needed for matching (Id, Name, Type and ProductionYear are always returned)
+    MATCH_FIELDS = "ProviderIds"
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        collection_chunk_size: int = 100,
+        collection_write_concurrency: int = 4,
+    ):
         """
         Initialize Jellyfin client.
 
         Args:
             url: Jellyfin server URL
             api_key: Jellyfin API key
+            collection_chunk_size: Item IDs per collection write (keeps URLs short)
+            collection_write_concurrency: Unordered collection writes in flight
         """
         super().__init__(
             base_url=url,
             api_key=api_key,
             headers={"X-Emby-Token": api_key},
         )
+        self.collection_chunk_size = collection_chunk_size
+        self.collection_write_concurrency = collection_write_concurrency
 
     # =========================================================================
     # Libraries
@@ -76,25 +120,111 @@ class JellyfinClient(BaseClient):
         response = await self.get("/Items", params=params)
         response.raise_for_status()
 
-        items = []
-        for item in response.json().get("Items", []):
-            provider_ids = item.get("ProviderIds", {})
-            items.append(
-                LibraryItem(
-                    jellyfin_id=item["Id"],
-                    title=item["Name"],
-                    year=item.get("ProductionYear"),
-                    media_type=self._map_item_type(item.get("Type", "")),
-                    tmdb_id=int(provider_ids["Tmdb"]) if provider_ids.get("Tmdb") else None,
-                    imdb_id=provider_ids.get("Imdb"),
-                    tvdb_id=int(provider_ids["Tvdb"]) if provider_ids.get("Tvdb") else None,
-                    library_id=library_id,
-                    library_name=item.get("ParentIndexNumber", "Unknown"),
-                    path=item.get("Path"),
-                )
+        return [
+            self._parse_library_item(item, library_id, item.get("ParentIndexNumber", "Unknown"))
+            for item in response.json().get("Items", [])
+        ]
+
+    async def iter_library_items(
+        self,
+        library_id: str,
+        media_type: Optional[MediaType] = None,
+        page_size: Optional[int] = None,
+        fields: str = MATCH_FIELDS,
+        min_date_last_saved: Optional[datetime] = None,
+    ) -> AsyncIterator[list[LibraryItem]]:
+        """
+        Stream all items of a library page by page.
+
+        The first page gives the total record count; the remaining pages are
+        then fetched concurrently and yielded as they arrive (not in order).
+        Every page uses the same explicit sort so offsets neither overlap nor
+        skip items.
+
+        Args:
+            library_id: Library (parent) ID
+            media_type: Filter by media type
+            page_size: Items per request
+            fields: Extra Fields to request (keep minimal for large libraries)
+            min_date_last_saved: Only items added or changed since then
+
+        Yields:
+            Pages of library items
+        """
+        params = self._library_scan_params(library_id, media_type, fields)
+        if min_date_last_saved:
+            params["MinDateLastSaved"] = min_date_last_saved.isoformat()
+
+        async for page in self._iter_library_pages(params, page_size):
+            yield [self._parse_library_item(item, library_id) for item in page]
+
+    async def get_library_item_ids(
+        self,
+        library_id: str,
+        media_type: Optional[MediaType] = None,
+    ) -> set[str]:
+        """
+        List the IDs of every item of a library (no fields, no images).
+
+        Args:
+            library_id: Library (parent) ID
+            media_type: Filter by media type
+
+        Returns:
+            Jellyfin item IDs
+        """
+        params = self._library_scan_params(library_id, media_type, fields="")
+        return {
+            item["Id"]
+            async for page in self._iter_library_pages(params)
+            for item in page
+        }
+
+    async def _iter_library_pages(
+        self,
+        params: dict[str, Any],
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Fetch raw /Items pages: the first one, then the rest concurrently."""
+        page_size = page_size or self.LIBRARY_PAGE_SIZE
+        params = {**params, **self.LIBRARY_SORT}
+
+        async def fetch_page(start_index: int, with_total: bool = False) -> dict[str, Any]:
+            response = await self.get(
+                "/Items",
+                params={
+                    **params,
+                    "StartIndex": start_index,
+                    "Limit": page_size,
+                    "EnableTotalRecordCount": with_total,
+                },
             )
+            response.raise_for_status()
+            return response.json()
 
-        return items
+        first = await fetch_page(0, with_total=True)
+        total = first.get("TotalRecordCount", 0)
+        yield first.get("Items", [])
+
+        if total <= page_size:
+            return
+
+        semaphore = asyncio.Semaphore(self.LIBRARY_PAGE_CONCURRENCY)
+
+        async def fetch_limited(start_index: int) -> dict[str, Any]:
+            async with semaphore:
+                return await fetch_page(start_index)
+
+        tasks = [
+            asyncio.create_task(fetch_limited(start))
+            for start in range(page_size, total, page_size)
+        ]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                yield (await next_page).get("Items", [])
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def search_items(
         self,
@@ -212,6 +342,66 @@ class JellyfinClient(BaseClient):
         logger.debug(f"[Jellyfin] TMDb lookup: {tmdb_id} -> not found in library")
         return None
 
+    async def get_items_by_ids(
+        self,
+        item_ids: list[str],
+        library_id: str,
+        media_type: Optional[MediaType] = None,
+        chunk_size: int = 100,
+    ) -> list[LibraryItem]:
+        """
+        Get specific items of a library.
+
+        IDs that are not in the library (or not of the media type) are
+        silently skipped.
+
+        Args:
+            item_ids: Jellyfin item IDs
+            library_id: Library (parent) ID
+            media_type: Filter by media type
+            chunk_size: IDs per request (keeps URLs short)
+
+        Returns:
+            Library items found
+        """
+        params = self._library_scan_params(library_id, media_type, self.MATCH_FIELDS)
+        items: list[LibraryItem] = []
+
+        for i in range(0, len(item_ids), chunk_size):
+            response = await self.get(
+                "/Items",
+                params={**params, "Ids": ",".join(item_ids[i : i + chunk_size])},
+            )
+            response.raise_for_status()
+            items.extend(
+                self._parse_library_item(item, library_id)
+                for item in response.json().get("Items", [])
+            )
+
+        return items
+
+    def _library_scan_params(
+        self,
+        library_id: str,
+        media_type: Optional[MediaType],
+        fields: str,
+    ) -> dict[str, Any]:
+        """Build /Items params for a lightweight full-library scan."""
+        params: dict[str, Any] = {
+            "ParentId": library_id,
+            "Recursive": True,
+            "Fields": fields,
+            "EnableImages": False,
+            "EnableUserData": False,
+        }
+
+        if media_type == MediaType.MOVIE:
+            params["IncludeItemTypes"] = "Movie"
+        elif media_type == MediaType.SERIES:
+            params["IncludeItemTypes"] = "Series"
+
+        return params
+
     # =========================================================================
     # Collections
     # =========================================================================
@@ -259,6 +449,9 @@ class JellyfinClient(BaseClient):
         """
         Get item IDs in a collection.
 
+        Items are listed in Jellyfin's own sort order, which is not the
+        order they were added in.
+
         Args:
             collection_id: Collection ID
 
@@ -306,6 +499,7 @@ class JellyfinClient(BaseClient):
         self,
         collection_id: str,
         item_ids: list[str],
+        ordered: bool = True,
     ) -> bool:
         """
         Add items to a collection.
@@ -313,24 +507,13 @@ class JellyfinClient(BaseClient):
         Args:
             collection_id: Collection ID
             item_ids: Item IDs to add
+            ordered: Keep the items in this order (chunks are sent one by one)
 
         Returns:
             True if successful
         """
-        if not item_ids:
-            return True
-
-        response = await self.post(
-            f"/Collections/{collection_id}/Items",
-            params={"Ids": ",".join(item_ids)},
-        )
-
-        if response.status_code == 204:
-            logger.debug(f"Added {len(item_ids)} items to collection {collection_id}")
-            return True
-
-        logger.error(f"Failed to add items to collection: {response.status_code}")
-        return False
+        results = await self.bulk_add_to_collection(collection_id, item_ids, ordered=ordered)
+        return all(r.ok for r in results)
 
     async def remove_from_collection(
         self,
@@ -347,20 +530,101 @@ class JellyfinClient(BaseClient):
         Returns:
             True if successful
         """
-        if not item_ids:
-            return True
+        results = await self.bulk_remove_from_collection(collection_id, item_ids)
+        return all(r.ok for r in results)
 
-        response = await self.delete(
-            f"/Collections/{collection_id}/Items",
-            params={"Ids": ",".join(item_ids)},
+    async def bulk_add_to_collection(
+        self,
+        collection_id: str,
+        item_ids: list[str],
+        ordered: bool = True,
+    ) -> list[CollectionWriteResult]:
+        """
+        Add items to a collection in chunks.
+
+        Jellyfin appends items in request order, so ordered writes send
+        chunks sequentially; unordered writes send them concurrently.
+
+        Args:
+            collection_id: Collection ID
+            item_ids: Item IDs to add
+            ordered: Keep the items in this order
+
+        Returns:
+            One result per chunk
+        """
+        results = await self._write_collection_chunks(
+            "POST", collection_id, item_ids, concurrency=1 if ordered else None
         )
+        added = sum(len(r.item_ids) for r in results if r.ok)
+        if added:
+            logger.debug(f"Added {added} items to collection {collection_id}")
+        return results
 
-        if response.status_code == 204:
-            logger.debug(f"Removed {len(item_ids)} items from collection {collection_id}")
-            return True
+    async def bulk_remove_from_collection(
+        self,
+        collection_id: str,
+        item_ids: list[str],
+    ) -> list[CollectionWriteResult]:
+        """
+        Remove items from a collection in concurrent chunks.
 
-        logger.error(f"Failed to remove items from collection: {response.status_code}")
-        return False
+        Args:
+            collection_id: Collection ID
+            item_ids: Item IDs to remove
+
+        Returns:
+            One result per chunk
+        """
+        results = await self._write_collection_chunks("DELETE", collection_id, item_ids)
+        removed = sum(len(r.item_ids) for r in results if r.ok)
+        if removed:
+            logger.debug(f"Removed {removed} items from collection {collection_id}")
+        return results
+
+    async def _write_collection_chunks(
+        self,
+        method: str,
+        collection_id: str,
+        item_ids: list[str],
+        concurrency: Optional[int] = None,
+    ) -> list[CollectionWriteResult]:
+        """
+        Send a membership write as chunks of IDs.
+
+        Args:
+            method: POST (add) or DELETE (remove)
+            collection_id: Collection ID
+            item_ids: Item IDs
+            concurrency: Chunks in flight (default: collection_write_concurrency)
+
+        Returns:
+            One result per chunk, in chunk order
+        """
+        size = max(1, self.collection_chunk_size)
+        chunks = [item_ids[i : i + size] for i in range(0, len(item_ids), size)]
+        semaphore = asyncio.Semaphore(concurrency or self.collection_write_concurrency)
+
+        async def write(chunk: list[str]) -> CollectionWriteResult:
+            async with semaphore:
+                try:
+                    response = await self._request(
+                        method,
+                        f"/Collections/{collection_id}/Items",
+                        params={"Ids": ",".join(chunk)},
+                    )
+                except Exception as e:
+                    logger.error(f"Collection write failed ({len(chunk)} items): {e}")
+                    return CollectionWriteResult(chunk, ok=False)
+
+            if response.status_code != 204:
+                action = "add items to" if method == "POST" else "remove items from"
+                logger.error(f"Failed to {action} collection: {response.status_code}")
+            return CollectionWriteResult(
+                chunk, ok=response.status_code == 204, status_code=response.status_code
+            )
+
+        return list(await asyncio.gather(*(write(chunk) for chunk in chunks)))
 
     async def delete_collection(self, collection_id: str) -> bool:
         """
@@ -469,17 +733,18 @@ class JellyfinClient(BaseClient):
             }
             content_type = content_type_map.get(suffix, "image/jpeg")
 
-        # Read and base64 encode image data
+        size = image_path.stat().st_size
+        if not size:
+            raise ValueError(f"Poster image is empty: {image_path}")
+
         # Jellyfin API requires base64-encoded image in the body, not raw binary
         # See: https://github.com/jellyfin/jellyfin/issues/12447
-        image_data = image_path.read_bytes()
-        b64_image = base64.b64encode(image_data).decode("utf-8")
-
-        # Upload to Jellyfin - body is base64 string with image Content-Type
+        # The body is encoded while streaming, without loading the file in memory
         response = await self.post_binary(
             f"/Items/{collection_id}/Images/Primary",
-            content=b64_image.encode("utf-8"),
+            content=lambda: _stream_base64(image_path),
             content_type=content_type,
+            content_length=4 * ((size + 2) // 3),
         )
 
         if response.status_code == 204:
@@ -510,6 +775,27 @@ class JellyfinClient(BaseClient):
     # Helpers
     # =========================================================================
 
+    def _parse_library_item(
+        self,
+        item: dict[str, Any],
+        library_id: str,
+        library_name: str = "",
+    ) -> LibraryItem:
+        """Parse a library item from an /Items result."""
+        provider_ids = item.get("ProviderIds", {})
+        return LibraryItem(
+            jellyfin_id=item["Id"],
+            title=item["Name"],
+            year=item.get("ProductionYear"),
+            media_type=self._map_item_type(item.get("Type", "")),
+            tmdb_id=int(provider_ids["Tmdb"]) if provider_ids.get("Tmdb") else None,
+            imdb_id=provider_ids.get("Imdb"),
+            tvdb_id=int(provider_ids["Tvdb"]) if provider_ids.get("Tvdb") else None,
+            library_id=library_id,
+            library_name=library_name,
+            path=item.get("Path"),
+        )
+
     def _map_item_type(self, jellyfin_type: str) -> MediaType:
         """Map Jellyfin item type to MediaType."""
         mapping = {
@@ -1,15 +1,19 @@
 """Radarr API client for movie management."""
 
+import asyncio
 from typing import Any, Optional
 
 from loguru import logger
 
+from jfc.clients.arr import fetch_paged_records
 from jfc.clients.base import BaseClient
 
 
 class RadarrClient(BaseClient):
     """Client for Radarr API v3."""
 
+    rate_limit_bucket = "radarr"
+
     def __init__(
         self,
         url: str,
@@ -38,13 +42,16 @@ class RadarrClient(BaseClient):
         self.quality_profile = quality_profile
         self.default_tag = default_tag
 
-        # Cached IDs
-        self._quality_profile_id: Optional[int] = None
-        self._root_folder_id: Optional[int] = None
-        self._tag_id: Optional[int] = None
+        # Per-run metadata cache (see reset_cache)
+        self._quality_profiles: Optional[dict[str, int]] = None  # lowercase name -> ID
+        self._root_folders: Optional[list[str]] = None
+        self._tags: Optional[dict[str, int]] = None  # lowercase label -> ID
+        self._movies: Optional[dict[int, dict[str, Any]]] = None  # TMDb ID -> movie
+        self._tag_lock = asyncio.Lock()
 
         # Cached blocklist (TMDb IDs)
         self._blocklist_tmdb_ids: Optional[set[int]] = None
+        self._blocklist_lock = asyncio.Lock()
 
         # Cached exclusion list (TMDb IDs)
         self._exclusion_tmdb_ids: Optional[set[int]] = None
@@ -61,16 +68,11 @@ class RadarrClient(BaseClient):
 
     async def get_quality_profile_id(self, name: str) -> Optional[int]:
         """Get quality profile ID by name."""
-        if self._quality_profile_id:
-            return self._quality_profile_id
-
-        profiles = await self.get_quality_profiles()
-        for profile in profiles:
-            if profile["name"].lower() == name.lower():
-                self._quality_profile_id = profile["id"]
-                return profile["id"]
+        if self._quality_profiles is None:
+            profiles = await self.get_quality_profiles()
+            self._quality_profiles = {p["name"].lower(): p["id"] for p in profiles}
 
-        return None
+        return self._quality_profiles.get(name.lower())
 
     async def get_root_folders(self) -> list[dict[str, Any]]:
         """Get configured root folders."""
@@ -80,14 +82,16 @@ class RadarrClient(BaseClient):
 
     async def get_root_folder_path(self, path: str) -> Optional[str]:
         """Get root folder that matches the path."""
-        folders = await self.get_root_folders()
-        for folder in folders:
-            if folder["path"] == path or path.startswith(folder["path"]):
-                return folder["path"]
+        if self._root_folders is None:
+            self._root_folders = [f["path"] for f in await self.get_root_folders()]
+
+        for folder in self._root_folders:
+            if folder == path or path.startswith(folder):
+                return folder
 
         # Return first folder if path not found
-        if folders:
-            return folders[0]["path"]
+        if self._root_folders:
+            return self._root_folders[0]
 
         return None
 
@@ -97,26 +101,61 @@ class RadarrClient(BaseClient):
         response.raise_for_status()
         return response.json()
 
+    async def _load_tags(self) -> dict[str, int]:
+        """Load tag IDs by lowercase label into cache."""
+        if self._tags is None:
+            self._tags = {t["label"].lower(): t["id"] for t in await self.get_tags()}
+        return self._tags
+
     async def get_or_create_tag(self, name: str) -> int:
         """Get tag ID by name, creating if necessary."""
-        if self._tag_id:
-            return self._tag_id
-
-        tags = await self.get_tags()
-        for tag in tags:
-            if tag["label"].lower() == name.lower():
-                self._tag_id = tag["id"]
-                return tag["id"]
-
-        # Create tag
-        response = await self.post("/api/v3/tag", json={"label": name})
-        response.raise_for_status()
-        tag_id = response.json()["id"]
-        self._tag_id = tag_id
+        tags = await self._load_tags()
+        tag_id = tags.get(name.lower())
+        if tag_id is not None:
+            return tag_id
+
+        # Concurrent adds must not create the same tag twice
+        async with self._tag_lock:
+            # Local reference: reset_cache() may clear the cache meanwhile
+            tags = await self._load_tags()
+            tag_id = tags.get(name.lower())
+            if tag_id is not None:
+                return tag_id
+
+            response = await self.post("/api/v3/tag", json={"label": name})
+            response.raise_for_status()
+            tag_id = response.json()["id"]
+            tags[name.lower()] = tag_id
 
         logger.info(f"Created Radarr tag '{name}' with ID {tag_id}")
         return tag_id
 
+    async def warm_up(self) -> None:
+        """
+        Load everything add checks need, concurrently.
+
+        Profiles, root folders, tags, existing movies, exclusions and
+        blocklist are cached until reset_cache(), so existence and exclusion
+        checks become set lookups.
+        """
+        await asyncio.gather(
+            self.get_quality_profile_id(self.quality_profile),
+            self.get_root_folder_path(self.root_folder),
+            self._load_tags(),
+            self.load_movies(),
+            self.load_exclusions(),
+            self.load_blocklist(),
+        )
+
+    def reset_cache(self) -> None:
+        """Forget cached metadata, blocklist and exclusions (e.g. at the start of a run)."""
+        self._quality_profiles = None
+        self._root_folders = None
+        self._tags = None
+        self._movies = None
+        self._blocklist_tmdb_ids = None
+        self._exclusion_tmdb_ids = None
+
     # =========================================================================
     # Blocklist
     # =========================================================================
@@ -131,13 +170,7 @@ class RadarrClient(BaseClient):
         Returns:
             List of blocklist entries
         """
-        response = await self.get(
-            "/api/v3/blocklist",
-            params={"page": 1, "pageSize": page_size},
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("records", [])
+        return await fetch_paged_records(self, "/api/v3/blocklist", page_size=page_size)
 
     async def load_blocklist(self) -> set[int]:
         """
@@ -149,26 +182,23 @@ class RadarrClient(BaseClient):
         if self._blocklist_tmdb_ids is not None:
             return self._blocklist_tmdb_ids
 
-        blocklist = await self.get_blocklist()
-        self._blocklist_tmdb_ids = set()
-
-        for entry in blocklist:
-            # Get movie details to find TMDb ID
-            movie_id = entry.get("movieId")
-            if movie_id:
-                # Fetch movie to get TMDb ID
-                try:
-                    response = await self.get(f"/api/v3/movie/{movie_id}")
-                    if response.status_code == 200:
-                        movie = response.json()
-                        tmdb_id = movie.get("tmdbId")
-                        if tmdb_id:
-                            self._blocklist_tmdb_ids.add(tmdb_id)
-                except Exception:
-                    pass
-
-        logger.debug(f"Loaded {len(self._blocklist_tmdb_ids)} blocked movies from Radarr")
-        return self._blocklist_tmdb_ids
+        async with self._blocklist_lock:
+            if self._blocklist_tmdb_ids is not None:
+                return self._blocklist_tmdb_ids
+
+            blocklist = await self.get_blocklist()
+            blocked_ids = {entry["movieId"] for entry in blocklist if entry.get("movieId")}
+
+            # Resolve Radarr IDs with one listing instead of one request per entry
+            tmdb_ids: set[int] = set()
+            if blocked_ids:
+                for tmdb_id, movie in (await self.load_movies()).items():
+                    if movie.get("id") in blocked_ids:
+                        tmdb_ids.add(tmdb_id)
+            self._blocklist_tmdb_ids = tmdb_ids
+
+            logger.debug(f"Loaded {len(self._blocklist_tmdb_ids)} blocked movies from Radarr")
+            return self._blocklist_tmdb_ids
 
     async def is_blocklisted(self, tmdb_id: int) -> bool:
         """
@@ -253,10 +283,23 @@ class RadarrClient(BaseClient):
 
         return None
 
+    async def load_movies(self) -> dict[int, dict[str, Any]]:
+        """
+        Load all Radarr movies into cache.
+
+        Returns:
+            Movies by TMDb ID
+        """
+        if self._movies is None:
+            movies = await self.get_movies()
+            self._movies = {m["tmdbId"]: m for m in movies if m.get("tmdbId")}
+            logger.debug(f"Loaded {len(self._movies)} movies from Radarr")
+
+        return self._movies
+
     async def movie_exists(self, tmdb_id: int) -> bool:
         """Check if movie exists in Radarr."""
-        movie = await self.get_movie_by_tmdb_id(tmdb_id)
-        return movie is not None
+        return tmdb_id in await self.load_movies()
 
     async def lookup_movie(self, tmdb_id: int) -> Optional[dict[str, Any]]:
         """Lookup movie details from TMDb."""
@@ -268,7 +311,7 @@ class RadarrClient(BaseClient):
         response.raise_for_status()
         return response.json()
 
-    async def add_movie(
+    async def prepare_movie(
         self,
         tmdb_id: int,
         root_folder: Optional[str] = None,
@@ -279,7 +322,7 @@ class RadarrClient(BaseClient):
         minimum_availability: str = "announced",
     ) -> Optional[dict[str, Any]]:
         """
-        Add movie to Radarr.
+        Build the request body to add a movie.
 
         Args:
             tmdb_id: TMDb ID
@@ -291,7 +334,7 @@ class RadarrClient(BaseClient):
             minimum_availability: When to consider available
 
         Returns:
-            Added movie data or None if failed
+            Movie data ready to submit, or None if the movie must not be added
         """
         # Check if excluded (user explicitly doesn't want this movie)
         if await self.is_excluded(tmdb_id):
@@ -306,7 +349,7 @@ class RadarrClient(BaseClient):
         # Check if already exists
         if await self.movie_exists(tmdb_id):
             logger.debug(f"Movie {tmdb_id} already exists in Radarr")
-            return await self.get_movie_by_tmdb_id(tmdb_id)
+            return None
 
         # Lookup movie
         movie_data = await self.lookup_movie(tmdb_id)
@@ -346,15 +389,102 @@ class RadarrClient(BaseClient):
                 },
             }
         )
+        return movie_data
 
+    async def add_movie(
+        self,
+        tmdb_id: int,
+        root_folder: Optional[str] = None,
+        quality_profile: Optional[str] = None,
+        tags: Optional[list[str]] = None,
+        monitored: bool = True,
+        search_for_movie: bool = True,
+        minimum_availability: str = "announced",
+    ) -> Optional[dict[str, Any]]:
+        """
+        Add movie to Radarr.
+
+        Args:
+            tmdb_id: TMDb ID
+            root_folder: Root folder path (uses default if None)
+            quality_profile: Quality profile name (uses default if None)
+            tags: Tag names to apply
+            monitored: Whether to monitor the movie
+            search_for_movie: Search for movie after adding
+            minimum_availability: When to consider available
+
+        Returns:
+            Added (or already existing) movie data, or None if not added
+        """
+        movie_data = await self.prepare_movie(
+            tmdb_id,
+            root_folder=root_folder,
+            quality_profile=quality_profile,
+            tags=tags,
+            monitored=monitored,
+            search_for_movie=search_for_movie,
+            minimum_availability=minimum_availability,
+        )
+        if not movie_data:
+            return (await self.load_movies()).get(tmdb_id)
+
+        return await self._post_movie(movie_data)
+
+    async def import_movies(
+        self,
+        movies: list[dict[str, Any]],
+        chunk_size: int = 50,
+    ) -> list[dict[str, Any]]:
+        """
+        Add several movies with the bulk import endpoint.
+
+        Chunks the import endpoint rejects are retried one movie at a time.
+
+        Args:
+            movies: Movie data from prepare_movie()
+            chunk_size: Movies per request
+
+        Returns:
+            Added movies
+        """
+        added: list[dict[str, Any]] = []
+
+        for i in range(0, len(movies), chunk_size):
+            chunk = movies[i : i + chunk_size]
+            response = await self.post("/api/v3/movie/import", json=chunk)
+
+            if response.is_success:
+                results = response.json()
+                known = await self.load_movies()
+                for movie in results:
+                    known[movie["tmdbId"]] = movie
+                    logger.info(f"Added movie to Radarr: {movie['title']} ({movie['year']})")
+                added.extend(results)
+                continue
+
+            logger.warning(
+                f"Radarr bulk import failed ({response.status_code}), adding {len(chunk)} movies one by one"
+            )
+            for movie_data in chunk:
+                result = await self._post_movie(movie_data)
+                if result:
+                    added.append(result)
+
+        return added
+
+    async def _post_movie(self, movie_data: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """Submit one prepared movie."""
         response = await self.post("/api/v3/movie", json=movie_data)
 
         if response.status_code == 201:
             result = response.json()
             logger.info(f"Added movie to Radarr: {result['title']} ({result['year']})")
+            (await self.load_movies())[result["tmdbId"]] = result
             return result
         else:
-            logger.error(f"Failed to add movie {tmdb_id}: {response.status_code} {response.text}")
+            logger.error(
+                f"Failed to add movie {movie_data.get('tmdbId')}: {response.status_code} {response.text}"
+            )
             return None
 
     # =========================================================================
@@ -0,0 +1,132 @@
+"""Token-bucket rate limiting shared by API clients."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class RateLimitStats:
+    """Queue wait metrics for one bucket."""
+
+    acquired: int = 0
+    delayed: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def reset(self) -> None:
+        """Reset all counters (e.g. at the start of a run)."""
+        self.acquired = 0
+        self.delayed = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    Callers reserve a token synchronously and then sleep until their slot,
+    so waiters are served in arrival order without needing a lock. The token
+    count may go negative: it then measures the queue of pending reservations.
+    """
+
+    def __init__(self, name: str, rate: float, burst: Optional[float] = None):
+        """
+        Initialize bucket.
+
+        Args:
+            name: Bucket name (for logging and metrics)
+            rate: Tokens added per second (0 = unlimited)
+            burst: Bucket capacity (defaults to one second of tokens, at least 1)
+        """
+        self.name = name
+        self.stats = RateLimitStats()
+        self.configure(rate, burst)
+
+    def configure(self, rate: float, burst: Optional[float] = None) -> None:
+        """Change rate and capacity, refilling the bucket."""
+        self.rate = max(0.0, rate)
+        self.burst = burst if burst is not None else max(1.0, self.rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether this bucket limits anything."""
+        return self.rate > 0
+
+    def _reserve(self) -> float:
+        """Take one token and get the wait until it is available."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> float:
+        """
+        Wait for a token.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+
+        wait = self._reserve()
+        self.stats.acquired += 1
+
+        if wait > 0:
+            self.stats.delayed += 1
+            self.stats.wait_seconds += wait
+            self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, wait)
+            await asyncio.sleep(wait)
+
+        return wait
+
+
+# Default request rates per bucket (requests per second, 0 = unlimited)
+DEFAULT_RATE_LIMITS: dict[str, float] = {
+    "tmdb": 40.0,
+    "trakt": 1000 / 300,  # 1000 requests per 5 minutes
+    "radarr": 10.0,
+    "sonarr": 10.0,
+    "jellyfin": 0.0,
+}
+
+_buckets: dict[str, TokenBucket] = {}
+
+
+def get_rate_limiter(name: str) -> TokenBucket:
+    """
+    Get the shared bucket for a name, creating it with default limits.
+
+    Args:
+        name: Bucket name (one per client class)
+
+    Returns:
+        Shared TokenBucket
+    """
+    bucket = _buckets.get(name)
+    if bucket is None:
+        bucket = TokenBucket(name, DEFAULT_RATE_LIMITS.get(name, 0.0))
+        _buckets[name] = bucket
+    return bucket
+
+
+def configure_rate_limits(limits: dict[str, float]) -> None:
+    """
+    Set request rates for named buckets.
+
+    Args:
+        limits: Mapping of bucket name to requests per second (0 = unlimited)
+    """
+    for name, rate in limits.items():
+        get_rate_limiter(name).configure(rate)
+
+
+def get_rate_limiters() -> list[TokenBucket]:
+    """Get all buckets created so far."""
+    return list(_buckets.values())
@@ -0,0 +1,146 @@
+"""Retry policy with jittered exponential backoff for API clients."""
+
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+# Methods that can be replayed without side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Transient server-side statuses worth retrying
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+@dataclass
+class RetryStats:
+    """Request and retry counters for one client."""
+
+    requests: int = 0
+    retries: int = 0
+    backoff_seconds: float = 0.0
+    budget_exhausted: int = 0
+    # Requests served by another caller's identical in-flight request
+    coalesced: int = 0
+
+    def reset(self) -> None:
+        """Reset all counters (e.g. at the start of a run)."""
+        self.requests = 0
+        self.retries = 0
+        self.backoff_seconds = 0.0
+        self.budget_exhausted = 0
+        self.coalesced = 0
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before replaying a failed request.
+
+    Only idempotent methods are retried on server errors and dropped
+    connections. A 429 or a connection that never opened is retried for any
+    method, since the server has not processed the request.
+    """
+
+    # Total attempts per request, including the first one
+    max_attempts: int = 4
+    # Base delay (seconds) of the exponential backoff
+    backoff_base: float = 0.5
+    # Upper bound (seconds) for any single wait, including server hints
+    backoff_max: float = 30.0
+    # Maximum retries a single client may spend before failing fast (0 = unlimited)
+    budget: int = 100
+    retry_statuses: frozenset[int] = field(default=RETRYABLE_STATUSES)
+
+    def should_retry_status(self, method: str, status_code: int) -> bool:
+        """Check if a response status warrants another attempt."""
+        if status_code not in self.retry_statuses:
+            return False
+        if status_code == 429:
+            return True
+        return method.upper() in IDEMPOTENT_METHODS
+
+    def should_retry_error(self, method: str, error: httpx.TransportError) -> bool:
+        """Check if a transport error warrants another attempt."""
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+            return True
+        return method.upper() in IDEMPOTENT_METHODS
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Full-jitter exponential backoff delay.
+
+        Args:
+            attempt: Number of attempts already made (1 for the first retry)
+
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def delay_for(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        Get the wait before the next attempt.
+
+        Server hints (Retry-After, X-RateLimit-*) take precedence over the
+        computed backoff, capped at backoff_max.
+
+        Args:
+            attempt: Number of attempts already made
+            response: Failed response, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if response is not None:
+            hinted = server_retry_delay(response)
+            if hinted is not None:
+                return min(hinted, self.backoff_max)
+        return self.backoff(attempt)
+
+
+def server_retry_delay(response: httpx.Response) -> Optional[float]:
+    """
+    Read the wait requested by the server from response headers.
+
+    Supports Retry-After (seconds or HTTP date) and X-RateLimit-Reset when
+    X-RateLimit-Remaining is exhausted (epoch timestamp or seconds).
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Delay in seconds, or None if the server gave no hint
+    """
+    headers = response.headers
+
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, retry_at.timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is not None and reset:
+        try:
+            if int(float(remaining)) > 0:
+                return None
+            reset_value = float(reset)
+        except ValueError:
+            return None
+        # Large values are epoch timestamps, small ones are relative seconds
+        if reset_value > 1e9:
+            return max(0.0, reset_value - time.time())
+        return max(0.0, reset_value)
+
+    return None
@@ -3,9 +3,10 @@
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
-import httpx
 from loguru import logger
 
+from jfc.clients.transport import get_transport
+
 if TYPE_CHECKING:
     from jfc.core.config import SignalNotification
 
@@ -124,18 +125,18 @@ class SignalClient:
         url = f"{self.api_url}{endpoint}"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                if method == "GET":
-                    response = await client.get(url)
-                else:
-                    response = await client.post(url, json=data)
-
-                if response.status_code in (200, 201):
-                    return response.json() if response.text else {}
-                else:
-                    logger.warning(
-                        f"Signal API error: {response.status_code} - {response.text}"
-                    )
+            client = get_transport().get_client(url)
+            if method == "GET":
+                response = await client.get(url, timeout=30.0)
+            else:
+                response = await client.post(url, json=data, timeout=30.0)
+
+            if response.status_code in (200, 201):
+                return response.json() if response.text else {}
+            else:
+                logger.warning(
+                    f"Signal API error: {response.status_code} - {response.text}"
+                )
 
         except Exception as e:
             logger.error(f"Failed to send Signal request: {e}")
@@ -145,9 +146,9 @@ class SignalClient:
     async def health_check(self) -> bool:
         """Check if signal-cli-rest-api is available."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.api_url}/v1/about")
-                return response.status_code == 200
+            url = f"{self.api_url}/v1/about"
+            response = await get_transport().get_client(url).get(url, timeout=5.0)
+            return response.status_code == 200
         except Exception:
             return False
 
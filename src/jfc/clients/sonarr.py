@@ -1,15 +1,19 @@
 """Sonarr API client for TV series management."""
 
+import asyncio
 from typing import Any, Optional
 
 from loguru import logger
 
+from jfc.clients.arr import fetch_paged_records
 from jfc.clients.base import BaseClient
 
 
 class SonarrClient(BaseClient):
     """Client for Sonarr API v3."""
 
+    rate_limit_bucket = "sonarr"
+
     def __init__(
         self,
         url: str,
@@ -38,13 +42,16 @@ class SonarrClient(BaseClient):
         self.quality_profile = quality_profile
         self.default_tag = default_tag
 
-        # Cached IDs
-        self._quality_profile_id: Optional[int] = None
-        self._root_folder_id: Optional[int] = None
-        self._tag_id: Optional[int] = None
+        # Per-run metadata cache (see reset_cache)
+        self._quality_profiles: Optional[dict[str, int]] = None  # lowercase name -> ID
+        self._root_folders: Optional[list[str]] = None
+        self._tags: Optional[dict[str, int]] = None  # lowercase label -> ID
+        self._series: Optional[dict[int, dict[str, Any]]] = None  # TVDB ID -> series
+        self._tag_lock = asyncio.Lock()
 
         # Cached blocklist (TVDB IDs)
         self._blocklist_tvdb_ids: Optional[set[int]] = None
+        self._blocklist_lock = asyncio.Lock()
 
         # Cached exclusion list (TVDB IDs)
         self._exclusion_tvdb_ids: Optional[set[int]] = None
@@ -61,16 +68,11 @@ class SonarrClient(BaseClient):
 
     async def get_quality_profile_id(self, name: str) -> Optional[int]:
         """Get quality profile ID by name."""
-        if self._quality_profile_id:
-            return self._quality_profile_id
-
-        profiles = await self.get_quality_profiles()
-        for profile in profiles:
-            if profile["name"].lower() == name.lower():
-                self._quality_profile_id = profile["id"]
-                return profile["id"]
+        if self._quality_profiles is None:
+            profiles = await self.get_quality_profiles()
+            self._quality_profiles = {p["name"].lower(): p["id"] for p in profiles}
 
-        return None
+        return self._quality_profiles.get(name.lower())
 
     async def get_root_folders(self) -> list[dict[str, Any]]:
         """Get configured root folders."""
@@ -80,14 +82,16 @@ class SonarrClient(BaseClient):
 
     async def get_root_folder_path(self, path: str) -> Optional[str]:
         """Get root folder that matches the path."""
-        folders = await self.get_root_folders()
-        for folder in folders:
-            if folder["path"] == path or path.startswith(folder["path"]):
-                return folder["path"]
+        if self._root_folders is None:
+            self._root_folders = [f["path"] for f in await self.get_root_folders()]
+
+        for folder in self._root_folders:
+            if folder == path or path.startswith(folder):
+                return folder
 
         # Return first folder if path not found
-        if folders:
-            return folders[0]["path"]
+        if self._root_folders:
+            return self._root_folders[0]
 
         return None
 
@@ -97,26 +101,61 @@ class SonarrClient(BaseClient):
         response.raise_for_status()
         return response.json()
 
+    async def _load_tags(self) -> dict[str, int]:
+        """Load tag IDs by lowercase label into cache."""
+        if self._tags is None:
+            self._tags = {t["label"].lower(): t["id"] for t in await self.get_tags()}
+        return self._tags
+
     async def get_or_create_tag(self, name: str) -> int:
         """Get tag ID by name, creating if necessary."""
-        if self._tag_id:
-            return self._tag_id
-
-        tags = await self.get_tags()
-        for tag in tags:
-            if tag["label"].lower() == name.lower():
-                self._tag_id = tag["id"]
-                return tag["id"]
-
-        # Create tag
-        response = await self.post("/api/v3/tag", json={"label": name})
-        response.raise_for_status()
-        tag_id = response.json()["id"]
-        self._tag_id = tag_id
+        tags = await self._load_tags()
+        tag_id = tags.get(name.lower())
+        if tag_id is not None:
+            return tag_id
+
+        # Concurrent adds must not create the same tag twice
+        async with self._tag_lock:
+            # Local reference: reset_cache() may clear the cache meanwhile
+            tags = await self._load_tags()
+            tag_id = tags.get(name.lower())
+            if tag_id is not None:
+                return tag_id
+
+            response = await self.post("/api/v3/tag", json={"label": name})
+            response.raise_for_status()
+            tag_id = response.json()["id"]
+            tags[name.lower()] = tag_id
 
         logger.info(f"Created Sonarr tag '{name}' with ID {tag_id}")
         return tag_id
 
+    async def warm_up(self) -> None:
+        """
+        Load everything add checks need, concurrently.
+
+        Profiles, root folders, tags, existing series, exclusions and
+        blocklist are cached until reset_cache(), so existence and exclusion
+        checks become set lookups.
+        """
+        await asyncio.gather(
+            self.get_quality_profile_id(self.quality_profile),
+            self.get_root_folder_path(self.root_folder),
+            self._load_tags(),
+            self.load_series(),
+            self.load_exclusions(),
+            self.load_blocklist(),
+        )
+
+    def reset_cache(self) -> None:
+        """Forget cached metadata, blocklist and exclusions (e.g. at the start of a run)."""
+        self._quality_profiles = None
+        self._root_folders = None
+        self._tags = None
+        self._series = None
+        self._blocklist_tvdb_ids = None
+        self._exclusion_tvdb_ids = None
+
     # =========================================================================
     # Blocklist
     # =========================================================================
@@ -131,13 +170,7 @@ class SonarrClient(BaseClient):
         Returns:
             List of blocklist entries
         """
-        response = await self.get(
-            "/api/v3/blocklist",
-            params={"page": 1, "pageSize": page_size},
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("records", [])
+        return await fetch_paged_records(self, "/api/v3/blocklist", page_size=page_size)
 
     async def load_blocklist(self) -> set[int]:
         """
@@ -149,26 +182,23 @@ class SonarrClient(BaseClient):
         if self._blocklist_tvdb_ids is not None:
             return self._blocklist_tvdb_ids
 
-        blocklist = await self.get_blocklist()
-        self._blocklist_tvdb_ids = set()
-
-        for entry in blocklist:
-            # Get series details to find TVDB ID
-            series_id = entry.get("seriesId")
-            if series_id:
-                # Fetch series to get TVDB ID
-                try:
-                    response = await self.get(f"/api/v3/series/{series_id}")
-                    if response.status_code == 200:
-                        series = response.json()
-                        tvdb_id = series.get("tvdbId")
-                        if tvdb_id:
-                            self._blocklist_tvdb_ids.add(tvdb_id)
-                except Exception:
-                    pass
-
-        logger.debug(f"Loaded {len(self._blocklist_tvdb_ids)} blocked series from Sonarr")
-        return self._blocklist_tvdb_ids
+        async with self._blocklist_lock:
+            if self._blocklist_tvdb_ids is not None:
+                return self._blocklist_tvdb_ids
+
+            blocklist = await self.get_blocklist()
+            blocked_ids = {entry["seriesId"] for entry in blocklist if entry.get("seriesId")}
+
+            # Resolve Sonarr IDs with one listing instead of one request per entry
+            tvdb_ids: set[int] = set()
+            if blocked_ids:
+                for tvdb_id, series in (await self.load_series()).items():
+                    if series.get("id") in blocked_ids:
+                        tvdb_ids.add(tvdb_id)
+            self._blocklist_tvdb_ids = tvdb_ids
+
+            logger.debug(f"Loaded {len(self._blocklist_tvdb_ids)} blocked series from Sonarr")
+            return self._blocklist_tvdb_ids
 
     async def is_blocklisted(self, tvdb_id: int) -> bool:
         """
@@ -253,10 +283,23 @@ class SonarrClient(BaseClient):
 
         return None
 
+    async def load_series(self) -> dict[int, dict[str, Any]]:
+        """
+        Load all Sonarr series into cache.
+
+        Returns:
+            Series by TVDB ID
+        """
+        if self._series is None:
+            series_list = await self.get_series()
+            self._series = {s["tvdbId"]: s for s in series_list if s.get("tvdbId")}
+            logger.debug(f"Loaded {len(self._series)} series from Sonarr")
+
+        return self._series
+
     async def series_exists(self, tvdb_id: int) -> bool:
         """Check if series exists in Sonarr."""
-        series = await self.get_series_by_tvdb_id(tvdb_id)
-        return series is not None
+        return tvdb_id in await self.load_series()
 
     async def lookup_series(self, tvdb_id: int) -> Optional[dict[str, Any]]:
         """Lookup series details from TVDB."""
@@ -273,7 +316,7 @@ class SonarrClient(BaseClient):
 
         return None
 
-    async def add_series(
+    async def prepare_series(
         self,
         tvdb_id: int,
         root_folder: Optional[str] = None,
@@ -286,7 +329,7 @@ class SonarrClient(BaseClient):
         monitor: str = "all",
     ) -> Optional[dict[str, Any]]:
         """
-        Add series to Sonarr.
+        Build the request body to add a series.
 
         Args:
             tvdb_id: TVDB ID
@@ -300,7 +343,7 @@ class SonarrClient(BaseClient):
             monitor: What to monitor (all, future, missing, existing, firstSeason, latestSeason, none)
 
         Returns:
-            Added series data or None if failed
+            Series data ready to submit, or None if the series must not be added
         """
         # Check if excluded (user explicitly doesn't want this series)
         if await self.is_excluded(tvdb_id):
@@ -315,7 +358,7 @@ class SonarrClient(BaseClient):
         # Check if already exists
         if await self.series_exists(tvdb_id):
             logger.debug(f"Series {tvdb_id} already exists in Sonarr")
-            return await self.get_series_by_tvdb_id(tvdb_id)
+            return None
 
         # Lookup series
         series_data = await self.lookup_series(tvdb_id)
@@ -358,15 +401,108 @@ class SonarrClient(BaseClient):
                 },
             }
         )
+        return series_data
 
+    async def add_series(
+        self,
+        tvdb_id: int,
+        root_folder: Optional[str] = None,
+        quality_profile: Optional[str] = None,
+        tags: Optional[list[str]] = None,
+        monitored: bool = True,
+        season_folder: bool = True,
+        series_type: str = "standard",
+        search_for_missing: bool = True,
+        monitor: str = "all",
+    ) -> Optional[dict[str, Any]]:
+        """
+        Add series to Sonarr.
+
+        Args:
+            tvdb_id: TVDB ID
+            root_folder: Root folder path (uses default if None)
+            quality_profile: Quality profile name (uses default if None)
+            tags: Tag names to apply
+            monitored: Whether to monitor the series
+            season_folder: Use season folders
+            series_type: Series type (standard, daily, anime)
+            search_for_missing: Search for missing episodes after adding
+            monitor: What to monitor (all, future, missing, existing, firstSeason, latestSeason, none)
+
+        Returns:
+            Added (or already existing) series data, or None if not added
+        """
+        series_data = await self.prepare_series(
+            tvdb_id,
+            root_folder=root_folder,
+            quality_profile=quality_profile,
+            tags=tags,
+            monitored=monitored,
+            season_folder=season_folder,
+            series_type=series_type,
+            search_for_missing=search_for_missing,
+            monitor=monitor,
+        )
+        if not series_data:
+            return (await self.load_series()).get(tvdb_id)
+
+        return await self._post_series(series_data)
+
+    async def import_series(
+        self,
+        series: list[dict[str, Any]],
+        chunk_size: int = 50,
+    ) -> list[dict[str, Any]]:
+        """
+        Add several series with the bulk import endpoint.
+
+        Chunks the import endpoint rejects are retried one series at a time.
+
+        Args:
+            series: Series data from prepare_series()
+            chunk_size: Series per request
+
+        Returns:
+            Added series
+        """
+        added: list[dict[str, Any]] = []
+
+        for i in range(0, len(series), chunk_size):
+            chunk = series[i : i + chunk_size]
+            response = await self.post("/api/v3/series/import", json=chunk)
+
+            if response.is_success:
+                results = response.json()
+                known = await self.load_series()
+                for result in results:
+                    known[result["tvdbId"]] = result
+                    logger.info(f"Added series to Sonarr: {result['title']} ({result['year']})")
+                added.extend(results)
+                continue
+
+            logger.warning(
+                f"Sonarr bulk import failed ({response.status_code}), adding {len(chunk)} series one by one"
+            )
+            for series_data in chunk:
+                result = await self._post_series(series_data)
+                if result:
+                    added.append(result)
+
+        return added
+
+    async def _post_series(self, series_data: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """Submit one prepared series."""
         response = await self.post("/api/v3/series", json=series_data)
 
         if response.status_code == 201:
             result = response.json()
             logger.info(f"Added series to Sonarr: {result['title']} ({result['year']})")
+            (await self.load_series())[result["tvdbId"]] = result
             return result
         else:
-            logger.error(f"Failed to add series {tvdb_id}: {response.status_code} {response.text}")
+            logger.error(
+                f"Failed to add series {series_data.get('tvdbId')}: {response.status_code} {response.text}"
+            )
             return None
 
     # =========================================================================
@@ -4,10 +4,11 @@ import json
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
-import httpx
 from loguru import logger
 from openai import AsyncOpenAI
 
+from jfc.clients.transport import get_transport
+
 if TYPE_CHECKING:
     from jfc.core.config import TelegramNotification
 
@@ -151,20 +152,20 @@ class TelegramClient:
         url = f"{self.api_base}/{method}"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                if files:
-                    response = await client.post(url, data=data, files=files)
-                else:
-                    response = await client.post(url, json=data)
-
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get("ok"):
-                        return result.get("result")
-                    else:
-                        logger.warning(f"Telegram API error: {result.get('description')}")
+            client = get_transport().get_client(url)
+            if files:
+                response = await client.post(url, data=data, files=files, timeout=30.0)
+            else:
+                response = await client.post(url, json=data, timeout=30.0)
+
+            if response.status_code == 200:
+                result = response.json()
+                if result.get("ok"):
+                    return result.get("result")
                 else:
-                    logger.warning(f"Telegram request failed: {response.status_code} - {response.text}")
+                    logger.warning(f"Telegram API error: {result.get('description')}")
+            else:
+                logger.warning(f"Telegram request failed: {response.status_code} - {response.text}")
 
         except Exception as e:
             logger.error(f"Failed to send Telegram request: {e}")
@@ -1,18 +1,39 @@
 """TMDb (The Movie Database) API client."""
 
+import asyncio
+import math
 from datetime import date
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypeVar
 
 from loguru import logger
 
 from jfc.clients.base import BaseClient
+from jfc.clients.id_map import IdMapStore
 from jfc.models.media import MediaItem, MediaType, Movie, Series
 
+T = TypeVar("T", bound=MediaItem)
+
 
 class TMDbClient(BaseClient):
     """Client for TMDb API v3."""
 
     BASE_URL = "https://api.themoviedb.org/3"
+    rate_limit_bucket = "tmdb"
+
+    # List endpoints served from the response cache (seconds)
+    cache_ttls = {
+        "/trending/": 3 * 3600,
+        "/movie/popular": 12 * 3600,
+        "/tv/popular": 12 * 3600,
+        "/discover/": 12 * 3600,
+        "/tv/airing_today": 3 * 3600,
+        "/tv/on_the_air": 6 * 3600,
+    }
+
+    # TMDb serves at most 500 pages of a discover query
+    MAX_PAGES = 500
+    # Concurrent page requests per paginated query
+    PAGE_CONCURRENCY = 5
 
     def __init__(self, api_key: str, language: str = "fr", region: str = "FR"):
         """
@@ -27,6 +48,8 @@ class TMDbClient(BaseClient):
         self.api_key = api_key
         self.language = language
         self.region = region
+        # Persistent TMDb/TVDB/IMDb ID map, filled from details responses
+        self.id_map: Optional[IdMapStore] = None
 
     def _params(self, **kwargs) -> dict[str, Any]:
         """Build request params with API key and language."""
@@ -54,6 +77,55 @@ class TMDbClient(BaseClient):
             year_str = f" ({item.year})" if item.year else ""
             logger.debug(f"  - [tmdb:{item.tmdb_id}] {item.title}{year_str}")
 
+    async def _fetch_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        limit: int,
+        parse: Callable[[dict[str, Any]], T],
+    ) -> list[T]:
+        """
+        Fetch enough pages of a paginated endpoint to reach limit.
+
+        Page 1 is fetched first to learn total_pages, then the remaining
+        pages are fetched concurrently. Results keep page order.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters (without page)
+            limit: Maximum results
+            parse: Parser for a single result
+
+        Returns:
+            Parsed results, at most limit
+        """
+
+        async def fetch_page(page: int) -> dict[str, Any]:
+            response = await self.get(endpoint, params={**params, "page": page})
+            response.raise_for_status()
+            return response.json()
+
+        first = await fetch_page(1)
+        results: list[dict[str, Any]] = first.get("results", [])
+        total_pages = min(first.get("total_pages", 1), self.MAX_PAGES)
+        per_page = len(results) or 20  # TMDb returns 20 results per page
+        pages_needed = min(total_pages, math.ceil(limit / per_page))
+
+        if results and pages_needed > 1:
+            semaphore = asyncio.Semaphore(self.PAGE_CONCURRENCY)
+
+            async def fetch_results(page: int) -> list[dict[str, Any]]:
+                async with semaphore:
+                    return (await fetch_page(page)).get("results", [])
+
+            pages = await asyncio.gather(
+                *(fetch_results(page) for page in range(2, pages_needed + 1))
+            )
+            for page_results in pages:
+                results.extend(page_results)
+
+        return [parse(item) for item in results[:limit]]
+
     # =========================================================================
     # Trending
     # =========================================================================
@@ -223,27 +295,9 @@ class TMDbClient(BaseClient):
             params["region"] = region
 
         # Fetch with pagination if limit > 20
-        all_results: list[Movie] = []
-        page = 1
-
-        while len(all_results) < limit:
-            params["page"] = page
-            response = await self.get("/discover/movie", params=params)
-            response.raise_for_status()
-
-            data = response.json()
-            results = data.get("results", [])
-            total_pages = data.get("total_pages", 1)
-
-            for item in results:
-                if len(all_results) >= limit:
-                    break
-                all_results.append(self._parse_movie(item))
-
-            # Stop if no more pages or we've fetched enough
-            if page >= total_pages or not results:
-                break
-            page += 1
+        all_results = await self._fetch_pages(
+            "/discover/movie", params, limit, self._parse_movie
+        )
 
         self._log_items("Discover Movies", all_results, params)
         return all_results
@@ -315,28 +369,9 @@ class TMDbClient(BaseClient):
             params["with_origin_country"] = with_origin_country
 
         # Fetch with pagination if limit > 20
-        all_results: list[Series] = []
-        page = 1
-        per_page = 20  # TMDb returns 20 results per page
-
-        while len(all_results) < limit:
-            params["page"] = page
-            response = await self.get("/discover/tv", params=params)
-            response.raise_for_status()
-
-            data = response.json()
-            results = data.get("results", [])
-            total_pages = data.get("total_pages", 1)
-
-            for item in results:
-                if len(all_results) >= limit:
-                    break
-                all_results.append(self._parse_series(item))
-
-            # Stop if no more pages or we've fetched enough
-            if page >= total_pages or not results:
-                break
-            page += 1
+        all_results = await self._fetch_pages(
+            "/discover/tv", params, limit, self._parse_series
+        )
 
         self._log_items("Discover Series", all_results, params)
         return all_results
@@ -380,7 +415,9 @@ class TMDbClient(BaseClient):
             return None
 
         response.raise_for_status()
-        return self._parse_movie_details(response.json())
+        movie = self._parse_movie_details(response.json())
+        self._record_ids("movie", movie.tmdb_id, imdb_id=movie.imdb_id)
+        return movie
 
     async def get_series_details(self, tmdb_id: int) -> Optional[Series]:
         """Get TV series details by TMDb ID."""
@@ -393,7 +430,53 @@ class TMDbClient(BaseClient):
             return None
 
         response.raise_for_status()
-        return self._parse_series_details(response.json())
+        series = self._parse_series_details(response.json())
+        self._record_ids("series", series.tmdb_id, series.tvdb_id, series.imdb_id)
+        return series
+
+    async def get_series_external_ids(self, tmdb_id: int) -> Optional[dict[str, Any]]:
+        """Get the external IDs (TVDB, IMDb, ...) of a TV series."""
+        response = await self.get(f"/tv/{tmdb_id}/external_ids", params=self._params())
+
+        if response.status_code == 404:
+            return None
+
+        response.raise_for_status()
+        data = response.json()
+        self._record_ids("series", tmdb_id, data.get("tvdb_id"), data.get("imdb_id"))
+        return data
+
+    async def get_tvdb_id(self, tmdb_id: int) -> Optional[int]:
+        """
+        Get the TVDB ID of a TV series.
+
+        Served from the ID map when known, otherwise from the
+        external_ids endpoint (lighter than a details fetch).
+
+        Args:
+            tmdb_id: TMDb series ID
+
+        Returns:
+            TVDB ID, or None if TMDb has none
+        """
+        if self.id_map:
+            known = self.id_map.get("series", tmdb_id)
+            if known and known.tvdb_id:
+                return known.tvdb_id
+
+        data = await self.get_series_external_ids(tmdb_id)
+        return (data or {}).get("tvdb_id") or None
+
+    def _record_ids(
+        self,
+        media_type: str,
+        tmdb_id: Optional[int],
+        tvdb_id: Optional[int] = None,
+        imdb_id: Optional[str] = None,
+    ) -> None:
+        """Save external IDs seen in a response to the ID map."""
+        if self.id_map and tmdb_id:
+            self.id_map.record(media_type, tmdb_id, tvdb_id=tvdb_id, imdb_id=imdb_id)
 
     # =========================================================================
     # Search
@@ -12,6 +12,18 @@ class TraktClient(BaseClient):
     """Client for Trakt API v2."""
 
     BASE_URL = "https://api.trakt.tv"
+    rate_limit_bucket = "trakt"
+
+    # List endpoints served from the response cache (seconds)
+    cache_ttls = {
+        "/movies/trending": 3600,
+        "/shows/trending": 3600,
+        "/movies/popular": 12 * 3600,
+        "/shows/popular": 12 * 3600,
+        "/movies/watched/": 6 * 3600,
+        "/shows/watched/": 6 * 3600,
+        "/users/": 3600,
+    }
 
     def __init__(
         self,
@@ -0,0 +1,148 @@
+"""Process-wide pooled HTTP transport shared by all API clients."""
+
+import asyncio
+import importlib.util
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+# HTTP/2 is opt-in and needs the h2 package (the http2 extra)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class TransportManager:
+    """
+    Manage one pooled httpx.AsyncClient per upstream host.
+
+    Every client (Jellyfin, TMDb, Trakt, Radarr, Sonarr, notifiers) draws its
+    connections from here, so keep-alive connections and TLS sessions are reused
+    across requests and across clients talking to the same host. Connection
+    limits apply per host because each origin gets its own pool.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+    ):
+        """
+        Initialize transport manager.
+
+        Args:
+            max_connections: Maximum concurrent connections per host
+            max_keepalive_connections: Maximum idle keep-alive connections per host
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Negotiate HTTP/2 when the server supports it (needs h2)
+        """
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def configure(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ) -> None:
+        """
+        Update pool settings.
+
+        Applies to pools created afterwards; existing pools keep their limits
+        until they are closed.
+        """
+        if max_connections is not None:
+            self.max_connections = max_connections
+        if max_keepalive_connections is not None:
+            self.max_keepalive_connections = max_keepalive_connections
+        if keepalive_expiry is not None:
+            self.keepalive_expiry = keepalive_expiry
+        if http2 is not None:
+            self.http2 = http2
+        if self.http2 and not HTTP2_AVAILABLE:
+            logger.warning(
+                "[HTTP] HTTP/2 requested but h2 is not installed (http2 extra), using HTTP/1.1"
+            )
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        """Get the scheme://host:port origin used as pool key."""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """
+        Get the pooled client for the host of a URL.
+
+        Args:
+            url: Any URL on the target host
+
+        Returns:
+            Shared AsyncClient for that host
+        """
+        # Pools are bound to the event loop that opened their connections
+        # (the CLI calls asyncio.run() more than once per process)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._clients:
+                logger.debug("[HTTP] Event loop changed, dropping pooled connections")
+            self._clients = {}
+            self._loop = loop
+
+        origin = self._origin(url)
+        client = self._clients.get(origin)
+
+        if client is None or client.is_closed:
+            use_http2 = self.http2 and HTTP2_AVAILABLE and origin.startswith("https://")
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                http2=use_http2,
+            )
+            self._clients[origin] = client
+            logger.debug(
+                f"[HTTP] Opened connection pool for {origin} "
+                f"(max={self.max_connections}, http2={use_http2})"
+            )
+
+        return client
+
+    async def aclose(self) -> None:
+        """Close all pooled clients."""
+        clients = list(self._clients.values())
+        self._clients = {}
+
+        try:
+            same_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            same_loop = False
+
+        if not same_loop:
+            # Connections belong to a finished loop, nothing left to await
+            return
+
+        for client in clients:
+            if not client.is_closed:
+                await client.aclose()
+
+        if clients:
+            logger.debug(f"[HTTP] Closed {len(clients)} connection pool(s)")
+
+
+_transport = TransportManager()
+
+
+def get_transport() -> TransportManager:
+    """Get the process-wide transport manager."""
+    return _transport
@@ -94,6 +94,30 @@ class JellyfinSettings(BaseModel):
 
     url: str = Field(default="http://localhost:8096")
     api_key: str = Field(default="")
+    library_snapshot: bool = Field(
+        default=True,
+        description="Persist indexed libraries and only fetch changed items on start"
+    )
+    collection_state: bool = Field(
+        default=True,
+        description="Remember applied collection metadata/members/poster and skip unchanged writes"
+    )
+    watch_library: bool = Field(
+        default=True,
+        description="Patch the library index from Jellyfin WebSocket events (daemon mode)"
+    )
+    library_ttl: float = Field(
+        default=21600.0,
+        description="Seconds before an indexed library is refreshed with a delta load (0 = never)"
+    )
+    collection_chunk_size: int = Field(
+        default=100,
+        description="Item IDs per collection add/remove request"
+    )
+    collection_write_concurrency: int = Field(
+        default=4,
+        description="Collection removal requests in flight"
+    )
 
 
 class TMDbSettings(BaseModel):
@@ -136,6 +160,14 @@ class OpenAISettings(BaseModel):
         default=False,
         description="Only generate posters that don't exist yet (skip existing)"
     )
+    smart_regenerate: bool = Field(
+        default=True,
+        description="Scheduled poster job only regenerates posters whose inputs changed"
+    )
+    poster_max_age_days: float = Field(
+        default=90,
+        description="Days after which smart regeneration replaces a poster anyway (0=never)"
+    )
     poster_history_limit: int = Field(
         default=5,
         description="Number of old posters to keep (0=unlimited)"
@@ -148,6 +180,18 @@ class OpenAISettings(BaseModel):
         default="NETFLEX",
         description="Logo text displayed at bottom of generated posters"
     )
+    batch_signatures: bool = Field(
+        default=True,
+        description="Generate missing visual signatures of a poster in one request"
+    )
+    signature_cache_max_entries: int = Field(
+        default=5000,
+        description="Visual signatures kept in the cache (0=unlimited)"
+    )
+    signature_cache_max_age_days: float = Field(
+        default=180,
+        description="Days before a cached visual signature is regenerated (0=never)"
+    )
 
 
 class RadarrSettings(BaseModel):
@@ -305,12 +349,94 @@ class SchedulerSettings(BaseModel):
     )
 
 
+class HttpSettings(BaseModel):
+    """Shared HTTP transport configuration."""
+
+    # Connection pool limits (applied per upstream host)
+    max_connections: int = Field(default=20)
+    max_keepalive_connections: int = Field(default=10)
+    # Seconds an idle keep-alive connection stays open
+    keepalive_expiry: float = Field(default=30.0)
+    # Negotiate HTTP/2 with HTTPS hosts (opt-in, requires the h2 package)
+    http2: bool = Field(default=False)
+    # Retries of transient failures (429, 5xx, dropped connections)
+    retry_max_attempts: int = Field(
+        default=4,
+        description="Total attempts per request, including the first one"
+    )
+    retry_backoff_base: float = Field(
+        default=0.5,
+        description="Base delay in seconds of the jittered exponential backoff"
+    )
+    retry_backoff_max: float = Field(
+        default=30.0,
+        description="Maximum wait in seconds between attempts"
+    )
+    retry_budget: int = Field(
+        default=100,
+        description="Maximum retries per client and run (0=unlimited)"
+    )
+    # Requests per second per upstream (0=unlimited)
+    rate_limit_tmdb: float = Field(default=40.0)
+    rate_limit_trakt: float = Field(default=1000 / 300, description="1000 requests per 5 minutes")
+    rate_limit_radarr: float = Field(default=10.0)
+    rate_limit_sonarr: float = Field(default=10.0)
+    rate_limit_jellyfin: float = Field(default=0.0)
+    # Disk cache for TMDb/Trakt list endpoints
+    cache_enabled: bool = Field(default=True)
+    cache_max_size_mb: int = Field(
+        default=100,
+        description="Maximum size of cached response bodies before LRU eviction"
+    )
+
+    @property
+    def rate_limits(self) -> dict[str, float]:
+        """Get rate limits keyed by client bucket name."""
+        return {
+            "tmdb": self.rate_limit_tmdb,
+            "trakt": self.rate_limit_trakt,
+            "radarr": self.rate_limit_radarr,
+            "sonarr": self.rate_limit_sonarr,
+            "jellyfin": self.rate_limit_jellyfin,
+        }
+
+
+class RunnerSettings(BaseModel):
+    """Collection processing configuration."""
+
+    # Collections processed at the same time across all libraries
+    max_concurrent_collections: int = Field(
+        default=4,
+        description="Maximum collections processed concurrently (per-library limits in libraries block)"
+    )
+    # Seconds before a single collection is aborted (0 = no timeout)
+    collection_timeout: float = Field(default=900.0)
+    # Share of a sorted collection that must move before it is rewritten entirely
+    reorder_rewrite_threshold: float = Field(default=0.5)
+    # Background poster generation/upload
+    poster_concurrency: int = Field(
+        default=2,
+        description="Posters generated and uploaded concurrently while collections sync"
+    )
+    poster_queue_size: int = Field(
+        default=32,
+        description="Queued posters above which collection sync waits (0 = unbounded)"
+    )
+    poster_attempts: int = Field(default=2, description="Attempts per poster before giving up")
+
+
 class Settings(BaseSettings):
     """Main application settings."""
 
     # Jellyfin
     jellyfin_url: str = Field(default="http://localhost:8096")
     jellyfin_api_key: str = Field(default="")
+    jellyfin_library_snapshot: bool = Field(default=True)
+    jellyfin_collection_state: bool = Field(default=True)
+    jellyfin_watch_library: bool = Field(default=True)
+    jellyfin_library_ttl: float = Field(default=21600.0)
+    jellyfin_collection_chunk_size: int = Field(default=100)
+    jellyfin_collection_write_concurrency: int = Field(default=4)
 
     # TMDb
     tmdb_api_key: str = Field(default="")
@@ -332,9 +458,14 @@ class Settings(BaseSettings):
     openai_explicit_refs: bool = Field(default=False)
     openai_force_regenerate: bool = Field(default=False)
     openai_missing_only: bool = Field(default=False)
+    openai_smart_regenerate: bool = Field(default=True)
+    openai_poster_max_age_days: float = Field(default=90)
     openai_poster_history_limit: int = Field(default=5)
     openai_prompt_history_limit: int = Field(default=10)
     openai_poster_logo_text: str = Field(default="NETFLEX")
+    openai_batch_signatures: bool = Field(default=True)
+    openai_signature_cache_max_entries: int = Field(default=5000)
+    openai_signature_cache_max_age_days: float = Field(default=180)
 
     # Radarr
     radarr_url: str = Field(default="http://localhost:7878")
@@ -371,6 +502,31 @@ class Settings(BaseSettings):
     scheduler_timezone: str = Field(default="Europe/Paris")
     scheduler_ignore_collection_schedule: bool = Field(default=False)
 
+    # Runner
+    runner_max_concurrent_collections: int = Field(default=4)
+    runner_collection_timeout: float = Field(default=900.0)
+    runner_reorder_rewrite_threshold: float = Field(default=0.5)
+    runner_poster_concurrency: int = Field(default=2)
+    runner_poster_queue_size: int = Field(default=32)
+    runner_poster_attempts: int = Field(default=2)
+
+    # HTTP transport
+    http_max_connections: int = Field(default=20)
+    http_max_keepalive_connections: int = Field(default=10)
+    http_keepalive_expiry: float = Field(default=30.0)
+    http_http2: bool = Field(default=False)
+    http_retry_max_attempts: int = Field(default=4)
+    http_retry_backoff_base: float = Field(default=0.5)
+    http_retry_backoff_max: float = Field(default=30.0)
+    http_retry_budget: int = Field(default=100)
+    http_rate_limit_tmdb: float = Field(default=40.0)
+    http_rate_limit_trakt: float = Field(default=1000 / 300)
+    http_rate_limit_radarr: float = Field(default=10.0)
+    http_rate_limit_sonarr: float = Field(default=10.0)
+    http_rate_limit_jellyfin: float = Field(default=0.0)
+    http_cache_enabled: bool = Field(default=True)
+    http_cache_max_size_mb: int = Field(default=100)
+
     # Application settings
     log_level: str = Field(default="INFO")
     config_path: Path = Field(default=Path("/config"))
@@ -461,6 +617,12 @@ class Settings(BaseSettings):
         return JellyfinSettings(
             url=self.jellyfin_url,
             api_key=self.jellyfin_api_key,
+            library_snapshot=self.jellyfin_library_snapshot,
+            collection_state=self.jellyfin_collection_state,
+            watch_library=self.jellyfin_watch_library,
+            library_ttl=self.jellyfin_library_ttl,
+            collection_chunk_size=self.jellyfin_collection_chunk_size,
+            collection_write_concurrency=self.jellyfin_collection_write_concurrency,
         )
 
     @property
@@ -496,9 +658,14 @@ class Settings(BaseSettings):
             explicit_refs=self.openai_explicit_refs,
             force_regenerate=self.openai_force_regenerate,
             missing_only=self.openai_missing_only,
+            smart_regenerate=self.openai_smart_regenerate,
+            poster_max_age_days=self.openai_poster_max_age_days,
             poster_history_limit=self.openai_poster_history_limit,
             prompt_history_limit=self.openai_prompt_history_limit,
             poster_logo_text=self.openai_poster_logo_text,
+            batch_signatures=self.openai_batch_signatures,
+            signature_cache_max_entries=self.openai_signature_cache_max_entries,
+            signature_cache_max_age_days=self.openai_signature_cache_max_age_days,
         )
 
     @property
@@ -608,6 +775,39 @@ class Settings(BaseSettings):
             ignore_collection_schedule=self.scheduler_ignore_collection_schedule,
         )
 
+    @property
+    def runner(self) -> RunnerSettings:
+        """Get Runner settings."""
+        return RunnerSettings(
+            max_concurrent_collections=self.runner_max_concurrent_collections,
+            collection_timeout=self.runner_collection_timeout,
+            reorder_rewrite_threshold=self.runner_reorder_rewrite_threshold,
+            poster_concurrency=self.runner_poster_concurrency,
+            poster_queue_size=self.runner_poster_queue_size,
+            poster_attempts=self.runner_poster_attempts,
+        )
+
+    @property
+    def http(self) -> HttpSettings:
+        """Get HTTP transport settings."""
+        return HttpSettings(
+            max_connections=self.http_max_connections,
+            max_keepalive_connections=self.http_max_keepalive_connections,
+            keepalive_expiry=self.http_keepalive_expiry,
+            http2=self.http_http2,
+            retry_max_attempts=self.http_retry_max_attempts,
+            retry_backoff_base=self.http_retry_backoff_base,
+            retry_backoff_max=self.http_retry_backoff_max,
+            retry_budget=self.http_retry_budget,
+            rate_limit_tmdb=self.http_rate_limit_tmdb,
+            rate_limit_trakt=self.http_rate_limit_trakt,
+            rate_limit_radarr=self.http_rate_limit_radarr,
+            rate_limit_sonarr=self.http_rate_limit_sonarr,
+            rate_limit_jellyfin=self.http_rate_limit_jellyfin,
+            cache_enabled=self.http_cache_enabled,
+            cache_max_size_mb=self.http_cache_max_size_mb,
+        )
+
 
 def _mask_secret(value: str | None, visible_chars: int = 4) -> str:
     """Mask a secret value, showing only first N characters."""
@@ -636,6 +836,10 @@ def log_settings(settings: "Settings") -> None:
     logger.info("[Jellyfin]")
     logger.info(f"  URL:     {settings.jellyfin_url}")
     logger.info(f"  API Key: {_mask_secret(settings.jellyfin_api_key)}")
+    logger.info(f"  Snapshot: {settings.jellyfin_library_snapshot}")
+    logger.info(f"  State:    {settings.jellyfin_collection_state}")
+    logger.info(f"  Watch:    {settings.jellyfin_watch_library} (TTL: {settings.jellyfin_library_ttl:g}s)")
+    logger.info(f"  Writes:   {settings.jellyfin_collection_chunk_size} IDs/request, {settings.jellyfin_collection_write_concurrency} concurrent")
 
     # TMDb
     logger.info("[TMDb]")
@@ -655,7 +859,16 @@ def log_settings(settings: "Settings") -> None:
     logger.info(f"  Explicit Refs:  {settings.openai_explicit_refs}")
     logger.info(f"  Force Regen:    {settings.openai_force_regenerate}")
     logger.info(f"  Missing Only:   {settings.openai_missing_only}")
+    logger.info(
+        f"  Smart Regen:    {settings.openai_smart_regenerate} "
+        f"(max age {f'{settings.openai_poster_max_age_days:g} days' if settings.openai_poster_max_age_days else 'none'})"
+    )
     logger.info(f"  Logo Text:      {settings.openai_poster_logo_text}")
+    logger.info(f"  Batch Sigs:     {settings.openai_batch_signatures}")
+    logger.info(
+        f"  Sig Cache:      {settings.openai_signature_cache_max_entries or 'unlimited'} entries, "
+        f"{f'{settings.openai_signature_cache_max_age_days:g} days' if settings.openai_signature_cache_max_age_days else 'no expiry'}"
+    )
 
     # Radarr
     logger.info("[Radarr]")
@@ -694,6 +907,30 @@ def log_settings(settings: "Settings") -> None:
     logger.info(f"  Timezone:            {settings.scheduler_timezone}")
     logger.info(f"  Ignore Col Schedule: {settings.scheduler_ignore_collection_schedule}")
 
+    # Runner
+    logger.info("[Runner]")
+    logger.info(f"  Max Concurrent:  {settings.runner_max_concurrent_collections} collections")
+    logger.info(f"  Timeout:         {f'{settings.runner_collection_timeout:g}s' if settings.runner_collection_timeout else '(none)'}")
+    logger.info(f"  Rewrite Above:   {settings.runner_reorder_rewrite_threshold:.0%} moved")
+    logger.info(
+        f"  Posters:         {settings.runner_poster_concurrency} concurrent, "
+        f"queue {settings.runner_poster_queue_size or 'unbounded'}, "
+        f"{settings.runner_poster_attempts} attempts"
+    )
+
+    # HTTP
+    logger.info("[HTTP]")
+    logger.info(f"  Max Connections: {settings.http_max_connections}")
+    logger.info(f"  Keep-Alive:      {settings.http_max_keepalive_connections} ({settings.http_keepalive_expiry}s)")
+    logger.info(f"  HTTP/2:          {settings.http_http2}")
+    logger.info(f"  Retries:         {settings.http_retry_max_attempts} attempts, budget {settings.http_retry_budget or 'unlimited'}")
+    rate_limits = ", ".join(
+        f"{name}={rate:g}/s" if rate else f"{name}=unlimited"
+        for name, rate in settings.http.rate_limits.items()
+    )
+    logger.info(f"  Rate Limits:     {rate_limits}")
+    logger.info(f"  Response Cache:  {settings.http_cache_enabled} (max {settings.http_cache_max_size_mb} MB)")
+
     # Application
     logger.info("[Application]")
     logger.info(f"  Log Level: {settings.log_level}")
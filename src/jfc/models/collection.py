@@ -27,7 +27,7 @@ class CollectionOrder(str, Enum):
     """Sort order for items within a collection.
 
     Note: Jellyfin displays items in the order they were added.
-    To achieve custom ordering, items are cleared and re-added in sorted order.
+    To achieve custom ordering, out of place items are removed and re-added in sorted order.
     """
 
     CUSTOM = "custom"  # Keep source order (default)
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
 
@@ -34,6 +35,9 @@ class CollectionReport:
     radarr_titles: list[str] = field(default_factory=list)
     sonarr_titles: list[str] = field(default_factory=list)
 
+    # Poster uploaded for the collection
+    poster_path: Optional[Path] = None
+
     # Item lists
     fetched_titles: list[str] = field(default_factory=list)
     matched_titles: list[str] = field(default_factory=list)
@@ -45,6 +49,9 @@ class CollectionReport:
     success: bool = True
     error_message: Optional[str] = None
     duration_seconds: float = 0.0
+    # Jellyfin sync and background poster work, timed separately
+    sync_duration_seconds: float = 0.0
+    poster_duration_seconds: float = 0.0
 
     def calculate_match_rate(self) -> None:
         """Calculate match rate percentage."""
@@ -101,6 +108,10 @@ class RunReport:
 
     libraries: list[LibraryReport] = field(default_factory=list)
 
+    # Wall time until every collection was synced, then spent waiting for posters
+    sync_duration_seconds: float = 0.0
+    poster_duration_seconds: float = 0.0
+
     @property
     def duration_seconds(self) -> float:
         if self.end_time and self.start_time:
@@ -67,6 +67,7 @@ class KometaParser:
             "operations": library_config.get("operations", {}),
             "radarr": library_config.get("radarr"),
             "sonarr": library_config.get("sonarr"),
+            "max_concurrent_collections": library_config.get("max_concurrent_collections"),
         }
 
         # Parse collection files
@@ -421,3 +422,21 @@ class KometaParser:
             logger.info(f"Library '{library_name}': {len(collections)} collections")
 
         return result
+
+    def get_library_concurrency(self) -> dict[str, int]:
+        """
+        Get per-library collection concurrency limits.
+
+        Returns:
+            Dictionary mapping library names to their max_concurrent_collections
+            (libraries without a limit are omitted)
+        """
+        config = self.parse_config()
+        result = {}
+
+        for library_name, library_config in config.get("libraries", {}).items():
+            limit = self.parse_library_config(library_config)["max_concurrent_collections"]
+            if limit:
+                result[library_name] = int(limit)
+
+        return result
@@ -0,0 +1,289 @@
+"""Missing titles gathered across a run and sent to Radarr/Sonarr in bulk."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from loguru import logger
+
+from jfc.clients.radarr import RadarrClient
+from jfc.clients.sonarr import SonarrClient
+from jfc.clients.tmdb import TMDbClient
+from jfc.models.collection import Collection, CollectionItem
+from jfc.models.report import CollectionReport
+
+
+@dataclass
+class PendingTitle:
+    """A missing title and every collection that asked for it."""
+
+    title: str
+    is_series: bool
+    tmdb_id: Optional[int] = None
+    tvdb_id: Optional[int] = None
+    # Settings of the first collection that asked for the title
+    root_folder: Optional[str] = None
+    quality_profile: Optional[str] = None
+    # Tags of every requesting collection (client default tag if none configured)
+    tags: list[str] = field(default_factory=list)
+    reports: list[CollectionReport] = field(default_factory=list)
+
+
+class ArrSubmitter:
+    """
+    Queue of missing titles, flushed once per run.
+
+    The same title missing from several collections is submitted once.
+    Lookups run concurrently and titles are added through the bulk import
+    endpoints, in chunks.
+    """
+
+    LOOKUP_CONCURRENCY = 8
+    IMPORT_CHUNK_SIZE = 50
+
+    def __init__(
+        self,
+        tmdb: TMDbClient,
+        radarr: Optional[RadarrClient] = None,
+        sonarr: Optional[SonarrClient] = None,
+    ):
+        """
+        Initialize submitter.
+
+        Args:
+            tmdb: TMDb client (resolves missing TVDB IDs)
+            radarr: Optional Radarr client
+            sonarr: Optional Sonarr client
+        """
+        self.tmdb = tmdb
+        self.radarr = radarr
+        self.sonarr = sonarr
+        self._pending: dict[tuple[str, Any], PendingTitle] = {}
+
+    def __len__(self) -> int:
+        """Number of queued titles."""
+        return len(self._pending)
+
+    def queue_collection(self, collection: Collection, report: CollectionReport) -> int:
+        """
+        Queue the missing items of a collection.
+
+        Uses library-level settings from collection config if available,
+        otherwise falls back to client defaults.
+
+        Args:
+            collection: Synced collection
+            report: Collection report, updated when the run is flushed
+
+        Returns:
+            Number of items queued
+        """
+        config = collection.config
+        queued = 0
+
+        for item in collection.items:
+            if item.in_library:
+                continue
+
+            # Use media_type to determine Sonarr vs Radarr
+            is_series = item.media_type == "series"
+
+            if is_series and self.sonarr:
+                # Sonarr settings: item_sonarr_tag > sonarr_tag > client default
+                tag = config.item_sonarr_tag or config.sonarr_tag or self.sonarr.default_tag
+                self._queue(
+                    item, True, config.sonarr_root_folder, config.sonarr_quality_profile, tag, report
+                )
+                queued += 1
+            elif not is_series and self.radarr and item.tmdb_id:
+                # Radarr settings: item_radarr_tag > radarr_tag > client default
+                tag = config.item_radarr_tag or config.radarr_tag or self.radarr.default_tag
+                self._queue(
+                    item, False, config.radarr_root_folder, config.radarr_quality_profile, tag, report
+                )
+                queued += 1
+
+        return queued
+
+    def _queue(
+        self,
+        item: CollectionItem,
+        is_series: bool,
+        root_folder: Optional[str],
+        quality_profile: Optional[str],
+        tag: str,
+        report: CollectionReport,
+    ) -> None:
+        """Add an item to the queue, merging with an earlier request for it."""
+        if is_series:
+            key = ("series", item.tvdb_id) if item.tvdb_id else ("series-tmdb", item.tmdb_id)
+        else:
+            key = ("movie", item.tmdb_id)
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = PendingTitle(
+                title=item.title,
+                is_series=is_series,
+                tmdb_id=item.tmdb_id,
+                tvdb_id=item.tvdb_id,
+                root_folder=root_folder,
+                quality_profile=quality_profile,
+            )
+            self._pending[key] = pending
+
+        if tag not in pending.tags:
+            pending.tags.append(tag)
+        if not any(r is report for r in pending.reports):
+            pending.reports.append(report)
+
+    async def flush(self) -> tuple[int, int]:
+        """
+        Submit every queued title and update the collection reports.
+
+        Returns:
+            Tuple of (movies added, series added)
+        """
+        pending = list(self._pending.values())
+        self._pending.clear()
+        if not pending:
+            return (0, 0)
+
+        movies = [p for p in pending if not p.is_series]
+        series = [p for p in pending if p.is_series]
+        logger.info(f"Submitting {len(movies)} missing movies and {len(series)} missing series")
+
+        movies_added, series_added = await asyncio.gather(
+            self._flush_radarr(movies),
+            self._flush_sonarr(series),
+        )
+        return (movies_added, series_added)
+
+    async def _flush_radarr(self, titles: list[PendingTitle]) -> int:
+        """Prepare and import missing movies."""
+        if not titles or not self.radarr:
+            return 0
+        radarr = self.radarr
+
+        try:
+            await radarr.warm_up()
+        except Exception as e:
+            logger.warning(f"Failed to load Radarr metadata: {e}")
+
+        async def prepare(title: PendingTitle) -> Optional[dict[str, Any]]:
+            # Movies are only queued with a TMDb ID
+            assert title.tmdb_id is not None
+            return await radarr.prepare_movie(
+                tmdb_id=title.tmdb_id,
+                root_folder=title.root_folder,
+                quality_profile=title.quality_profile,
+                tags=title.tags,
+            )
+
+        prepared = await self._prepare_all(titles, prepare, "Radarr")
+        try:
+            added = await radarr.import_movies(
+                [data for _, data in prepared], chunk_size=self.IMPORT_CHUNK_SIZE
+            )
+        except Exception as e:
+            logger.warning(f"Failed to add movies to Radarr: {e}")
+            return 0
+
+        added_ids = {m.get("tmdbId") for m in added}
+        for title, _ in prepared:
+            if title.tmdb_id in added_ids:
+                for report in title.reports:
+                    report.items_sent_to_radarr += 1
+                    report.radarr_titles.append(title.title)
+
+        return len(added)
+
+    async def _flush_sonarr(self, titles: list[PendingTitle]) -> int:
+        """Resolve TVDB IDs, then prepare and import missing series."""
+        if not titles or not self.sonarr:
+            return 0
+        sonarr = self.sonarr
+
+        try:
+            await sonarr.warm_up()
+        except Exception as e:
+            logger.warning(f"Failed to load Sonarr metadata: {e}")
+
+        titles = await self._resolve_tvdb_ids(titles)
+
+        async def prepare(title: PendingTitle) -> Optional[dict[str, Any]]:
+            # Titles without a TVDB ID were dropped by _resolve_tvdb_ids
+            assert title.tvdb_id is not None
+            return await sonarr.prepare_series(
+                tvdb_id=title.tvdb_id,
+                root_folder=title.root_folder,
+                quality_profile=title.quality_profile,
+                tags=title.tags,
+            )
+
+        prepared = await self._prepare_all(titles, prepare, "Sonarr")
+        try:
+            added = await sonarr.import_series(
+                [data for _, data in prepared], chunk_size=self.IMPORT_CHUNK_SIZE
+            )
+        except Exception as e:
+            logger.warning(f"Failed to add series to Sonarr: {e}")
+            return 0
+
+        added_ids = {s.get("tvdbId") for s in added}
+        for title, _ in prepared:
+            if title.tvdb_id in added_ids:
+                for report in title.reports:
+                    report.items_sent_to_sonarr += 1
+                    report.sonarr_titles.append(title.title)
+
+        return len(added)
+
+    async def _resolve_tvdb_ids(self, titles: list[PendingTitle]) -> list[PendingTitle]:
+        """Fill missing TVDB IDs (ID map, then TMDb) and merge titles that share one."""
+        semaphore = asyncio.Semaphore(self.LOOKUP_CONCURRENCY)
+
+        async def resolve(title: PendingTitle) -> None:
+            if title.tvdb_id or not title.tmdb_id:
+                return
+            async with semaphore:
+                try:
+                    title.tvdb_id = await self.tmdb.get_tvdb_id(title.tmdb_id)
+                except Exception as e:
+                    logger.debug(f"Failed to get TVDB ID for '{title.title}': {e}")
+
+        await asyncio.gather(*(resolve(t) for t in titles))
+
+        by_tvdb: dict[int, PendingTitle] = {}
+        for title in titles:
+            if not title.tvdb_id:
+                logger.warning(f"Cannot add '{title.title}' to Sonarr: no TVDB ID found")
+                continue
+            existing = by_tvdb.setdefault(title.tvdb_id, title)
+            if existing is not title:
+                existing.tags.extend(t for t in title.tags if t not in existing.tags)
+                existing.reports.extend(
+                    r for r in title.reports if not any(e is r for e in existing.reports)
+                )
+
+        return list(by_tvdb.values())
+
+    async def _prepare_all(
+        self,
+        titles: list[PendingTitle],
+        prepare: Callable[[PendingTitle], Awaitable[Optional[dict[str, Any]]]],
+        service: str,
+    ) -> list[tuple[PendingTitle, dict[str, Any]]]:
+        """Run lookups concurrently, keeping titles that can be added."""
+        semaphore = asyncio.Semaphore(self.LOOKUP_CONCURRENCY)
+
+        async def run(title: PendingTitle) -> Optional[dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await prepare(title)
+                except Exception as e:
+                    logger.warning(f"Failed to add '{title.title}' to {service}: {e}")
+                    return None
+
+        results = await asyncio.gather(*(run(t) for t in titles))
+        return [(title, data) for title, data in zip(titles, results, strict=True) if data]
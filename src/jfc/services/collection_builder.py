@@ -23,8 +23,14 @@ from jfc.models.collection import (
 )
 from jfc.models.media import MediaItem, MediaType, Movie, Series
 from jfc.models.report import CollectionReport
+from jfc.services.arr_submitter import ArrSubmitter
+from jfc.services.collection_order import ReorderPlan, plan_reorder
+from jfc.services.collection_registry import CollectionRegistry, RegisteredCollection
+from jfc.services.collection_state import CollectionStateStore, file_fingerprint, fingerprint
+from jfc.services.library_snapshot import LibrarySnapshotStore
 from jfc.services.media_matcher import MediaMatcher
 from jfc.services.poster_generator import PosterGenerator
+from jfc.services.poster_queue import PosterJob, PosterQueue
 
 
 class CollectionBuilder:
@@ -39,6 +45,13 @@ class CollectionBuilder:
         sonarr: Optional[SonarrClient] = None,
         poster_generator: Optional[PosterGenerator] = None,
         dry_run: bool = False,
+        library_snapshot: Optional[LibrarySnapshotStore] = None,
+        library_ttl: float = 0,
+        reorder_rewrite_threshold: float = 0.5,
+        collection_state: Optional[CollectionStateStore] = None,
+        poster_concurrency: int = 2,
+        poster_queue_size: int = 32,
+        poster_attempts: int = 2,
     ):
         """
         Initialize collection builder.
@@ -51,6 +64,14 @@ class CollectionBuilder:
             sonarr: Optional Sonarr client for adding missing series
             poster_generator: Optional AI poster generator
             dry_run: If True, don't make any changes
+            library_snapshot: Optional on-disk library snapshot for the matcher
+            library_ttl: Seconds before the matcher refreshes a loaded library
+            reorder_rewrite_threshold: Share of items to move above which a
+                reordered collection is rewritten entirely
+            collection_state: Optional store used to skip writes that change nothing
+            poster_concurrency: Posters generated/uploaded at the same time
+            poster_queue_size: Queued posters above which sync waits (0 = unbounded)
+            poster_attempts: Attempts per poster before giving up
         """
         self.jellyfin = jellyfin
         self.tmdb = tmdb
@@ -59,8 +80,20 @@ class CollectionBuilder:
         self.sonarr = sonarr
         self.poster_generator = poster_generator
         self.dry_run = dry_run
-
-        self.matcher = MediaMatcher(jellyfin)
+        self.reorder_rewrite_threshold = reorder_rewrite_threshold
+        self.collection_state = collection_state
+
+        self.collections = CollectionRegistry(jellyfin)
+        self.arr_submitter = ArrSubmitter(tmdb, radarr=radarr, sonarr=sonarr)
+        self.posters = PosterQueue(
+            self._run_poster_job,
+            concurrency=poster_concurrency,
+            max_pending=poster_queue_size,
+            max_attempts=poster_attempts,
+        )
+        self.matcher = MediaMatcher(
+            jellyfin, snapshot_store=library_snapshot, library_ttl=library_ttl
+        )
 
     async def build_collection(
         self,
@@ -195,48 +228,44 @@ class CollectionBuilder:
         add_missing_to_arr: bool = True,
         force_poster: bool = False,
         posters_only: bool = False,
-    ) -> tuple[int, int, Optional[Path]]:
+        smart_poster: bool = False,
+    ) -> tuple[int, int]:
         """
         Sync collection to Jellyfin.
 
+        The poster is queued and handled in the background (see flush_posters);
+        report.poster_path is set once it has been uploaded.
+
         Args:
             collection: Collection to sync
             report: Collection report to update with sync info
             media_type: Type of media (for poster category)
-            add_missing_to_arr: Whether to add missing items to Radarr/Sonarr
+            add_missing_to_arr: Whether to queue missing items for Radarr/Sonarr
             force_poster: Force regeneration of AI poster
             posters_only: Only generate/upload poster, skip item sync
+            smart_poster: Regenerate AI poster only if its inputs changed
 
         Returns:
-            Tuple of (items_added, items_removed, poster_path)
+            Tuple of (items_added, items_removed)
         """
         if self.dry_run:
             logger.info(f"[DRY RUN] Would sync collection: {collection.config.name}")
-            return (0, 0, None)
-
-        # Get or create Jellyfin collection
-        jellyfin_collections = await self.jellyfin.get_collections()
-        existing = next(
-            (c for c in jellyfin_collections if c["Name"] == collection.config.name),
-            None,
-        )
+            return (0, 0)
 
-        report.collection_existed = existing is not None
+        start_time = time.perf_counter()
 
-        if existing:
-            collection.jellyfin_id = existing["Id"]
-        else:
-            collection.jellyfin_id = await self.jellyfin.create_collection(
-                collection.config.name
-            )
+        # Get or create Jellyfin collection
+        registered, existed = await self.collections.get_or_create(collection.config.name)
+        report.collection_existed = existed
+        collection.jellyfin_id = registered.id
 
         to_add: set[str] = set()
         to_remove: set[str] = set()
 
         # Skip item sync if posters_only mode
         if not posters_only:
-            # Get current items in collection
-            current_ids = set(await self.jellyfin.get_collection_items(collection.jellyfin_id))
+            # Current items in collection (loaded with the registry)
+            current_ids = set(registered.member_ids)
 
             # Sort items according to collection_order
             sorted_items = self._sort_items_for_collection(
@@ -260,59 +289,192 @@ class CollectionBuilder:
                 if item.jellyfin_id in added_jellyfin_ids:
                     report.added_titles.append(item.title)
 
-            # Determine if we need to reorder (clear and re-add all)
+            # Target order differs from the last one applied (same items, new ranking)
+            members_fingerprint = fingerprint(target_ids_list)
+            applied_fingerprint = (
+                self.collection_state.get(collection.jellyfin_id, CollectionStateStore.MEMBERS)
+                if self.collection_state
+                else None
+            )
+            order_changed = applied_fingerprint not in (None, members_fingerprint)
+
+            # Determine if we need to reorder (remove and re-append out of place items)
             # Jellyfin displays items in the order they were added
             needs_reorder = (
                 collection.config.collection_order != CollectionOrder.CUSTOM
-                and (to_add or to_remove or not existing)
+                and (to_add or to_remove or not existed or order_changed)
             )
 
+            # Display order of current members, if known (None: listing order only)
+            current_order = self._current_order(registered)
+
+            # Every membership write succeeded (all chunks)
+            synced = True
+
             if needs_reorder and target_ids_list:
-                # Clear all items and re-add in sorted order
-                if current_ids:
-                    await self.jellyfin.remove_from_collection(
-                        collection.jellyfin_id, list(current_ids)
+                if current_order is None:
+                    # Which items are in place is unknown: rewrite in sorted order
+                    plan = ReorderPlan(remove=registered.member_ids, append=target_ids_list)
+                else:
+                    plan = plan_reorder(current_order, target_ids_list)
+                    if len(plan.append) > self.reorder_rewrite_threshold * len(target_ids_list):
+                        # Most items move anyway: clear all items and re-add in sorted order
+                        plan = ReorderPlan(remove=registered.member_ids, append=target_ids_list)
+
+                if plan.remove:
+                    synced &= await self.jellyfin.remove_from_collection(
+                        collection.jellyfin_id, plan.remove
                     )
-                await self.jellyfin.add_to_collection(
-                    collection.jellyfin_id, target_ids_list
-                )
+                if plan.append:
+                    synced &= await self.jellyfin.add_to_collection(
+                        collection.jellyfin_id, plan.append
+                    )
+                if synced:
+                    self.collections.set_members(collection.jellyfin_id, target_ids_list)
+                    if self.collection_state:
+                        self.collection_state.record_order(collection.jellyfin_id, target_ids_list)
                 logger.info(
                     f"Reordered '{collection.config.name}' ({len(target_ids_list)} items, "
+                    f"{plan.kept} kept in place, -{len(plan.remove)} +{len(plan.append)}, "
                     f"order={collection.config.collection_order.value})"
                 )
             else:
                 # Simple add/remove (no reordering needed)
+                added_ids = [i for i in target_ids_list if i in to_add]
                 if to_add:
-                    await self.jellyfin.add_to_collection(collection.jellyfin_id, list(to_add))
+                    synced &= await self.jellyfin.add_to_collection(
+                        collection.jellyfin_id, added_ids
+                    )
                     logger.info(f"Added {len(to_add)} items to '{collection.config.name}'")
 
                 if to_remove:
-                    await self.jellyfin.remove_from_collection(collection.jellyfin_id, list(to_remove))
+                    synced &= await self.jellyfin.remove_from_collection(
+                        collection.jellyfin_id, list(to_remove)
+                    )
                     logger.info(f"Removed {len(to_remove)} items from '{collection.config.name}'")
 
+                if synced and (to_add or to_remove):
+                    kept_ids = [
+                        i for i in (current_order or registered.member_ids) if i not in to_remove
+                    ]
+                    self.collections.set_members(
+                        collection.jellyfin_id,
+                        kept_ids + added_ids,
+                        ordered=current_order is not None,
+                    )
+                    if self.collection_state and current_order is not None:
+                        self.collection_state.record_order(
+                            collection.jellyfin_id, kept_ids + added_ids
+                        )
+
+            if not synced:
+                # Some chunks failed: members and order are unknown until the next load
+                logger.warning(
+                    f"Membership of '{collection.config.name}' only partially written, "
+                    f"will be rewritten on the next run"
+                )
+                self.collections.set_members(
+                    collection.jellyfin_id, registered.member_ids, ordered=False
+                )
+                if self.collection_state:
+                    self.collection_state.forget(
+                        collection.jellyfin_id, CollectionStateStore.MEMBERS
+                    )
+                    self.collection_state.forget(collection.jellyfin_id, CollectionStateStore.ORDER)
+            elif self.collection_state:
+                self.collection_state.record(
+                    collection.jellyfin_id, CollectionStateStore.MEMBERS, members_fingerprint
+                )
+
             # Update report
             report.items_added_to_collection = len(to_add)
             report.items_removed_from_collection = len(to_remove)
 
             # Update metadata (including DisplayOrder for Jellyfin sorting)
             display_order = self._get_jellyfin_display_order(collection.config.collection_order)
-            await self.jellyfin.update_collection_metadata(
-                collection.jellyfin_id,
-                overview=collection.config.summary,
-                sort_name=collection.config.sort_title,
-                display_order=display_order,
+            metadata_fingerprint = fingerprint(
+                collection.config.summary, collection.config.sort_title, display_order
             )
+            if self.collection_state and self.collection_state.matches(
+                collection.jellyfin_id, CollectionStateStore.METADATA, metadata_fingerprint
+            ):
+                logger.debug(f"Metadata unchanged for '{collection.config.name}'")
+            else:
+                updated = await self.jellyfin.update_collection_metadata(
+                    collection.jellyfin_id,
+                    overview=collection.config.summary,
+                    sort_name=collection.config.sort_title,
+                    display_order=display_order,
+                )
+                if updated and self.collection_state:
+                    self.collection_state.record(
+                        collection.jellyfin_id, CollectionStateStore.METADATA, metadata_fingerprint
+                    )
 
-        # Upload poster (manual or AI-generated)
-        _, poster_path = await self._upload_poster(collection, media_type, force_regenerate=force_poster)
-
-        # Add missing items to Radarr/Sonarr
+        # Queue missing items for Radarr/Sonarr (submitted for the whole run by flush_arr)
         if add_missing_to_arr and not posters_only:
-            radarr_count, sonarr_count = await self._add_missing_to_arr(collection, report)
-            report.items_sent_to_radarr = radarr_count
-            report.items_sent_to_sonarr = sonarr_count
+            self.arr_submitter.queue_collection(collection, report)
+
+        report.sync_duration_seconds = time.perf_counter() - start_time
+
+        # Queue poster (manual or AI-generated), new collections first
+        if force_poster or smart_poster:
+            priority = PosterQueue.PRIORITY_FORCED
+        elif not existed:
+            priority = PosterQueue.PRIORITY_NEW
+        else:
+            priority = PosterQueue.PRIORITY_NORMAL
+        await self.posters.submit(
+            collection,
+            report,
+            media_type=media_type,
+            force_regenerate=force_poster,
+            smart_regenerate=smart_poster,
+            priority=priority,
+        )
+
+        return (len(to_add), len(to_remove))
+
+    async def flush_arr(self) -> tuple[int, int]:
+        """
+        Submit missing items queued by sync_collection to Radarr/Sonarr.
+
+        Returns:
+            Tuple of (movies added, series added)
+        """
+        return await self.arr_submitter.flush()
 
-        return (len(to_add), len(to_remove), poster_path)
+    async def flush_posters(self) -> None:
+        """Wait for every poster queued by sync_collection to be processed."""
+        await self.posters.join()
+
+    async def _run_poster_job(self, job: PosterJob) -> bool:
+        """
+        Generate and upload the poster of a queued collection.
+
+        Returns:
+            False if a poster was expected but could not be produced or
+            uploaded (the job is retried)
+        """
+        collection = job.collection
+        success, poster_path = await self._upload_poster(
+            collection,
+            job.media_type,
+            force_regenerate=job.force_regenerate,
+            smart_regenerate=job.smart_regenerate,
+        )
+        if success:
+            job.report.poster_path = poster_path
+            return True
+
+        if poster_path:
+            # Generated but not uploaded: retry the upload, not the generation
+            job.force_regenerate = False
+            job.smart_regenerate = False
+            return False
+
+        # Nothing to upload is only a failure when AI generation should have run
+        return not (self.poster_generator and get_settings().openai.enabled)
 
     async def _fetch_items(
         self,
@@ -655,6 +817,30 @@ class CollectionBuilder:
 
         return items
 
+    def _current_order(self, registered: RegisteredCollection) -> Optional[list[str]]:
+        """
+        Get the display order of a collection's current members.
+
+        Jellyfin lists members in its own sort order, not the order they were
+        added in, so the order is only known if this run wrote it, or if the
+        order recorded after the last write still has the same members.
+
+        Args:
+            registered: Registered collection
+
+        Returns:
+            Member IDs in display order, or None if unknown
+        """
+        if registered.ordered:
+            return registered.member_ids
+
+        if self.collection_state:
+            recorded = self.collection_state.get_order(registered.id)
+            if recorded is not None and sorted(recorded) == sorted(registered.member_ids):
+                return recorded
+
+        return None
+
     def _get_jellyfin_display_order(self, order: CollectionOrder) -> str:
         """
         Map CollectionOrder to Jellyfin DisplayOrder value.
@@ -688,6 +874,7 @@ class CollectionBuilder:
         collection: Collection,
         media_type: MediaType,
         force_regenerate: bool = False,
+        smart_regenerate: bool = False,
     ) -> tuple[bool, Optional[Path]]:
         """
         Upload poster image for collection if configured.
@@ -699,6 +886,7 @@ class CollectionBuilder:
             collection: Collection with poster config
             media_type: Type of media (for AI category mapping)
             force_regenerate: Force regeneration of AI poster
+            smart_regenerate: Regenerate existing AI poster only if its inputs changed
 
         Returns:
             Tuple of (success, poster_path)
@@ -757,6 +945,7 @@ class CollectionBuilder:
                 library=collection.library_name,
                 force_regenerate=False,
                 explicit_refs=settings.openai.explicit_refs,
+                smart_regenerate=smart_regenerate,
             )
             if poster_path:
                 logger.success(f"Generated AI poster: {poster_path.name}")
@@ -764,6 +953,14 @@ class CollectionBuilder:
         if not poster_path or not poster_path.exists():
             return False, None
 
+        # Same image as last upload: nothing to push
+        poster_fingerprint = file_fingerprint(poster_path)
+        if self.collection_state and self.collection_state.matches(
+            collection.jellyfin_id, CollectionStateStore.POSTER, poster_fingerprint
+        ):
+            logger.debug(f"Poster unchanged for '{collection.config.name}'")
+            return True, poster_path
+
         try:
             success = await self.jellyfin.upload_collection_poster(
                 collection.jellyfin_id,
@@ -771,6 +968,10 @@ class CollectionBuilder:
             )
             if success:
                 logger.success(f"Uploaded poster for '{collection.config.name}'")
+                if self.collection_state:
+                    self.collection_state.record(
+                        collection.jellyfin_id, CollectionStateStore.POSTER, poster_fingerprint
+                    )
             return success, poster_path
         except FileNotFoundError:
             logger.warning(
@@ -843,78 +1044,3 @@ class CollectionBuilder:
                 )
             media_items.append(media_item)
         return media_items
-
-    async def _add_missing_to_arr(
-        self,
-        collection: Collection,
-        report: CollectionReport,
-    ) -> tuple[int, int]:
-        """Add missing items to Radarr/Sonarr.
-
-        Uses library-level settings from collection config if available,
-        otherwise falls back to client defaults.
-
-        Returns:
-            Tuple of (radarr_count, sonarr_count)
-        """
-        missing = [item for item in collection.items if not item.in_library]
-        radarr_count = 0
-        sonarr_count = 0
-
-        if not missing:
-            return (0, 0)
-
-        # Get library-level settings (item-level tag takes priority over library-level)
-        config = collection.config
-
-        for item in missing:
-            # Use media_type to determine Sonarr vs Radarr
-            is_series = item.media_type == "series"
-
-            if is_series and self.sonarr:
-                # Sonarr settings: item_sonarr_tag > sonarr_tag > client default
-                tag = config.item_sonarr_tag or config.sonarr_tag
-                tags = [tag] if tag else None
-
-                # Get tvdb_id - fetch from TMDb if not already available
-                tvdb_id = item.tvdb_id
-                if not tvdb_id and item.tmdb_id:
-                    # Fetch series details from TMDb to get tvdb_id
-                    series_details = await self.tmdb.get_series_details(item.tmdb_id)
-                    if series_details:
-                        tvdb_id = series_details.tvdb_id
-
-                if not tvdb_id:
-                    logger.warning(f"Cannot add '{item.title}' to Sonarr: no TVDB ID found")
-                    continue
-
-                try:
-                    await self.sonarr.add_series(
-                        tvdb_id=tvdb_id,
-                        root_folder=config.sonarr_root_folder,
-                        quality_profile=config.sonarr_quality_profile,
-                        tags=tags,
-                    )
-                    sonarr_count += 1
-                    report.sonarr_titles.append(item.title)
-                except Exception as e:
-                    logger.warning(f"Failed to add '{item.title}' to Sonarr: {e}")
-
-            elif not is_series and self.radarr and item.tmdb_id:
-                # Radarr settings: item_radarr_tag > radarr_tag > client default
-                tag = config.item_radarr_tag or config.radarr_tag
-                tags = [tag] if tag else None
-
-                try:
-                    await self.radarr.add_movie(
-                        tmdb_id=item.tmdb_id,
-                        root_folder=config.radarr_root_folder,
-                        quality_profile=config.radarr_quality_profile,
-                        tags=tags,
-                    )
-                    radarr_count += 1
-                    report.radarr_titles.append(item.title)
-                except Exception as e:
-                    logger.warning(f"Failed to add '{item.title}' to Radarr: {e}")
-
-        return (radarr_count, sonarr_count)
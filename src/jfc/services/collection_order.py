@@ -0,0 +1,54 @@
+"""Minimal membership edits to reorder a Jellyfin collection."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ReorderPlan:
+    """Items to remove, then append, to turn one order into another."""
+
+    remove: list[str] = field(default_factory=list)
+    append: list[str] = field(default_factory=list)
+    # Leading target items already in place
+    kept: int = 0
+
+    @property
+    def edits(self) -> int:
+        """Number of item writes the plan needs."""
+        return len(self.remove) + len(self.append)
+
+
+def plan_reorder(current: list[str], target: list[str]) -> ReorderPlan:
+    """
+    Plan the smallest edit that reaches the target order.
+
+    Jellyfin can only append to a collection, so items can't be moved or
+    inserted in place. The longest target prefix that already appears in
+    the current order (as a subsequence) is kept; everything else in the
+    collection is removed and the rest of the target is appended.
+
+    Args:
+        current: Current item IDs, in collection order
+        target: Wanted item IDs, in order
+
+    Returns:
+        Reorder plan
+    """
+    target = list(dict.fromkeys(target))
+    positions = {item_id: i for i, item_id in enumerate(current)}
+
+    kept = 0
+    last = -1
+    for item_id in target:
+        position = positions.get(item_id)
+        if position is None or position < last:
+            break
+        last = position
+        kept += 1
+
+    in_place = set(target[:kept])
+    return ReorderPlan(
+        remove=[i for i in current if i not in in_place],
+        append=target[kept:],
+        kept=kept,
+    )
@@ -0,0 +1,148 @@
+"""Run-scoped registry of Jellyfin collections."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Optional
+
+from loguru import logger
+
+from jfc.clients.jellyfin import JellyfinClient
+
+
+@dataclass
+class RegisteredCollection:
+    """A Jellyfin collection (BoxSet) with its current members."""
+
+    id: str
+    name: str
+    member_ids: list[str] = field(default_factory=list)
+    # member_ids are in display (insertion) order; Jellyfin lists members in
+    # its own sort order, so only orders written by this run are known
+    ordered: bool = False
+
+
+class CollectionRegistry:
+    """
+    All Jellyfin collections, loaded once per run.
+
+    Collections are listed with a single request and their members are
+    fetched concurrently, then kept up to date as the builder creates,
+    deletes and edits collections.
+    """
+
+    MEMBER_CONCURRENCY = 8
+
+    def __init__(self, jellyfin: JellyfinClient):
+        """
+        Initialize registry.
+
+        Args:
+            jellyfin: Jellyfin API client
+        """
+        self.jellyfin = jellyfin
+        self._by_id: dict[str, RegisteredCollection] = {}
+        self._by_name: dict[str, RegisteredCollection] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._name_locks: dict[str, asyncio.Lock] = {}
+
+    def invalidate(self) -> None:
+        """Forget loaded collections (e.g. at the start of a run)."""
+        self._by_id.clear()
+        self._by_name.clear()
+        self._loaded = False
+
+    async def load(self) -> None:
+        """Load all collections and their members, once."""
+        if self._loaded:
+            return
+
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            collections = await self.jellyfin.get_collections()
+            semaphore = asyncio.Semaphore(self.MEMBER_CONCURRENCY)
+
+            async def fetch_members(collection_id: str) -> list[str]:
+                async with semaphore:
+                    return await self.jellyfin.get_collection_items(collection_id)
+
+            members = await asyncio.gather(
+                *(fetch_members(c["Id"]) for c in collections)
+            )
+
+            self.invalidate()
+            for data, member_ids in zip(collections, members, strict=True):
+                self._register(RegisteredCollection(data["Id"], data["Name"], member_ids))
+            self._loaded = True
+
+            logger.debug(f"[Jellyfin] Loaded {len(self._by_id)} collections")
+
+    def get(self, name: str) -> Optional[RegisteredCollection]:
+        """Get a collection by name."""
+        return self._by_name.get(name)
+
+    def get_by_id(self, collection_id: str) -> Optional[RegisteredCollection]:
+        """Get a collection by Jellyfin ID."""
+        return self._by_id.get(collection_id)
+
+    async def get_or_create(self, name: str) -> tuple[RegisteredCollection, bool]:
+        """
+        Get a collection by name, creating it if needed.
+
+        Args:
+            name: Collection name
+
+        Returns:
+            Tuple of (collection, existed)
+        """
+        await self.load()
+
+        # Concurrent builds of the same collection must not create it twice
+        lock = self._name_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            existing = self._by_name.get(name)
+            if existing:
+                return existing, True
+
+            collection_id = await self.jellyfin.create_collection(name)
+            collection = RegisteredCollection(collection_id, name, ordered=True)
+            self._register(collection)
+            return collection, False
+
+    async def delete(self, collection_id: str) -> bool:
+        """
+        Delete a collection.
+
+        Args:
+            collection_id: Collection ID
+
+        Returns:
+            True if successful
+        """
+        deleted = await self.jellyfin.delete_collection(collection_id)
+        if deleted:
+            collection = self._by_id.pop(collection_id, None)
+            if collection and self._by_name.get(collection.name) is collection:
+                del self._by_name[collection.name]
+        return deleted
+
+    def set_members(self, collection_id: str, member_ids: list[str], ordered: bool = True) -> None:
+        """
+        Record the members of a collection after a write.
+
+        Args:
+            collection_id: Collection ID
+            member_ids: Member item IDs
+            ordered: member_ids are in display order
+        """
+        collection = self._by_id.get(collection_id)
+        if collection:
+            collection.member_ids = list(member_ids)
+            collection.ordered = ordered
+
+    def _register(self, collection: RegisteredCollection) -> None:
+        """Index a collection by ID and name."""
+        self._by_id[collection.id] = collection
+        self._by_name.setdefault(collection.name, collection)
@@ -0,0 +1,131 @@
+"""Fingerprints of the state last applied to each Jellyfin collection."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+
+def fingerprint(*parts: Any) -> str:
+    """
+    Hash values into a stable fingerprint.
+
+    Args:
+        parts: JSON-serializable values
+
+    Returns:
+        Hex digest
+    """
+    data = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def file_fingerprint(path: Path) -> str:
+    """
+    Hash a file's content.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class CollectionStateStore:
+    """
+    Per-collection fingerprints of applied metadata, members and poster.
+
+    A write whose fingerprint matches the stored one is a no-op and can be
+    skipped. Changes are kept in memory and written atomically by save().
+    The member order last written is kept as well (ORDER), since Jellyfin
+    does not list collection members in display order.
+    """
+
+    # Kinds of state tracked per collection
+    METADATA = "metadata"
+    MEMBERS = "members"
+    POSTER = "poster"
+    ORDER = "order"
+
+    def __init__(self, path: Path):
+        """
+        Initialize store.
+
+        Args:
+            path: JSON file
+        """
+        self.path = Path(path)
+        self._state: Optional[dict[str, dict[str, str]]] = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        """Read the state file on first use."""
+        if self._state is None:
+            self._state = {}
+            if self.path.exists():
+                try:
+                    with open(self.path, encoding="utf-8") as f:
+                        self._state = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable collection state: {e}")
+        return self._state
+
+    def get(self, collection_id: str, kind: str) -> Optional[str]:
+        """Get the last applied fingerprint, if any."""
+        return self._load().get(collection_id, {}).get(kind)
+
+    def matches(self, collection_id: str, kind: str, value: str) -> bool:
+        """Check if a fingerprint equals the last applied one."""
+        return self.get(collection_id, kind) == value
+
+    def record(self, collection_id: str, kind: str, value: str) -> None:
+        """Remember a fingerprint after a successful write."""
+        entry = self._load().setdefault(collection_id, {})
+        if entry.get(kind) != value:
+            entry[kind] = value
+            self._dirty = True
+
+    def get_order(self, collection_id: str) -> Optional[list[str]]:
+        """Get the member order last written, if any."""
+        value = self.get(collection_id, self.ORDER)
+        if value is None:
+            return None
+        return value.split(",") if value else []
+
+    def record_order(self, collection_id: str, member_ids: list[str]) -> None:
+        """Remember the member order after a successful write."""
+        self.record(collection_id, self.ORDER, ",".join(member_ids))
+
+    def forget(self, collection_id: str, kind: Optional[str] = None) -> None:
+        """Drop the fingerprints of a collection (or one kind of them)."""
+        state = self._load()
+        if kind is None:
+            self._dirty |= state.pop(collection_id, None) is not None
+        elif collection_id in state:
+            self._dirty |= state[collection_id].pop(kind, None) is not None
+
+    def save(self) -> None:
+        """Write pending changes atomically."""
+        if not self._dirty or self._state is None:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._state, f, indent=2, sort_keys=True)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to save collection state: {e}")
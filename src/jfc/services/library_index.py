@@ -0,0 +1,136 @@
+"""In-memory index of a Jellyfin library for network-free matching."""
+
+from typing import Iterable, Optional
+
+from jfc.models.media import LibraryItem, MediaItem
+
+# Leading articles ignored when comparing titles
+TITLE_ARTICLES = ["the ", "a ", "an ", "le ", "la ", "les ", "un ", "une "]
+
+
+def normalize_title(title: str) -> str:
+    """Normalize title for comparison."""
+    # Lowercase
+    title = title.lower()
+
+    # Remove common articles
+    for article in TITLE_ARTICLES:
+        if title.startswith(article):
+            title = title[len(article) :]
+
+    # Remove special characters
+    title = "".join(c for c in title if c.isalnum() or c.isspace())
+
+    # Normalize whitespace
+    title = " ".join(title.split())
+
+    return title
+
+
+class LibraryIndex:
+    """
+    Lookup tables over the items of one library.
+
+    Items are indexed by every provider ID (TMDb, IMDb, TVDB) and by
+    normalized title, so any source item resolves with dict lookups only.
+    """
+
+    def __init__(self, items: Iterable[LibraryItem] = ()):
+        """
+        Initialize index.
+
+        Args:
+            items: Initial library items
+        """
+        self.by_jellyfin_id: dict[str, LibraryItem] = {}
+        self.by_tmdb: dict[int, LibraryItem] = {}
+        self.by_imdb: dict[str, LibraryItem] = {}
+        self.by_tvdb: dict[int, LibraryItem] = {}
+        self.by_title: dict[str, list[LibraryItem]] = {}
+        self.add_all(items)
+
+    def __len__(self) -> int:
+        """Number of indexed items."""
+        return len(self.by_jellyfin_id)
+
+    def add(self, item: LibraryItem) -> None:
+        """Add or replace an item."""
+        if item.jellyfin_id in self.by_jellyfin_id:
+            self.remove(item.jellyfin_id)
+
+        self.by_jellyfin_id[item.jellyfin_id] = item
+        if item.tmdb_id:
+            self.by_tmdb[item.tmdb_id] = item
+        if item.imdb_id:
+            self.by_imdb[item.imdb_id] = item
+        if item.tvdb_id:
+            self.by_tvdb[item.tvdb_id] = item
+        self.by_title.setdefault(normalize_title(item.title), []).append(item)
+
+    def add_all(self, items: Iterable[LibraryItem]) -> None:
+        """Add several items."""
+        for item in items:
+            self.add(item)
+
+    def remove(self, jellyfin_id: str) -> Optional[LibraryItem]:
+        """
+        Remove an item by Jellyfin ID.
+
+        Returns:
+            Removed item, or None if it was not indexed
+        """
+        item = self.by_jellyfin_id.pop(jellyfin_id, None)
+        if item is None:
+            return None
+
+        if item.tmdb_id and self.by_tmdb.get(item.tmdb_id) is item:
+            del self.by_tmdb[item.tmdb_id]
+        if item.imdb_id and self.by_imdb.get(item.imdb_id) is item:
+            del self.by_imdb[item.imdb_id]
+        if item.tvdb_id and self.by_tvdb.get(item.tvdb_id) is item:
+            del self.by_tvdb[item.tvdb_id]
+
+        key = normalize_title(item.title)
+        bucket = [i for i in self.by_title.get(key, []) if i is not item]
+        if bucket:
+            self.by_title[key] = bucket
+        else:
+            self.by_title.pop(key, None)
+
+        return item
+
+    def items(self) -> list[LibraryItem]:
+        """Get all indexed items."""
+        return list(self.by_jellyfin_id.values())
+
+    def find(self, item: MediaItem) -> Optional[LibraryItem]:
+        """
+        Resolve a source item against the library.
+
+        Provider IDs are tried first (TMDb, IMDb, TVDB). Title matching is
+        only used when the source item has no ID that the library could
+        have indexed, and requires the year to be within one year.
+
+        Args:
+            item: Source media item
+
+        Returns:
+            Matching library item, or None
+        """
+        if item.tmdb_id and item.tmdb_id in self.by_tmdb:
+            return self.by_tmdb[item.tmdb_id]
+        if item.imdb_id and item.imdb_id in self.by_imdb:
+            return self.by_imdb[item.imdb_id]
+        if item.tvdb_id and item.tvdb_id in self.by_tvdb:
+            return self.by_tvdb[item.tvdb_id]
+
+        for candidate in self.by_title.get(normalize_title(item.title), []):
+            if candidate.media_type != item.media_type:
+                continue
+            # An ID on both sides that disagrees means a different title
+            if item.tmdb_id and candidate.tmdb_id:
+                continue
+            if not item.year or not candidate.year or abs(item.year - candidate.year) <= 1:
+                return candidate
+
+        return None
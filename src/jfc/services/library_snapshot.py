@@ -0,0 +1,140 @@
+"""Persistent snapshot of indexed Jellyfin libraries (SQLite)."""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+from loguru import logger
+
+from jfc.models.media import LibraryItem
+
+
+class LibrarySnapshotStore:
+    """
+    Library items saved between runs, with a per-library watermark.
+
+    The watermark is the time of the last successful load; on the next start
+    only items saved in Jellyfin after it need to be fetched.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize store.
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS libraries (
+                    library_id TEXT PRIMARY KEY,
+                    watermark TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS items (
+                    library_id TEXT NOT NULL,
+                    jellyfin_id TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (library_id, jellyfin_id)
+                );
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def load(self, library_id: str) -> Optional[tuple[list[LibraryItem], datetime]]:
+        """
+        Load a library snapshot.
+
+        Args:
+            library_id: Jellyfin library ID
+
+        Returns:
+            Tuple of (items, watermark), or None if no usable snapshot exists
+        """
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT watermark FROM libraries WHERE library_id = ?",
+                (library_id,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            items = [
+                LibraryItem.model_validate_json(data)
+                for (data,) in conn.execute(
+                    "SELECT data FROM items WHERE library_id = ?",
+                    (library_id,),
+                )
+            ]
+            return items, datetime.fromisoformat(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"[Jellyfin] Ignoring unreadable library snapshot: {e}")
+            return None
+
+    def save(
+        self,
+        library_id: str,
+        items: Iterable[LibraryItem],
+        watermark: datetime,
+        replace: bool = True,
+    ) -> None:
+        """
+        Save library items and advance the watermark.
+
+        Args:
+            library_id: Jellyfin library ID
+            items: Items to store
+            watermark: Time the items were fetched
+            replace: Drop previously stored items first (full reload) instead
+                of upserting (delta)
+        """
+        try:
+            conn = self._connect()
+            with conn:
+                if replace:
+                    conn.execute("DELETE FROM items WHERE library_id = ?", (library_id,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO items (library_id, jellyfin_id, data) VALUES (?, ?, ?)",
+                    ((library_id, item.jellyfin_id, item.model_dump_json()) for item in items),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO libraries (library_id, watermark) VALUES (?, ?)",
+                    (library_id, watermark.isoformat()),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"[Jellyfin] Failed to save library snapshot: {e}")
+
+    def remove(self, library_id: str, jellyfin_ids: Iterable[str]) -> None:
+        """
+        Delete items from a library snapshot.
+
+        Args:
+            library_id: Jellyfin library ID
+            jellyfin_ids: IDs of items no longer in the library
+        """
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "DELETE FROM items WHERE library_id = ? AND jellyfin_id = ?",
+                    ((library_id, jellyfin_id) for jellyfin_id in jellyfin_ids),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"[Jellyfin] Failed to update library snapshot: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
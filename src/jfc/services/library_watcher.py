@@ -0,0 +1,161 @@
+"""Live library updates from the Jellyfin WebSocket."""
+
+import asyncio
+import contextlib
+import json
+import random
+from typing import Any, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+from loguru import logger
+
+from jfc.services.media_matcher import MediaMatcher
+
+
+class LibraryWatcher:
+    """
+    Keep the matcher index fresh in daemon mode.
+
+    Listens to LibraryChanged messages on Jellyfin's WebSocket and patches
+    the loaded library indexes in place. Changes are debounced so a library
+    scan adding hundreds of items results in a few batched lookups.
+    """
+
+    DEVICE_ID = "jellyfin-collection"
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        matcher: MediaMatcher,
+        debounce: float = 10.0,
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            url: Jellyfin server URL
+            api_key: Jellyfin API key
+            matcher: MediaMatcher whose indexes are updated
+            debounce: Seconds to collect changes before applying them
+        """
+        self.url = url.rstrip("/")
+        self.api_key = api_key
+        self.matcher = matcher
+        self.debounce = debounce
+
+        self._task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._changed: set[str] = set()
+        self._removed: set[str] = set()
+
+    @property
+    def socket_url(self) -> str:
+        """WebSocket URL (ws:// or wss://) of the Jellyfin server."""
+        parts = urlsplit(self.url)
+        scheme = "wss" if parts.scheme == "https" else "ws"
+        return urlunsplit((scheme, parts.netloc, f"{parts.path}/socket", "", ""))
+
+    def start(self) -> None:
+        """Start listening in the background."""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(), name="jellyfin-library-watcher")
+        logger.info("[Jellyfin] Watching library changes")
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        for task in (self._flush_task, self._task):
+            if task and not task.done():
+                task.cancel()
+                # RuntimeError: task belongs to a loop that already ended
+                with contextlib.suppress(asyncio.CancelledError, RuntimeError):
+                    await task
+        self._task = None
+        self._flush_task = None
+
+    async def _run(self) -> None:
+        """Connect and reconnect with backoff until cancelled."""
+        attempt = 0
+        while True:
+            try:
+                await self._listen()
+                attempt = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[Jellyfin] WebSocket error: {e}")
+
+            attempt += 1
+            delay = min(300.0, 2 ** min(attempt, 8)) * random.uniform(0.5, 1.0)
+            logger.debug(f"[Jellyfin] WebSocket reconnecting in {delay:.0f}s")
+            await asyncio.sleep(delay)
+
+    async def _listen(self) -> None:
+        """Hold one WebSocket session open and dispatch its messages."""
+        params = {"api_key": self.api_key, "deviceId": self.DEVICE_ID}
+        keepalive: Optional[asyncio.Task] = None
+
+        async with (
+            aiohttp.ClientSession() as session,
+            session.ws_connect(self.socket_url, params=params, heartbeat=30) as ws,
+        ):
+            logger.debug("[Jellyfin] WebSocket connected")
+            try:
+                async for msg in ws:
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        continue
+
+                    message = json.loads(msg.data)
+                    message_type = message.get("MessageType")
+
+                    if message_type == "ForceKeepAlive":
+                        # Server drops the socket unless we ping within this timeout
+                        interval = max(5.0, float(message.get("Data") or 60) / 2)
+                        if keepalive:
+                            keepalive.cancel()
+                        keepalive = asyncio.create_task(self._keepalive(ws, interval))
+                    elif message_type == "LibraryChanged":
+                        self._on_library_changed(message.get("Data") or {})
+            finally:
+                if keepalive:
+                    keepalive.cancel()
+
+    async def _keepalive(self, ws: aiohttp.ClientWebSocketResponse, interval: float) -> None:
+        """Send Jellyfin KeepAlive messages."""
+        while not ws.closed:
+            await ws.send_str(json.dumps({"MessageType": "KeepAlive"}))
+            await asyncio.sleep(interval)
+
+    def _on_library_changed(self, data: dict[str, Any]) -> None:
+        """Queue item IDs from a LibraryChanged message."""
+        changed = set(data.get("ItemsAdded", [])) | set(data.get("ItemsUpdated", []))
+        removed = set(data.get("ItemsRemoved", []))
+
+        if not changed and not removed:
+            return
+
+        self._removed |= removed
+        self._removed -= changed
+        self._changed |= changed
+        self._changed -= removed
+
+        if not self._flush_task or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """Apply queued changes after the debounce delay, until none are left."""
+        while self._changed or self._removed:
+            await asyncio.sleep(self.debounce)
+
+            changed, self._changed = self._changed, set()
+            removed, self._removed = self._removed, set()
+
+            try:
+                await self.matcher.apply_library_changes(changed, removed)
+            except Exception as e:
+                logger.warning(f"[Jellyfin] Failed to apply library changes, will retry: {e}")
+                # Requeue, letting events received meanwhile take precedence
+                self._changed |= changed - self._removed
+                self._removed |= removed - self._changed
@@ -1,52 +1,204 @@
 """Service for matching media items between providers and Jellyfin library."""
 
+import asyncio
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from loguru import logger
 
 from jfc.clients.jellyfin import JellyfinClient
 from jfc.models.media import LibraryItem, MediaItem, MediaType
+from jfc.services.library_index import LibraryIndex, normalize_title
+from jfc.services.library_snapshot import LibrarySnapshotStore
+
+# Re-fetch window before the snapshot watermark (absorbs clock skew with Jellyfin)
+SNAPSHOT_OVERLAP = timedelta(minutes=10)
 
 
 class MediaMatcher:
     """Service for matching media items to Jellyfin library."""
 
-    def __init__(self, jellyfin: JellyfinClient):
+    def __init__(
+        self,
+        jellyfin: JellyfinClient,
+        snapshot_store: Optional[LibrarySnapshotStore] = None,
+        library_ttl: float = 0,
+    ):
         """
         Initialize media matcher.
 
         Args:
             jellyfin: Jellyfin API client
+            snapshot_store: Optional on-disk library snapshot for delta loads
+            library_ttl: Seconds before a loaded library is refreshed with a
+                delta load (0 = never, e.g. when a LibraryWatcher keeps it fresh)
         """
         self.jellyfin = jellyfin
+        self.snapshot_store = snapshot_store
+        self.library_ttl = library_ttl
         self._cache: dict[int, Optional[LibraryItem]] = {}  # tmdb_id -> LibraryItem
-        self._library_loaded: dict[str, bool] = {}  # library_id -> loaded
-        self._library_items: dict[str, dict[int, LibraryItem]] = {}  # library_id -> {tmdb_id -> item}
+        self._library_loaded: dict[str, datetime] = {}  # library_id -> loaded at (UTC)
+        self._library_media_types: dict[str, Optional[MediaType]] = {}  # library_id -> media type
+        self._library_indexes: dict[str, LibraryIndex] = {}  # library_id -> multi-key index
+        self._load_locks: dict[str, asyncio.Lock] = {}  # library_id -> lock (concurrent builds)
 
     async def _ensure_library_loaded(self, library_id: str, media_type: Optional[MediaType] = None) -> None:
-        """Load all items from a library into cache."""
-        if library_id in self._library_loaded:
+        """Load all items from a library into cache, refreshing it once expired."""
+        if self._is_library_fresh(library_id):
+            return
+
+        lock = self._load_locks.setdefault(library_id, asyncio.Lock())
+        async with lock:
+            if self._is_library_fresh(library_id):
+                return
+
+            started = datetime.now(timezone.utc)
+            loaded_at = self._library_loaded.get(library_id)
+            index: Optional[LibraryIndex] = None
+
+            if loaded_at is not None:
+                # Expired: refresh the in-memory index with a delta load
+                snapshot = (self._library_indexes[library_id].items(), loaded_at)
+                index = await self._load_library_delta(library_id, media_type, snapshot, started)
+                self._cache.clear()
+            elif self.snapshot_store:
+                saved = self.snapshot_store.load(library_id)
+                if saved:
+                    index = await self._load_library_delta(library_id, media_type, saved, started)
+
+            if index is None:
+                index = await self._load_library_full(library_id, media_type, started)
+
+            self._library_indexes[library_id] = index
+            self._library_media_types[library_id] = media_type
+            self._library_loaded[library_id] = started
+
+    def _is_library_fresh(self, library_id: str) -> bool:
+        """Check if a library is loaded and within its TTL."""
+        loaded_at = self._library_loaded.get(library_id)
+        if loaded_at is None:
+            return False
+        if not self.library_ttl:
+            return True
+        return (datetime.now(timezone.utc) - loaded_at).total_seconds() < self.library_ttl
+
+    async def apply_library_changes(self, changed: set[str], removed: set[str]) -> None:
+        """
+        Patch loaded library indexes in place.
+
+        Args:
+            changed: Jellyfin IDs of items added or updated
+            removed: Jellyfin IDs of items removed
+        """
+        if not self._library_indexes:
             return
 
+        for index in self._library_indexes.values():
+            for jellyfin_id in removed:
+                index.remove(jellyfin_id)
+
+        updated = 0
+        if changed:
+            for library_id, index in self._library_indexes.items():
+                items = await self.jellyfin.get_items_by_ids(
+                    sorted(changed),
+                    library_id=library_id,
+                    media_type=self._library_media_types.get(library_id),
+                )
+                index.add_all(items)
+                updated += len(items)
+
+        # Previous answers (including "not found") may be outdated
+        self._cache.clear()
+
+        logger.info(
+            f"[Jellyfin] Library changes applied: {updated} added/updated, "
+            f"{len(removed)} removed"
+        )
+
+    async def _load_library_full(
+        self,
+        library_id: str,
+        media_type: Optional[MediaType],
+        started: datetime,
+    ) -> LibraryIndex:
+        """Fetch every item of a library and save a fresh snapshot."""
         logger.info(f"[Jellyfin] Loading library {library_id} into cache...")
 
-        items = await self.jellyfin.get_library_items(
+        # Index page by page, without holding the full listing
+        index = LibraryIndex()
+        async for page in self.jellyfin.iter_library_items(
             library_id=library_id,
             media_type=media_type,
-            limit=10000,
+        ):
+            index.add_all(page)
+
+        if self.snapshot_store:
+            self.snapshot_store.save(library_id, index.items(), started)
+
+        logger.info(
+            f"[Jellyfin] Loaded {len(index)} items from library, "
+            f"{len(index.by_tmdb)} with TMDb IDs"
         )
+        return index
 
-        # Index by TMDb ID
-        self._library_items[library_id] = {}
-        for item in items:
-            if item.tmdb_id:
-                self._library_items[library_id][item.tmdb_id] = item
+    async def _load_library_delta(
+        self,
+        library_id: str,
+        media_type: Optional[MediaType],
+        snapshot: tuple[list[LibraryItem], datetime],
+        started: datetime,
+    ) -> LibraryIndex:
+        """
+        Rebuild a library index from its snapshot plus items changed since.
+
+        A delta cannot see deletions, so the index is then reconciled against
+        an ID-only listing of the library: items gone from Jellyfin are
+        dropped, and items the delta missed are fetched.
+
+        Returns:
+            Updated index
+        """
+        items, watermark = snapshot
+        index = LibraryIndex(items)
+        changed: list[LibraryItem] = []
+
+        async for page in self.jellyfin.iter_library_items(
+            library_id=library_id,
+            media_type=media_type,
+            min_date_last_saved=watermark - SNAPSHOT_OVERLAP,
+        ):
+            index.add_all(page)
+            changed.extend(page)
+
+        library_ids = await self.jellyfin.get_library_item_ids(library_id, media_type)
+        removed = [jid for jid in index.by_jellyfin_id if jid not in library_ids]
+        for jellyfin_id in removed:
+            index.remove(jellyfin_id)
+
+        missing = sorted(library_ids - index.by_jellyfin_id.keys())
+        if missing:
+            fetched = await self.jellyfin.get_items_by_ids(
+                missing, library_id=library_id, media_type=media_type
+            )
+            index.add_all(fetched)
+            changed.extend(fetched)
+
+        if self.snapshot_store:
+            self.snapshot_store.save(library_id, changed, started, replace=False)
+            if removed:
+                self.snapshot_store.remove(library_id, removed)
 
-        self._library_loaded[library_id] = True
         logger.info(
-            f"[Jellyfin] Loaded {len(items)} items from library, "
-            f"{len(self._library_items[library_id])} with TMDb IDs"
+            f"[Jellyfin] Loaded {len(items)} items from snapshot, "
+            f"{len(changed)} changed and {len(removed)} removed "
+            f"since {watermark:%Y-%m-%d %H:%M}"
         )
+        return index
+
+    def get_library_index(self, library_id: str) -> Optional[LibraryIndex]:
+        """Get the loaded index of a library, if any."""
+        return self._library_indexes.get(library_id)
 
     async def find_in_library(
         self,
@@ -77,19 +229,21 @@ class MediaMatcher:
                 logger.debug(f"[Jellyfin] Cache hit: [{tmdb_str}] {item.title}{year_str} -> {cached.title}")
             return cached
 
-        # Try to find by TMDb ID in library cache (most reliable and fast)
-        if item.tmdb_id and library_id and library_id in self._library_items:
-            lib_item = self._library_items[library_id].get(item.tmdb_id)
+        # Resolve against the library index (provider IDs, then title + year)
+        index = self._library_indexes.get(library_id) if library_id else None
+        if index is not None:
+            lib_item = index.find(item)
             if lib_item:
-                self._cache[item.tmdb_id] = lib_item
+                if item.tmdb_id:
+                    self._cache[item.tmdb_id] = lib_item
                 logger.debug(
                     f"[Jellyfin] FOUND: [{tmdb_str}] {item.title}{year_str} "
                     f"-> {lib_item.title} ({lib_item.year})"
                 )
                 return lib_item
 
-        # Fall back to search by title and year (for items without TMDb ID)
-        if not item.tmdb_id:
+        # Without a library index, fall back to search by title and year
+        if index is None and not item.tmdb_id:
             logger.debug(f"[Jellyfin] Searching by title (no TMDb ID): '{item.title}'{year_str}")
             results = await self.jellyfin.search_items(
                 query=item.title,
@@ -180,21 +334,7 @@ class MediaMatcher:
 
     def _normalize_title(self, title: str) -> str:
         """Normalize title for comparison."""
-        # Lowercase
-        title = title.lower()
-
-        # Remove common articles
-        for article in ["the ", "a ", "an ", "le ", "la ", "les ", "un ", "une "]:
-            if title.startswith(article):
-                title = title[len(article) :]
-
-        # Remove special characters
-        title = "".join(c for c in title if c.isalnum() or c.isspace())
-
-        # Normalize whitespace
-        title = " ".join(title.split())
-
-        return title
+        return normalize_title(title)
 
     def clear_cache(self) -> None:
         """Clear the match cache."""
@@ -1,20 +1,23 @@
 """Automatic poster generation using OpenAI gpt-image-1.5 and GPT-5.1."""
 
+import asyncio
 import base64
 import json
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import httpx
 import yaml
-from jinja2 import Environment, FileSystemLoader, BaseLoader, ChoiceLoader
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, Template, TemplateNotFound
 from loguru import logger
 from openai import AsyncOpenAI
 
 from jfc.models.collection import CollectionConfig
 from jfc.models.media import MediaItem
+from jfc.services.collection_state import file_fingerprint, fingerprint
+from jfc.services.signature_store import SignatureKey, SignatureStore
 
 
 # =============================================================================
@@ -31,6 +34,44 @@ API_TIMEOUT = httpx.Timeout(
     connect=30.0,
 )
 
+# Top collection items a poster is built from
+POSTER_CONTEXT_ITEMS = 5
+
+# Templates a poster depends on (part of its input fingerprint)
+POSTER_TEMPLATES = (
+    "base_structure.j2",
+    "scene_description.j2",
+    "visual_signature.j2",
+    "visual_signatures_batch.j2",
+)
+
+# Signature of an item: (media type, TMDb ID), or (media type, title) without TMDb ID
+ItemKey = tuple[str, Union[int, str]]
+
+# Per-item signature requests sent at the same time (batch fallback)
+SIGNATURE_CONCURRENCY = 4
+
+# Structured output of the batched visual signature request
+SIGNATURES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "signatures": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "signature": {"type": "string"},
+                },
+                "required": ["id", "signature"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["signatures"],
+    "additionalProperties": False,
+}
+
 
 # =============================================================================
 # CONSTANTS
@@ -69,6 +110,10 @@ class PosterGenerator:
         poster_history_limit: int = 5,
         prompt_history_limit: int = 10,
         logo_text: str = "NETFLEX",
+        batch_signatures: bool = True,
+        signature_cache_max_entries: int = 5000,
+        signature_cache_max_age_days: float = 180,
+        poster_max_age_days: float = 90,
     ):
         """
         Initialize poster generator.
@@ -81,6 +126,12 @@ class PosterGenerator:
             poster_history_limit: Number of old posters to keep (0=unlimited)
             prompt_history_limit: Number of prompt JSON files to keep (0=unlimited)
             logo_text: Logo text for bottom of posters (default: NETFLEX)
+            batch_signatures: Generate missing visual signatures in one request
+            signature_cache_max_entries: Visual signatures kept (0 = unlimited)
+            signature_cache_max_age_days: Days before a visual signature is
+                regenerated (0 = never)
+            poster_max_age_days: Days after which smart regeneration replaces a
+                poster even if its inputs did not change (0 = never)
         """
         self.client = AsyncOpenAI(api_key=api_key, timeout=API_TIMEOUT)
         self.output_dir = output_dir
@@ -92,6 +143,11 @@ class PosterGenerator:
 
         # Logo text for posters
         self.logo_text = logo_text
+        self.poster_max_age_days = poster_max_age_days
+
+        # Visual signature generation (batched, shared between concurrent posters)
+        self.batch_signatures = batch_signatures
+        self._signature_requests: dict[ItemKey, asyncio.Future[Optional[str]]] = {}
 
         # Cache directory (separate from output)
         self.cache_dir = cache_dir or output_dir
@@ -101,117 +157,144 @@ class PosterGenerator:
         self.templates_dir = templates_dir  # User overrides (config/templates)
         self.package_templates_dir = self.PACKAGE_TEMPLATES_DIR  # Package defaults
 
+        # Compiled templates and parsed YAML, reloaded when a file changes
+        self._jinja_env: Optional[Environment] = None
+        self._jinja_search: tuple[Optional[Path], Path] = (None, self.package_templates_dir)
+        self._yaml_cache: dict[Path, tuple[float, dict]] = {}
+        self._template_hashes: dict[Path, tuple[float, str]] = {}
+
         # Load templates and configurations
         self._load_templates()
 
-        # Load cached visual signatures
-        self.signatures_cache_path = self.cache_dir / "visual_signatures_cache.json"
-        self.signatures_cache = self._load_signatures_cache()
+        # Cached visual signatures (by TMDb ID; items without one are kept for the process only)
+        self.signatures_cache_path = self.cache_dir / "visual_signatures.sqlite"
+        self.signatures_cache = SignatureStore(
+            self.signatures_cache_path,
+            max_entries=signature_cache_max_entries,
+            max_age_days=signature_cache_max_age_days,
+        )
+        self._untracked_signatures: dict[ItemKey, str] = {}
 
         logger.info(f"PosterGenerator initialized (output: {output_dir}, logo: {logo_text})")
         if templates_dir and templates_dir.exists():
             logger.info(f"Custom templates from: {templates_dir}")
         logger.info(f"Package templates from: {self.package_templates_dir}")
         logger.info(f"Retention: {poster_history_limit} posters, {prompt_history_limit} prompts")
-        logger.debug(f"Loaded {len(self.signatures_cache)} cached visual signatures")
-        if self.signatures_cache:
-            logger.debug(f"Cache keys sample: {list(self.signatures_cache.keys())[:5]}")
 
     def _load_templates(self) -> None:
         """Load Jinja2 templates and YAML configurations.
 
         Priority: config/templates (user) > src/jfc/templates (package)
         """
-        # Initialize Jinja2 environment with BaseLoader (we'll load manually)
-        self.jinja_env = Environment(loader=BaseLoader(), autoescape=False)
-
-        # Load YAML configurations (user override > package default)
-        self.category_styles = self._load_yaml_config("category_styles.yaml")
-        self.collection_themes = self._load_yaml_config("collection_themes.yaml")
+        # Fail early on unreadable YAML; both are reloaded on change
+        self._load_yaml_config("category_styles.yaml")
+        self._load_yaml_config("collection_themes.yaml")
+
+    @property
+    def category_styles(self) -> dict:
+        """Artistic styles per category (category_styles.yaml)."""
+        return self._load_yaml_config("category_styles.yaml")
+
+    @property
+    def collection_themes(self) -> dict:
+        """Color palettes and moods by collection keyword (collection_themes.yaml)."""
+        return self._load_yaml_config("collection_themes.yaml")
+
+    @property
+    def jinja_env(self) -> Environment:
+        """Jinja2 environment over user and package templates.
+
+        Compiled templates are cached and recompiled when their file's
+        mtime changes (auto_reload). The environment is rebuilt if the
+        template directories are changed.
+        """
+        search = (self.templates_dir, self.package_templates_dir)
+        if self._jinja_env is None or search != self._jinja_search:
+            loaders = [FileSystemLoader(str(d)) for d in search if d]
+            self._jinja_env = Environment(
+                loader=ChoiceLoader(loaders),
+                autoescape=False,
+                auto_reload=True,
+            )
+            self._jinja_search = search
+        return self._jinja_env
 
     def _load_yaml_config(self, filename: str) -> dict:
         """Load a YAML configuration file.
 
         Priority: config/templates (user) > src/jfc/templates (package)
+
+        Parsed files are cached and only read again when their mtime changes.
         """
-        # 1. Try user override (config/templates)
-        if self.templates_dir:
-            user_path = self.templates_dir / filename
-            if user_path.exists():
+        sources = [("user", self.templates_dir), ("package", self.package_templates_dir)]
+        for source, directory in sources:
+            if not directory:
+                continue
+            path = directory / filename
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+
+            cached = self._yaml_cache.get(path)
+            if cached is None or cached[0] != mtime:
                 try:
-                    with open(user_path, encoding="utf-8") as f:
-                        loaded = yaml.safe_load(f)
-                        if loaded:
-                            logger.debug(f"Loaded user config: {filename}")
-                            return loaded
+                    with open(path, encoding="utf-8") as f:
+                        loaded = yaml.safe_load(f) or {}
+                    logger.debug(f"Loaded {source} config: {filename}")
                 except Exception as e:
-                    logger.warning(f"Failed to load user {filename}: {e}")
+                    logger.warning(f"Failed to load {source} {filename}: {e}")
+                    loaded = {}
+                cached = (mtime, loaded)
+                self._yaml_cache[path] = cached
 
-        # 2. Fall back to package default (src/jfc/templates)
-        package_path = self.package_templates_dir / filename
-        if package_path.exists():
-            try:
-                with open(package_path, encoding="utf-8") as f:
-                    loaded = yaml.safe_load(f)
-                    if loaded:
-                        logger.debug(f"Loaded package config: {filename}")
-                        return loaded
-            except Exception as e:
-                logger.warning(f"Failed to load package {filename}: {e}")
-
-        # 3. Return empty dict if nothing found
+            if cached[1]:
+                return cached[1]
+
+        # Return empty dict if nothing found
         logger.warning(f"No config found for {filename}")
         return {}
 
     def _get_template(self, name: str) -> str:
-        """Get template content from file.
+        """Get template content.
 
         Priority: config/templates (user) > src/jfc/templates (package)
         """
-        # 1. Try user override (config/templates)
-        if self.templates_dir:
-            user_path = self.templates_dir / name
-            if user_path.exists():
-                try:
-                    with open(user_path, encoding="utf-8") as f:
-                        content = f.read()
-                        logger.debug(f"Loaded user template: {name}")
-                        return content
-                except Exception as e:
-                    logger.warning(f"Failed to load user template {name}: {e}")
+        env = self.jinja_env
+        assert env.loader is not None
+        try:
+            source, _, _ = env.loader.get_source(env, name)
+        except TemplateNotFound:
+            raise FileNotFoundError(f"Template not found: {name}") from None
+        return source
 
-        # 2. Fall back to package default (src/jfc/templates)
-        package_path = self.package_templates_dir / name
-        if package_path.exists():
-            try:
-                with open(package_path, encoding="utf-8") as f:
-                    content = f.read()
-                    logger.debug(f"Loaded package template: {name}")
-                    return content
-            except Exception as e:
-                logger.warning(f"Failed to load package template {name}: {e}")
-
-        # 3. Raise error if template not found
-        raise FileNotFoundError(f"Template not found: {name}")
-
-    def _load_signatures_cache(self) -> dict[str, str]:
-        """Load cached visual signatures from JSON file."""
-        if self.signatures_cache_path.exists():
-            try:
-                with open(self.signatures_cache_path, encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load signatures cache: {e}")
-        return {}
+    def _get_compiled_template(self, name: str) -> Template:
+        """Get a compiled template (cached, recompiled when the file changes)."""
+        try:
+            return self.jinja_env.get_template(name)
+        except TemplateNotFound:
+            raise FileNotFoundError(f"Template not found: {name}") from None
 
-    def _save_signatures_cache(self) -> None:
-        """Save visual signatures cache to JSON file."""
+    def _template_fingerprint(self, name: str) -> Optional[str]:
+        """Hash of the template file in use (rehashed only when its mtime changes)."""
         try:
-            with open(self.signatures_cache_path, "w", encoding="utf-8") as f:
-                json.dump(self.signatures_cache, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Saved {len(self.signatures_cache)} signatures to cache")
-        except Exception as e:
-            logger.warning(f"Failed to save signatures cache: {e}")
+            filename = self._get_compiled_template(name).filename
+            if not filename:
+                return None
+            path = Path(filename)
+            mtime = path.stat().st_mtime
+        except OSError:
+            return None
+
+        cached = self._template_hashes.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, file_fingerprint(path))
+            self._template_hashes[path] = cached
+        return cached[1]
+
+    def close(self) -> None:
+        """Close the visual signature store."""
+        self.signatures_cache.close()
 
     def _get_collection_dir(self, library: str, collection: str) -> Path:
         """
@@ -267,6 +350,7 @@ class PosterGenerator:
         force_regenerate: bool = False,
         use_dalle3: bool = False,
         explicit_refs: bool = False,
+        smart_regenerate: bool = False,
     ) -> Optional[Path]:
         """
         Generate a poster for a collection.
@@ -279,6 +363,8 @@ class PosterGenerator:
             force_regenerate: Regenerate even if poster exists
             use_dalle3: Use DALL-E 3 instead of gpt-image-1.5
             explicit_refs: Include show titles in visual signatures
+            smart_regenerate: Regenerate an existing poster only if its inputs
+                changed or it is older than poster_max_age_days
 
         Returns:
             Path to generated poster, or None if failed
@@ -288,10 +374,21 @@ class PosterGenerator:
         output_path = col_dir / "poster.png"
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
 
+        # Fingerprint of everything the poster is generated from (smart mode only)
+        poster_fingerprint: Optional[str] = None
+
         # Skip if exists and not forcing
         if output_path.exists() and not force_regenerate:
-            logger.debug(f"Poster already exists: {output_path}")
-            return output_path
+            if not smart_regenerate:
+                logger.debug(f"Poster already exists: {output_path}")
+                return output_path
+
+            poster_fingerprint = self.poster_fingerprint(config, items, category, explicit_refs)
+            reason = self._regeneration_reason(col_dir, poster_fingerprint)
+            if not reason:
+                logger.info(f"Poster inputs unchanged for '{config.name}', keeping current poster")
+                return output_path
+            logger.info(f"Regenerating poster for '{config.name}': {reason}")
 
         logger.info(f"Generating poster for '{config.name}' in '{library}'...")
         start_time = time.perf_counter()
@@ -299,7 +396,7 @@ class PosterGenerator:
         try:
             # Step 1: Extract visual signatures (DB -> cache -> generate from metadata)
             visual_signatures = await self._extract_visual_signatures(
-                items[:5], explicit_refs=explicit_refs
+                items[:POSTER_CONTEXT_ITEMS], explicit_refs=explicit_refs
             )
             logger.debug(f"Visual signatures: {visual_signatures[:100]}...")
 
@@ -327,7 +424,12 @@ class PosterGenerator:
             elapsed = time.perf_counter() - start_time
 
             if image_path:
-                # Step 6: Save prompt to collection's prompts folder
+                # Step 6: Save prompt to collection's prompts folder, with the
+                # fingerprint later smart regenerations compare against
+                if poster_fingerprint is None:
+                    poster_fingerprint = self.poster_fingerprint(
+                        config, items, category, explicit_refs
+                    )
                 self._save_prompt_to_collection(
                     col_dir=col_dir,
                     timestamp=timestamp,
@@ -339,6 +441,7 @@ class PosterGenerator:
                     scene_prompt=scene_prompt,
                     scene_description=scene_description,
                     image_prompt=full_prompt,
+                    poster_fingerprint=poster_fingerprint,
                 )
 
                 # Step 7: Apply retention limits
@@ -354,6 +457,81 @@ class PosterGenerator:
 
         return None
 
+    def poster_fingerprint(
+        self,
+        config: CollectionConfig,
+        items: list[MediaItem],
+        category: str,
+        explicit_refs: bool = False,
+    ) -> str:
+        """
+        Fingerprint the inputs a poster is generated from.
+
+        Covers the top items, category, theme and style, templates, logo
+        text and models: a poster generated from the same fingerprint would
+        only differ by chance.
+
+        Args:
+            config: Collection configuration
+            items: Items in the collection (in source order)
+            category: Category type (FILMS, SÉRIES, CARTOONS)
+            explicit_refs: Include show titles in visual signatures
+
+        Returns:
+            Hex digest
+        """
+        templates = {name: self._template_fingerprint(name) for name in POSTER_TEMPLATES}
+
+        return fingerprint(
+            [
+                (item.media_type.value, item.tmdb_id or item.title)
+                for item in items[:POSTER_CONTEXT_ITEMS]
+            ],
+            category,
+            self._clean_display_name(config.name),
+            self._get_collection_theme(config.name),
+            self.category_styles.get(category, self.category_styles.get("FILMS", {})),
+            templates,
+            self.logo_text,
+            explicit_refs,
+            [MODEL_GPT_5_1, MODEL_GPT_IMAGE_1_5],
+        )
+
+    def _regeneration_reason(self, col_dir: Path, poster_fingerprint: str) -> Optional[str]:
+        """
+        Compare a poster's inputs with those of the last generated one.
+
+        Args:
+            col_dir: Collection directory path
+            poster_fingerprint: Fingerprint of the current inputs
+
+        Returns:
+            Why the poster should be regenerated, or None to keep it
+        """
+        prompt_files = sorted((col_dir / "prompts").glob("*.json"))
+        if not prompt_files:
+            return "no prompt recorded for the current poster"
+
+        try:
+            with open(prompt_files[-1], encoding="utf-8") as f:
+                last = json.load(f)
+        except Exception as e:
+            return f"unreadable prompt file ({e})"
+
+        if last.get("fingerprint") != poster_fingerprint:
+            return "inputs changed"
+
+        if self.poster_max_age_days > 0:
+            try:
+                generated_at = datetime.fromisoformat(last["timestamp"])
+            except (KeyError, TypeError, ValueError):
+                return "unknown poster age"
+            age_days = (datetime.now() - generated_at).total_seconds() / 86400
+            if age_days > self.poster_max_age_days:
+                return f"older than {self.poster_max_age_days:g} days"
+
+        return None
+
     def _build_scene_prompt(
         self,
         config: CollectionConfig,
@@ -386,8 +564,7 @@ IMPORTANT FOR CARTOONS:
             extra_rules = ""
 
         # Get template (user override > package default)
-        template_content = self._get_template("scene_description.j2")
-        template = self.jinja_env.from_string(template_content)
+        template = self._get_compiled_template("scene_description.j2")
         base_prompt = template.render(
             collection_name=display_name,
             category=category,
@@ -418,31 +595,22 @@ IMPORTANT FOR CARTOONS:
 
         # Collect signatures with their source titles
         # Use top 8 items: 3 primary + 5 secondary references
-        signature_data: list[tuple[str, str]] = []  # (title, signature)
-        items_needing_generation = []
+        top_items = items[:8]
 
-        for item in items[:8]:
-            signature = None
+        # Check cache (signatures generated by GPT and cached)
+        signatures = self._cached_signatures(top_items)
+        logger.debug(f"[Cache] Found {len(signatures)}/{len(top_items)} signatures")
 
-            # Check cache (signatures generated by GPT and cached)
-            logger.debug(f"[Cache lookup] title='{item.title}', in_cache={item.title in self.signatures_cache}")
-            if item.title in self.signatures_cache:
-                signature = self.signatures_cache[item.title]
-                logger.debug(f"[Cache] Found signature for '{item.title}'")
+        # Generate missing signatures from metadata
+        missing = [item for item in top_items if self._signature_key(item) not in signatures]
+        if missing:
+            signatures.update(await self._get_signatures(missing))
 
-            if signature:
-                signature_data.append((item.title, signature))
-            else:
-                # Need to generate from metadata
-                items_needing_generation.append(item)
-
-        # 3. Generate missing signatures from metadata
-        if items_needing_generation:
-            new_signatures = await self._generate_signatures_from_metadata(
-                items_needing_generation
-            )
-            for item, sig in zip(items_needing_generation, new_signatures):
-                signature_data.append((item.title, sig))
+        signature_data: list[tuple[str, str]] = [
+            (item.title, signatures[self._signature_key(item)])
+            for item in top_items
+            if self._signature_key(item) in signatures
+        ]
 
         if signature_data:
             logger.debug(f"Total {len(signature_data)} visual signatures")
@@ -483,63 +651,207 @@ IMPORTANT FOR CARTOONS:
         logger.debug("No visual signatures found, using default")
         return "Epic cinematic environments with dramatic silhouettes, mixed genre visual styles"
 
+    def _signature_key(self, item: MediaItem) -> ItemKey:
+        """Cache key of an item's visual signature."""
+        media_type = item.media_type.value
+        return (media_type, item.tmdb_id) if item.tmdb_id else (media_type, item.title)
+
+    def _cached_signatures(self, items: list[MediaItem]) -> dict[ItemKey, str]:
+        """Get the known signatures of items."""
+        keys = [self._signature_key(item) for item in items]
+        found: dict[ItemKey, str] = {
+            key: self._untracked_signatures[key]
+            for key in keys
+            if key in self._untracked_signatures
+        }
+        tracked: list[SignatureKey] = [
+            (media_type, tmdb_id) for media_type, tmdb_id in keys if isinstance(tmdb_id, int)
+        ]
+        for key, signature in self.signatures_cache.get_many(tracked).items():
+            found[key] = signature
+        return found
+
+    def _cache_signatures(self, items: list[MediaItem], signatures: dict[ItemKey, str]) -> None:
+        """Save newly generated signatures (one transaction)."""
+        entries: list[tuple[SignatureKey, str, str]] = []
+        for item in items:
+            key = self._signature_key(item)
+            if key not in signatures:
+                continue
+            media_type, tmdb_id = key
+            if isinstance(tmdb_id, int):
+                entries.append(((media_type, tmdb_id), item.title, signatures[key]))
+            else:
+                self._untracked_signatures[key] = signatures[key]
+        self.signatures_cache.put_many(entries)
+
+    async def _get_signatures(self, items: list[MediaItem]) -> dict[ItemKey, str]:
+        """
+        Generate signatures for uncached items, once per item across concurrent posters.
+
+        Items already being generated for another poster are awaited instead
+        of requested again.
+
+        Returns:
+            Signatures by cache key (items that failed are left out)
+        """
+        waiting: dict[ItemKey, asyncio.Future[Optional[str]]] = {}
+        to_generate: list[MediaItem] = []
+
+        for item in items:
+            key = self._signature_key(item)
+            if key in waiting:
+                continue
+            future = self._signature_requests.get(key)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._signature_requests[key] = future
+                to_generate.append(item)
+            else:
+                logger.debug(f"[Signature] Waiting for in-flight '{item.title}'")
+            waiting[key] = future
+
+        if to_generate:
+            generated: dict[ItemKey, str] = {}
+            try:
+                generated = await self._generate_signatures_from_metadata(to_generate)
+            finally:
+                for item in to_generate:
+                    future = self._signature_requests.pop(self._signature_key(item))
+                    if not future.done():
+                        future.set_result(generated.get(self._signature_key(item)))
+
+        results = {}
+        for key, future in waiting.items():
+            signature = await future
+            if signature:
+                results[key] = signature
+        return results
+
     async def _generate_signatures_from_metadata(
         self, items: list[MediaItem]
-    ) -> list[str]:
+    ) -> dict[ItemKey, str]:
         """
         Generate visual signatures from item metadata using GPT.
 
         Uses genres and overview (not title) to avoid copyright issues.
-        """
-        signatures = []
+        All items are asked for in one structured-output request; items it
+        misses are generated one by one, concurrently.
 
-        for item in items:
-            # Build metadata context (no title!)
-            # Convert genre IDs to names if needed
-            genre_names = []
-            for g in item.genres or []:
-                if isinstance(g, int):
-                    genre_names.append(TMDB_GENRES.get(g, "Drama"))
-                else:
-                    genre_names.append(str(g))
-            genres = ", ".join(genre_names) if genre_names else "Drama"
-            overview = item.overview or "A compelling story"
-
-            # Truncate overview to avoid token limits
-            if len(overview) > 200:
-                overview = overview[:200] + "..."
-
-            # Get template (user override > package default)
-            template_content = self._get_template("visual_signature.j2")
-            template = self.jinja_env.from_string(template_content)
-            prompt = template.render(genres=genres, overview=overview)
+        Returns:
+            Signatures by cache key (items that failed are left out)
+        """
+        signatures: dict[ItemKey, str] = {}
+        if self.batch_signatures and len(items) > 1:
+            signatures = await self._generate_signatures_batch(items)
 
-            try:
-                logger.debug(f"[GPT] Generating signature for '{item.title}' from metadata...")
-                response = await self.client.chat.completions.create(
-                    model=MODEL_GPT_5_1,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_completion_tokens=150,
-                    reasoning_effort="low",
-                )
+        remaining = [item for item in items if self._signature_key(item) not in signatures]
+        if remaining:
+            semaphore = asyncio.Semaphore(SIGNATURE_CONCURRENCY)
 
-                content = response.choices[0].message.content
-                if content:
-                    signature = content.strip()
-                    signatures.append(signature)
-                    # Cache for future use
-                    self.signatures_cache[item.title] = signature
-                    logger.debug(f"[GPT] Generated and cached: '{signature[:50]}...'")
+            async def generate(item: MediaItem) -> Optional[str]:
+                async with semaphore:
+                    return await self._generate_signature(item)
 
-            except Exception as e:
-                logger.warning(f"Failed to generate signature for '{item.title}': {e}")
+            results = await asyncio.gather(*(generate(item) for item in remaining))
+            for item, signature in zip(remaining, results):
+                if signature:
+                    signatures[self._signature_key(item)] = signature
 
-        # Save cache after generating new signatures
+        # Cache for future use
         if signatures:
-            self._save_signatures_cache()
+            self._cache_signatures(items, signatures)
 
         return signatures
 
+    def _signature_metadata(self, item: MediaItem) -> tuple[str, str]:
+        """Get the genres and overview sent for an item (no title!)."""
+        # Convert genre IDs to names if needed
+        genre_names = []
+        for g in item.genres or []:
+            if isinstance(g, int):
+                genre_names.append(TMDB_GENRES.get(g, "Drama"))
+            else:
+                genre_names.append(str(g))
+        genres = ", ".join(genre_names) if genre_names else "Drama"
+        overview = item.overview or "A compelling story"
+
+        # Truncate overview to avoid token limits
+        if len(overview) > 200:
+            overview = overview[:200] + "..."
+
+        return genres, overview
+
+    async def _generate_signatures_batch(self, items: list[MediaItem]) -> dict[ItemKey, str]:
+        """Generate signatures of several items in one structured-output request."""
+        entries = []
+        for i, item in enumerate(items):
+            genres, overview = self._signature_metadata(item)
+            entries.append({"id": i, "genres": genres, "overview": overview})
+
+        # Get template (user override > package default)
+        template = self._get_compiled_template("visual_signatures_batch.j2")
+        prompt = template.render(items=entries)
+
+        try:
+            logger.debug(f"[GPT] Generating {len(items)} signatures in one request...")
+            response = await self.client.chat.completions.create(
+                model=MODEL_GPT_5_1,
+                messages=[{"role": "user", "content": prompt}],
+                max_completion_tokens=150 * len(items) + 100,
+                reasoning_effort="low",
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": "visual_signatures",
+                        "strict": True,
+                        "schema": SIGNATURES_SCHEMA,
+                    },
+                },
+            )
+            content = response.choices[0].message.content
+            data = json.loads(content) if content else {}
+        except Exception as e:
+            logger.warning(f"Batched signature request failed, falling back per item: {e}")
+            return {}
+
+        signatures = {}
+        for entry in data.get("signatures", []):
+            index = entry.get("id")
+            signature = (entry.get("signature") or "").strip()
+            if isinstance(index, int) and 0 <= index < len(items) and signature:
+                signatures[self._signature_key(items[index])] = signature
+
+        logger.debug(f"[GPT] Batch returned {len(signatures)}/{len(items)} signatures")
+        return signatures
+
+    async def _generate_signature(self, item: MediaItem) -> Optional[str]:
+        """Generate the signature of a single item."""
+        genres, overview = self._signature_metadata(item)
+
+        # Get template (user override > package default)
+        template = self._get_compiled_template("visual_signature.j2")
+        prompt = template.render(genres=genres, overview=overview)
+
+        try:
+            logger.debug(f"[GPT] Generating signature for '{item.title}' from metadata...")
+            response = await self.client.chat.completions.create(
+                model=MODEL_GPT_5_1,
+                messages=[{"role": "user", "content": prompt}],
+                max_completion_tokens=150,
+                reasoning_effort="low",
+            )
+        except Exception as e:
+            logger.warning(f"Failed to generate signature for '{item.title}': {e}")
+            return None
+
+        content = response.choices[0].message.content
+        if not content:
+            return None
+        signature = content.strip()
+        logger.debug(f"[GPT] Generated: '{signature[:50]}...'")
+        return signature
+
     async def _generate_scene_description(
         self,
         prompt: str,
@@ -585,6 +897,7 @@ IMPORTANT FOR CARTOONS:
         scene_prompt: str,
         scene_description: str,
         image_prompt: str,
+        poster_fingerprint: Optional[str] = None,
     ) -> None:
         """
         Save prompt data to the collection's prompts folder.
@@ -600,6 +913,7 @@ IMPORTANT FOR CARTOONS:
             scene_prompt: Prompt sent to GPT-5.1
             scene_description: Response from GPT-5.1
             image_prompt: Final prompt sent to gpt-image-1.5
+            poster_fingerprint: Fingerprint of the poster inputs (smart regeneration)
         """
         prompt_file = col_dir / "prompts" / f"{timestamp}.json"
 
@@ -625,6 +939,7 @@ IMPORTANT FOR CARTOONS:
                 "scene_model": MODEL_GPT_5_1,
                 "image_model": MODEL_GPT_IMAGE_1_5,
             },
+            "fingerprint": poster_fingerprint,
         }
 
         try:
@@ -656,8 +971,7 @@ IMPORTANT FOR CARTOONS:
             scene_prefix = "Bright, colorful, family-friendly animated scene"
 
         # Get template (user override > package default)
-        template_content = self._get_template("base_structure.j2")
-        template = self.jinja_env.from_string(template_content)
+        template = self._get_compiled_template("base_structure.j2")
         return template.render(
             poster_style=style.get("poster_style", "Cinematic"),
             category=category,
@@ -0,0 +1,162 @@
+"""Background queue for collection poster generation and upload."""
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+from loguru import logger
+
+from jfc.models.collection import Collection
+from jfc.models.media import MediaType
+from jfc.models.report import CollectionReport
+
+
+@dataclass(order=True)
+class PosterJob:
+    """Poster to generate and upload for a synced collection."""
+
+    priority: int
+    sequence: int
+    collection: Collection = field(compare=False)
+    report: CollectionReport = field(compare=False)
+    media_type: MediaType = field(compare=False, default=MediaType.MOVIE)
+    force_regenerate: bool = field(compare=False, default=False)
+    smart_regenerate: bool = field(compare=False, default=False)
+    attempts: int = field(compare=False, default=0)
+
+
+class PosterQueue:
+    """
+    Bounded-concurrency poster work queue.
+
+    Collection sync only enqueues a job; workers generate and upload posters
+    in priority order while other collections keep syncing. Submitting blocks
+    once max_pending jobs are waiting (backpressure). A job whose handler
+    fails is retried by the same worker with a growing delay.
+    """
+
+    # Lower runs first
+    PRIORITY_NEW = 0  # Collection just created, shown without artwork
+    PRIORITY_NORMAL = 1
+    PRIORITY_FORCED = 2  # Regeneration of an existing poster
+
+    def __init__(
+        self,
+        handler: Callable[[PosterJob], Awaitable[bool]],
+        concurrency: int = 2,
+        max_pending: int = 32,
+        max_attempts: int = 2,
+        retry_delay: float = 5.0,
+    ):
+        """
+        Initialize queue.
+
+        Args:
+            handler: Processes a job, returns False if it should be retried
+            concurrency: Jobs processed at the same time
+            max_pending: Queued jobs above which submit waits (0 = unbounded)
+            max_attempts: Attempts per job before giving up
+            retry_delay: Seconds before the first retry (doubles each retry)
+        """
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self._max_pending = max(0, max_pending)
+        self._queue: Optional[asyncio.PriorityQueue[PosterJob]] = None
+        self._workers: list[asyncio.Task] = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize() if self._queue else 0
+
+    async def submit(
+        self,
+        collection: Collection,
+        report: CollectionReport,
+        media_type: MediaType = MediaType.MOVIE,
+        force_regenerate: bool = False,
+        smart_regenerate: bool = False,
+        priority: int = PRIORITY_NORMAL,
+    ) -> None:
+        """
+        Queue a poster job, waiting while the queue is full.
+
+        Args:
+            collection: Synced collection (with its Jellyfin ID)
+            report: Collection report, updated when the job completes
+            media_type: Type of media (for poster category)
+            force_regenerate: Force regeneration of AI poster
+            smart_regenerate: Regenerate AI poster only if its inputs changed
+            priority: Job priority (PRIORITY_* constant)
+        """
+        if self._queue is None:
+            # Created lazily so the queue binds to the running event loop
+            self._queue = asyncio.PriorityQueue(self._max_pending)
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker(), name=f"poster-worker:{i}")
+                for i in range(self.concurrency)
+            ]
+
+        await self._queue.put(PosterJob(
+            priority=priority,
+            sequence=next(self._sequence),
+            collection=collection,
+            report=report,
+            media_type=media_type,
+            force_regenerate=force_regenerate,
+            smart_regenerate=smart_regenerate,
+        ))
+
+    async def join(self) -> None:
+        """Wait until every queued job is done, then stop the workers."""
+        if self._queue is not None:
+            await self._queue.join()
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    async def _worker(self) -> None:
+        """Process jobs until cancelled."""
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            job = await queue.get()
+            try:
+                await self._process(job)
+            finally:
+                queue.task_done()
+
+    async def _process(self, job: PosterJob) -> None:
+        """Run a job with retries and record its duration on the report."""
+        name = job.collection.config.name
+        start = time.perf_counter()
+
+        while True:
+            job.attempts += 1
+            try:
+                done = await self.handler(job)
+            except Exception as e:
+                logger.warning(f"Poster job for '{name}' failed: {e}")
+                done = False
+
+            if done or job.attempts >= self.max_attempts:
+                break
+
+            delay = self.retry_delay * 2 ** (job.attempts - 1)
+            logger.info(
+                f"Retrying poster for '{name}' in {delay:g}s "
+                f"(attempt {job.attempts + 1}/{self.max_attempts})"
+            )
+            await asyncio.sleep(delay)
+
+        if not done:
+            logger.warning(f"Giving up on poster for '{name}' after {job.attempts} attempts")
+        job.report.poster_duration_seconds += time.perf_counter() - start
@@ -81,6 +81,10 @@ class ReportGenerator:
                 f"[blue]{report.items_sent_to_sonarr}[/]"
             )
 
+        stats_table.add_row("Sync time", f"{report.sync_duration_seconds:.1f}s")
+        if report.poster_duration_seconds > 0:
+            stats_table.add_row("Poster time", f"{report.poster_duration_seconds:.1f}s")
+
         self.console.print(stats_table)
 
         # Show lists if verbose
@@ -118,6 +122,8 @@ class ReportGenerator:
             f"Run ID: {report.run_id}",
             f"Start: {report.start_time.strftime('%Y-%m-%d %H:%M:%S')}",
             f"Duration: {duration_str}",
+            f"Sync: {report.sync_duration_seconds:.1f}s, "
+            f"posters after sync: {report.poster_duration_seconds:.1f}s",
             f"Mode: {'Dry Run' if report.dry_run else 'Live'}",
             f"Scheduled: {'Yes' if report.scheduled else 'No'}",
         ]
@@ -166,6 +172,10 @@ class ReportGenerator:
         if report.end_time:
             lines.append(f"**End:** {report.end_time.strftime('%Y-%m-%d %H:%M:%S')}")
         lines.append(f"**Duration:** {report.duration_seconds:.1f}s")
+        lines.append(
+            f"**Sync:** {report.sync_duration_seconds:.1f}s "
+            f"(posters finished {report.poster_duration_seconds:.1f}s later)"
+        )
         lines.append(f"**Mode:** {'Dry Run' if report.dry_run else 'Live'}")
         lines.append("")
 
@@ -212,6 +222,9 @@ class ReportGenerator:
                     lines.append(f"- **Sent to Radarr:** {col.items_sent_to_radarr}")
                 if col.items_sent_to_sonarr > 0:
                     lines.append(f"- **Sent to Sonarr:** {col.items_sent_to_sonarr}")
+                lines.append(f"- **Sync time:** {col.sync_duration_seconds:.1f}s")
+                if col.poster_duration_seconds > 0:
+                    lines.append(f"- **Poster time:** {col.poster_duration_seconds:.1f}s")
 
                 if col.added_titles:
                     lines.append("")
@@ -10,7 +10,10 @@ from typing import Optional
 from loguru import logger
 from rich.console import Console
 
+from jfc.clients.base import BaseClient
+from jfc.clients.cache import ResponseCache
 from jfc.clients.discord import DiscordWebhook
+from jfc.clients.id_map import IdMapStore
 from jfc.clients.jellyfin import JellyfinClient
 from jfc.clients.radarr import RadarrClient
 from jfc.clients.sonarr import SonarrClient
@@ -19,13 +22,19 @@ from jfc.clients.signal import NotificationContext as SignalNotificationContext
 from jfc.clients.signal import TrendingItem as SignalTrendingItem
 from jfc.clients.telegram import NotificationContext, TelegramClient, TrendingItem
 from jfc.clients.tmdb import TMDbClient
+from jfc.clients.ratelimit import configure_rate_limits, get_rate_limiters
+from jfc.clients.retry import RetryPolicy
 from jfc.clients.trakt import TraktClient
+from jfc.clients.transport import get_transport
 from jfc.core.config import Settings
-from jfc.models.collection import CollectionSchedule, ScheduleType
+from jfc.models.collection import Collection, CollectionConfig, CollectionSchedule, ScheduleType
 from jfc.models.media import MediaType
 from jfc.models.report import CollectionReport, LibraryReport, RunReport
 from jfc.parsers.kometa import KometaParser
 from jfc.services.collection_builder import CollectionBuilder
+from jfc.services.collection_state import CollectionStateStore
+from jfc.services.library_snapshot import LibrarySnapshotStore
+from jfc.services.library_watcher import LibraryWatcher
 from jfc.services.poster_generator import PosterGenerator
 from jfc.services.report_generator import ReportGenerator
 from jfc.services.startup import StartupService
@@ -45,10 +54,21 @@ class Runner:
         self.settings = settings
         self.dry_run = settings.dry_run
 
+        # Configure the shared connection pool used by every client
+        get_transport().configure(
+            max_connections=settings.http.max_connections,
+            max_keepalive_connections=settings.http.max_keepalive_connections,
+            keepalive_expiry=settings.http.keepalive_expiry,
+            http2=settings.http.http2,
+        )
+        configure_rate_limits(settings.http.rate_limits)
+
         # Initialize clients
         self.jellyfin = JellyfinClient(
             url=settings.jellyfin.url,
             api_key=settings.jellyfin.api_key,
+            collection_chunk_size=settings.jellyfin.collection_chunk_size,
+            collection_write_concurrency=settings.jellyfin.collection_write_concurrency,
         )
 
         self.tmdb = TMDbClient(
@@ -115,6 +135,23 @@ class Runner:
             )
             logger.info(f"Signal notifications enabled ({len(settings.signal.notifications)} notification(s))")
 
+        # Apply retry policy to every API client
+        for client in self._api_clients():
+            client.retry_policy = self._retry_policy()
+
+        # Disk cache for TMDb/Trakt list responses
+        self.response_cache: Optional[ResponseCache] = None
+        if settings.http.cache_enabled:
+            self.response_cache = ResponseCache(
+                db_path=settings.get_cache_path() / "http_cache.sqlite",
+                max_bytes=settings.http.cache_max_size_mb * 1024 * 1024,
+            )
+            self.tmdb.response_cache = self.response_cache
+
+        # Persistent TMDb/TVDB/IMDb ID map (skips TVDB lookups for known series)
+        self.id_map = IdMapStore(settings.get_cache_path() / "id_map.sqlite")
+        self.tmdb.id_map = self.id_map
+
         # Initialize parser
         self.parser = KometaParser(settings.config_path)
 
@@ -129,9 +166,27 @@ class Runner:
                 poster_history_limit=settings.openai.poster_history_limit,
                 prompt_history_limit=settings.openai.prompt_history_limit,
                 logo_text=settings.openai.poster_logo_text,
+                batch_signatures=settings.openai.batch_signatures,
+                signature_cache_max_entries=settings.openai.signature_cache_max_entries,
+                signature_cache_max_age_days=settings.openai.signature_cache_max_age_days,
+                poster_max_age_days=settings.openai.poster_max_age_days,
             )
             logger.info("AI poster generation enabled")
 
+        # Persisted library index (delta loads on start)
+        self.library_snapshot: Optional[LibrarySnapshotStore] = None
+        if settings.jellyfin.library_snapshot:
+            self.library_snapshot = LibrarySnapshotStore(
+                settings.get_cache_path() / "library_snapshot.sqlite"
+            )
+
+        # Fingerprints of applied collection state (skip no-op writes)
+        self.collection_state: Optional[CollectionStateStore] = None
+        if settings.jellyfin.collection_state:
+            self.collection_state = CollectionStateStore(
+                settings.get_cache_path() / "collection_state.json"
+            )
+
         # Initialize builder
         self.builder = CollectionBuilder(
             jellyfin=self.jellyfin,
@@ -141,7 +196,15 @@ class Runner:
             sonarr=self.sonarr,
             poster_generator=self.poster_generator,
             dry_run=self.dry_run,
+            library_snapshot=self.library_snapshot,
+            library_ttl=settings.jellyfin.library_ttl,
+            reorder_rewrite_threshold=settings.runner.reorder_rewrite_threshold,
+            collection_state=self.collection_state,
+            poster_concurrency=settings.runner.poster_concurrency,
+            poster_queue_size=settings.runner.poster_queue_size,
+            poster_attempts=settings.runner.poster_attempts,
         )
+        self.library_watcher: Optional[LibraryWatcher] = None
 
         # Initialize report generator
         self.report_generator = ReportGenerator(
@@ -170,6 +233,7 @@ class Runner:
         force_posters: bool | None = None,
         posters_only: bool = False,
         ignore_schedule: bool = False,
+        smart_posters: bool = False,
     ) -> RunReport:
         """
         Run collection updates.
@@ -181,6 +245,7 @@ class Runner:
             force_posters: Force regeneration of all posters
             posters_only: Only generate posters, skip collection sync
             ignore_schedule: Ignore individual collection schedules and process all
+            smart_posters: Regenerate existing posters only if their inputs changed
 
         Returns:
             RunReport with detailed statistics
@@ -198,6 +263,8 @@ class Runner:
                     client_secret=self.settings.trakt.client_secret,
                     access_token=access_token,
                 )
+                self.trakt.retry_policy = self._retry_policy()
+                self.trakt.response_cache = self.response_cache
                 # Update builder with Trakt client
                 self.builder.trakt = self.trakt
                 logger.info("Trakt client initialized with valid token")
@@ -213,6 +280,23 @@ class Runner:
                 logger.error("Startup failed - aborting run")
                 raise RuntimeError("Startup failed: required services not available")
 
+        # Retry budgets and counters are per run
+        for client in self._api_clients():
+            client.retry_stats.reset()
+        for bucket in get_rate_limiters():
+            bucket.stats.reset()
+        if self.response_cache:
+            self.response_cache.stats.reset()
+
+        # Items missing last run may have been added since
+        self.builder.matcher.clear_cache()
+        # Collections may have been edited in Jellyfin between runs
+        self.builder.collections.invalidate()
+        # Radarr/Sonarr profiles, tags and libraries may have changed too
+        for arr in (self.radarr, self.sonarr):
+            if arr:
+                arr.reset_cache()
+
         # Initialize run report
         run_report = RunReport(
             run_id=str(uuid.uuid4())[:8],
@@ -245,7 +329,12 @@ class Runner:
         jellyfin_libraries = await self.jellyfin.get_libraries()
         library_id_map = {lib["Name"]: lib["ItemId"] for lib in jellyfin_libraries}
 
-        # Process each library
+        # Build one task per collection; libraries and collections run
+        # concurrently within global and per-library limits
+        global_limit = asyncio.Semaphore(max(1, self.settings.runner.max_concurrent_collections))
+        library_limits = self.parser.get_library_concurrency()
+        library_tasks: list[tuple[LibraryReport, list[asyncio.Task]]] = []
+
         for library_name, collection_configs in all_collections.items():
             logger.info(f"Processing library: {library_name}")
 
@@ -272,9 +361,14 @@ class Runner:
                     error_message=f"Library '{library_name}' not found in Jellyfin",
                 )
                 library_report.collections.append(error_report)
-                run_report.libraries.append(library_report)
+                library_tasks.append((library_report, []))
                 continue
 
+            library_limit = asyncio.Semaphore(
+                max(1, library_limits.get(library_name) or self.settings.runner.max_concurrent_collections)
+            )
+            tasks = []
+
             # Process collections
             for config in collection_configs:
                 # Filter by specified collections
@@ -286,98 +380,50 @@ class Runner:
                     logger.debug(f"Skipping '{config.name}' - not scheduled for today")
                     continue
 
-                try:
-                    # Build collection
-                    collection, col_report = await self.builder.build_collection(
+                tasks.append(asyncio.create_task(
+                    self._run_collection(
                         config=config,
                         library_name=library_name,
                         library_id=library_id,
                         media_type=media_type,
-                    )
-
-                    # Collect trending items for Telegram notification
-                    if self.telegram and "tendances" in config.name.lower():
-                        category = "series" if media_type == MediaType.SERIES else "films"
-                        # Use collection.items (matched items) for availability info
-                        matched_ids = {i.tmdb_id for i in collection.items if i.matched}
-
-                        # Take more items to ensure we have enough after filtering
-                        for item in collection.source_items[:20]:
-                            # Convert genres to strings
-                            genre_strs = []
-                            if item.genres:
-                                for g in item.genres[:2]:
-                                    if isinstance(g, int):
-                                        from jfc.services.poster_generator import TMDB_GENRES
-                                        genre_strs.append(TMDB_GENRES.get(g, ""))
-                                    else:
-                                        genre_strs.append(str(g))
-                            genre_strs = [g for g in genre_strs if g]  # Remove empty
-
-                            trending_items[category].append(TrendingItem(
-                                title=item.title,
-                                year=item.year,
-                                genres=genre_strs if genre_strs else None,
-                                poster_url=TelegramClient.build_poster_url(item.poster_path),
-                                tmdb_id=item.tmdb_id,
-                                available=item.tmdb_id in matched_ids,
-                            ))
-
-                    # Sync to Jellyfin (or just posters if posters_only mode)
-                    added, removed, poster_path = await self.builder.sync_collection(
-                        collection=collection,
-                        report=col_report,
-                        media_type=media_type,
-                        add_missing_to_arr=not posters_only,  # Skip arr sync in posters_only mode
-                        force_poster=force_posters,
+                        limits=(library_limit, global_limit),
+                        force_posters=force_posters,
                         posters_only=posters_only,
-                    )
-
-                    col_report.success = True
-                    library_report.collections.append(col_report)
-
-                    # Send rich collection report with poster
-                    await self.discord.send_collection_report(
-                        collection_name=config.name,
-                        library=library_name,
-                        source_provider=col_report.source_provider,
-                        items_fetched=col_report.items_fetched,
-                        items_after_filters=col_report.items_after_filter,
-                        items_matched=col_report.items_matched,
-                        items_missing=col_report.items_missing,
-                        match_rate=col_report.match_rate,
-                        items_added=added,
-                        items_removed=removed,
-                        radarr_requests=col_report.items_sent_to_radarr,
-                        sonarr_requests=col_report.items_sent_to_sonarr,
-                        matched_titles=col_report.matched_titles,
-                        added_titles=col_report.added_titles,
-                        missing_titles=col_report.missing_titles,
-                        radarr_titles=col_report.radarr_titles,
-                        sonarr_titles=col_report.sonarr_titles,
-                        poster_path=poster_path,
-                        success=True,
-                    )
-
-                except Exception as e:
-                    logger.error(f"Error processing collection '{config.name}': {e}")
-
-                    # Create error report
-                    error_report = CollectionReport(
-                        name=config.name,
-                        library=library_name,
-                        schedule=config.schedule.schedule_type.value,
-                        source_provider="N/A",
-                        success=False,
-                        error_message=str(e),
-                    )
-                    library_report.collections.append(error_report)
-
-                    await self.discord.send_error(
-                        title=f"Collection Error: {config.name}",
-                        message=str(e),
-                    )
-
+                        smart_posters=smart_posters,
+                    ),
+                    name=f"collection:{library_name}/{config.name}",
+                ))
+
+            library_tasks.append((library_report, tasks))
+
+        # Wait for all collections, then assemble reports in config order
+        sync_start = time.perf_counter()
+        await asyncio.gather(*(t for _, tasks in library_tasks for t in tasks))
+        run_report.sync_duration_seconds = time.perf_counter() - sync_start
+
+        # Missing titles of all collections are submitted together, while
+        # queued posters finish in the background
+        poster_start = time.perf_counter()
+        arr_result, poster_result = await asyncio.gather(
+            self.builder.flush_arr(),
+            self.builder.flush_posters(),
+            return_exceptions=True,
+        )
+        if isinstance(arr_result, Exception):
+            logger.error(f"Failed to submit missing items to Radarr/Sonarr: {arr_result}")
+        if isinstance(poster_result, Exception):
+            logger.error(f"Failed to process collection posters: {poster_result}")
+        run_report.poster_duration_seconds = time.perf_counter() - poster_start
+
+        for library_report, tasks in library_tasks:
+            for task in tasks:
+                col_report, col_trending = task.result()
+                library_report.collections.append(col_report)
+                if col_report.success:
+                    await self._send_collection_report(col_report)
+                if col_trending:
+                    category = "series" if library_report.media_type == MediaType.SERIES.value else "films"
+                    trending_items[category].extend(col_trending)
             run_report.libraries.append(library_report)
 
         # Finalize report
@@ -487,11 +533,209 @@ class Runner:
             f"+{run_report.total_items_added} -{run_report.total_items_removed} items, "
             f"{run_report.failed_collections} errors"
         )
+        self._log_http_stats()
+        if self.collection_state:
+            self.collection_state.save()
 
         return run_report
 
+    async def _run_collection(
+        self,
+        config: CollectionConfig,
+        library_name: str,
+        library_id: str,
+        media_type: MediaType,
+        limits: tuple[asyncio.Semaphore, ...],
+        force_posters: bool,
+        posters_only: bool,
+        smart_posters: bool = False,
+    ) -> tuple[CollectionReport, list[TrendingItem]]:
+        """
+        Process one collection in isolation.
+
+        Waits for a slot in every limit (per-library first, then global),
+        applies the per-collection timeout and turns any failure into an
+        error report so other collections are unaffected.
+
+        Args:
+            config: Collection configuration
+            library_name: Library name
+            library_id: Jellyfin library ID
+            media_type: Library media type
+            limits: Semaphores bounding concurrency
+            force_posters: Force regeneration of posters
+            posters_only: Only generate posters, skip collection sync
+            smart_posters: Regenerate existing posters only if their inputs changed
+
+        Returns:
+            Tuple of (collection report, trending items for notifications)
+        """
+        library_limit, global_limit = limits
+        timeout = self.settings.runner.collection_timeout or None
+
+        async with library_limit, global_limit:
+            try:
+                return await asyncio.wait_for(
+                    self._process_collection(
+                        config=config,
+                        library_name=library_name,
+                        library_id=library_id,
+                        media_type=media_type,
+                        force_posters=force_posters,
+                        posters_only=posters_only,
+                        smart_posters=smart_posters,
+                    ),
+                    timeout=timeout,
+                )
+            except Exception as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    message = f"Timed out after {timeout:g}s"
+                else:
+                    message = str(e)
+
+                logger.error(f"Error processing collection '{config.name}': {message}")
+
+                # Create error report
+                error_report = CollectionReport(
+                    name=config.name,
+                    library=library_name,
+                    schedule=config.schedule.schedule_type.value,
+                    source_provider="N/A",
+                    success=False,
+                    error_message=message,
+                )
+
+                await self.discord.send_error(
+                    title=f"Collection Error: {config.name}",
+                    message=message,
+                )
+
+                return error_report, []
+
+    async def _process_collection(
+        self,
+        config: CollectionConfig,
+        library_name: str,
+        library_id: str,
+        media_type: MediaType,
+        force_posters: bool,
+        posters_only: bool,
+        smart_posters: bool = False,
+    ) -> tuple[CollectionReport, list[TrendingItem]]:
+        """
+        Build, sync and report a single collection.
+
+        Args:
+            config: Collection configuration
+            library_name: Library name
+            library_id: Jellyfin library ID
+            media_type: Library media type
+            force_posters: Force regeneration of posters
+            posters_only: Only generate posters, skip collection sync
+            smart_posters: Regenerate existing posters only if their inputs changed
+
+        Returns:
+            Tuple of (collection report, trending items for notifications)
+        """
+        # Build collection
+        collection, col_report = await self.builder.build_collection(
+            config=config,
+            library_name=library_name,
+            library_id=library_id,
+            media_type=media_type,
+        )
+
+        # Collect trending items for Telegram notification
+        trending: list[TrendingItem] = []
+        if self.telegram and "tendances" in config.name.lower():
+            trending = self._trending_items(collection)
+
+        # Sync to Jellyfin (or just posters if posters_only mode); the poster
+        # is uploaded in the background and set on the report when done
+        await self.builder.sync_collection(
+            collection=collection,
+            report=col_report,
+            media_type=media_type,
+            add_missing_to_arr=not posters_only,  # Skip arr sync in posters_only mode
+            force_poster=force_posters,
+            posters_only=posters_only,
+            smart_poster=smart_posters,
+        )
+
+        col_report.success = True
+
+        return col_report, trending
+
+    async def _send_collection_report(self, col_report: CollectionReport) -> None:
+        """Send the rich Discord report of a synced collection."""
+        await self.discord.send_collection_report(
+            collection_name=col_report.name,
+            library=col_report.library,
+            source_provider=col_report.source_provider,
+            items_fetched=col_report.items_fetched,
+            items_after_filters=col_report.items_after_filter,
+            items_matched=col_report.items_matched,
+            items_missing=col_report.items_missing,
+            match_rate=col_report.match_rate,
+            items_added=col_report.items_added_to_collection,
+            items_removed=col_report.items_removed_from_collection,
+            radarr_requests=col_report.items_sent_to_radarr,
+            sonarr_requests=col_report.items_sent_to_sonarr,
+            matched_titles=col_report.matched_titles,
+            added_titles=col_report.added_titles,
+            missing_titles=col_report.missing_titles,
+            radarr_titles=col_report.radarr_titles,
+            sonarr_titles=col_report.sonarr_titles,
+            poster_path=col_report.poster_path,
+            success=True,
+        )
+
+    def _trending_items(self, collection: Collection) -> list[TrendingItem]:
+        """Convert a collection's source items to Telegram trending items."""
+        from jfc.services.poster_generator import TMDB_GENRES
+
+        # Use collection.items (matched items) for availability info
+        matched_ids = {i.tmdb_id for i in collection.items if i.matched}
+        trending = []
+
+        # Take more items to ensure we have enough after filtering
+        for item in collection.source_items[:20]:
+            # Convert genres to strings
+            genre_strs = []
+            if item.genres:
+                for g in item.genres[:2]:
+                    if isinstance(g, int):
+                        genre_strs.append(TMDB_GENRES.get(g, ""))
+                    else:
+                        genre_strs.append(str(g))
+            genre_strs = [g for g in genre_strs if g]  # Remove empty
+
+            trending.append(TrendingItem(
+                title=item.title,
+                year=item.year,
+                genres=genre_strs if genre_strs else None,
+                poster_url=TelegramClient.build_poster_url(item.poster_path),
+                tmdb_id=item.tmdb_id,
+                available=item.tmdb_id in matched_ids,
+            ))
+
+        return trending
+
+    def start_library_watcher(self) -> None:
+        """Keep the matcher index fresh from Jellyfin events (daemon mode)."""
+        if not self.settings.jellyfin.watch_library or self.library_watcher:
+            return
+        self.library_watcher = LibraryWatcher(
+            url=self.settings.jellyfin.url,
+            api_key=self.settings.jellyfin.api_key,
+            matcher=self.builder.matcher,
+        )
+        self.library_watcher.start()
+
     async def close(self) -> None:
         """Close all client connections."""
+        if self.library_watcher:
+            await self.library_watcher.stop()
         await self.jellyfin.close()
         await self.tmdb.close()
         if self.trakt:
@@ -500,6 +744,68 @@ class Runner:
             await self.radarr.close()
         if self.sonarr:
             await self.sonarr.close()
+        await get_transport().aclose()
+        if self.response_cache:
+            self.response_cache.close()
+        self.id_map.close()
+        if self.poster_generator:
+            self.poster_generator.close()
+        if self.library_snapshot:
+            self.library_snapshot.close()
+        if self.collection_state:
+            self.collection_state.save()
+
+    def _api_clients(self) -> list[BaseClient]:
+        """Get all active API clients."""
+        clients: list[Optional[BaseClient]] = [
+            self.jellyfin, self.tmdb, self.trakt, self.radarr, self.sonarr,
+        ]
+        return [c for c in clients if c is not None]
+
+    def _retry_policy(self) -> RetryPolicy:
+        """Build retry policy from settings."""
+        http = self.settings.http
+        return RetryPolicy(
+            max_attempts=http.retry_max_attempts,
+            backoff_base=http.retry_backoff_base,
+            backoff_max=http.retry_backoff_max,
+            budget=http.retry_budget,
+        )
+
+    def _log_http_stats(self) -> None:
+        """Log per-client HTTP counters and rate-limit queue waits for the run."""
+        for client in self._api_clients():
+            retry_stats = client.retry_stats
+            if not retry_stats.requests:
+                continue
+            logger.info(
+                f"[{client.__class__.__name__}] {retry_stats.requests} requests, "
+                f"{retry_stats.coalesced} coalesced, {retry_stats.retries} retries, "
+                f"{retry_stats.backoff_seconds:.1f}s backing off"
+                + (
+                    f", budget exhausted {retry_stats.budget_exhausted}x"
+                    if retry_stats.budget_exhausted
+                    else ""
+                )
+            )
+
+        for bucket in get_rate_limiters():
+            bucket_stats = bucket.stats
+            if not bucket_stats.delayed:
+                continue
+            logger.info(
+                f"[RateLimit:{bucket.name}] {bucket_stats.delayed}/{bucket_stats.acquired} "
+                f"requests queued, waited {bucket_stats.wait_seconds:.1f}s "
+                f"(max {bucket_stats.max_wait_seconds:.2f}s)"
+            )
+
+        if self.response_cache:
+            cache_stats = self.response_cache.stats
+            if cache_stats.hits or cache_stats.misses:
+                logger.info(
+                    f"[Cache] {cache_stats.hits} hits, {cache_stats.revalidated} revalidated, "
+                    f"{cache_stats.misses} misses, {cache_stats.evicted} evicted"
+                )
 
     def _infer_media_type(self, library_name: str) -> MediaType:
         """Infer media type from library name."""
@@ -0,0 +1,155 @@
+"""Persistent store of generated visual signatures (SQLite)."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from loguru import logger
+
+# (media type, TMDb ID)
+SignatureKey = tuple[str, int]
+
+
+class SignatureStore:
+    """
+    Visual signatures keyed by TMDb ID and media type.
+
+    Each write is its own transaction, so parallel poster jobs (or another
+    process sharing the cache directory) only ever add rows. Entries older
+    than max_age_days are ignored and evicted, and the oldest entries are
+    dropped once the store holds more than max_entries.
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = 5000, max_age_days: float = 180):
+        """
+        Initialize store.
+
+        Args:
+            db_path: SQLite database file
+            max_entries: Signatures kept (0 = unlimited)
+            max_age_days: Days before a signature is regenerated (0 = never)
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS signatures (
+                    media_type TEXT NOT NULL,
+                    tmdb_id INTEGER NOT NULL,
+                    title TEXT NOT NULL,
+                    signature TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (media_type, tmdb_id)
+                );
+                CREATE INDEX IF NOT EXISTS signatures_created ON signatures (created_at);
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _min_created_at(self) -> float:
+        """Creation time below which entries are expired."""
+        if self.max_age_days <= 0:
+            return 0.0
+        return time.time() - self.max_age_days * 86400
+
+    def __len__(self) -> int:
+        """Number of stored signatures."""
+        try:
+            with self._lock:
+                return int(self._connect().execute("SELECT COUNT(*) FROM signatures").fetchone()[0])
+        except sqlite3.Error:
+            return 0
+
+    def get_many(self, keys: Iterable[SignatureKey]) -> dict[SignatureKey, str]:
+        """
+        Get stored signatures.
+
+        Args:
+            keys: (media type, TMDb ID) pairs
+
+        Returns:
+            Signatures found and not expired, by key
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        min_created_at = self._min_created_at()
+        found: dict[SignatureKey, str] = {}
+        try:
+            with self._lock:
+                conn = self._connect()
+                for media_type, tmdb_id in keys:
+                    row = conn.execute(
+                        "SELECT signature FROM signatures "
+                        "WHERE media_type = ? AND tmdb_id = ? AND created_at >= ?",
+                        (media_type, tmdb_id, min_created_at),
+                    ).fetchone()
+                    if row:
+                        found[(media_type, tmdb_id)] = row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Ignoring unreadable signature store: {e}")
+        return found
+
+    def put_many(self, entries: Iterable[tuple[SignatureKey, str, str]]) -> None:
+        """
+        Store signatures, then evict expired and excess entries.
+
+        Args:
+            entries: ((media type, TMDb ID), title, signature) tuples
+        """
+        now = time.time()
+        rows = [
+            (media_type, tmdb_id, title, signature, now)
+            for (media_type, tmdb_id), title, signature in entries
+        ]
+        if not rows:
+            return
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO signatures "
+                        "(media_type, tmdb_id, title, signature, created_at) VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._evict(conn)
+            logger.debug(f"Saved {len(rows)} signatures to store")
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to save signatures: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete expired entries and the oldest ones above max_entries."""
+        if self.max_age_days > 0:
+            conn.execute("DELETE FROM signatures WHERE created_at < ?", (self._min_created_at(),))
+        if self.max_entries > 0:
+            conn.execute(
+                """
+                DELETE FROM signatures WHERE rowid IN (
+                    SELECT rowid FROM signatures ORDER BY created_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -246,9 +246,10 @@ class StartupService:
                 # Load library into matcher cache
                 await matcher._ensure_library_loaded(lib_id, media_type)
 
-                item_count = len(matcher._library_items.get(lib_id, {}))
+                index = matcher.get_library_index(lib_id)
+                item_count = len(index) if index else 0
                 stats[lib_name] = item_count
-                logger.success(f"  ✓ {lib_name}: {item_count} items with TMDb IDs")
+                logger.success(f"  ✓ {lib_name}: {item_count} items indexed")
 
             except Exception as e:
                 logger.error(f"  ✗ {lib_name}: {e}")
@@ -74,18 +74,17 @@ async def main():
             print(f"\nPoster generated: {result}")
 
             # Check the cache
-            cache_path = Path("config/posters/visual_signatures_cache.json")
-            if cache_path.exists():
-                import json
-                with open(cache_path) as f:
-                    cache = json.load(f)
-                print(f"\nCached signatures ({len(cache)} items):")
-                for title, sig in list(cache.items())[:3]:
-                    print(f"  - {title}: {sig[:60]}...")
+            cached = poster_gen.signatures_cache.get_many(
+                (item.media_type.value, item.tmdb_id) for item in unknown_items
+            )
+            print(f"\nCached signatures ({len(cached)} items):")
+            for (_, tmdb_id), sig in list(cached.items())[:3]:
+                print(f"  - {tmdb_id}: {sig[:60]}...")
         else:
             print("\nFailed to generate poster")
 
     finally:
+        poster_gen.close()
         await tmdb.close()
 
 
@@ -0,0 +1,100 @@
+"""Unit tests for Radarr and Sonarr clients."""
+
+import httpx
+import pytest
+
+from jfc.clients.radarr import RadarrClient
+from jfc.clients.sonarr import SonarrClient
+
+
+def paged(params: dict, records: list[dict]) -> httpx.Response:
+    """Serve one page of a paged *arr resource."""
+    page, size = params["page"], params["pageSize"]
+    body = {
+        "page": page,
+        "totalRecords": len(records),
+        "records": records[(page - 1) * size : page * size],
+    }
+    return httpx.Response(200, json=body)
+
+
+def make_client(client_cls, routes: dict):
+    """Create a client whose requests are served from routes."""
+    client = client_cls("http://test", "key")
+    client.calls = []
+
+    async def perform(method, endpoint, params=None, json=None, **kwargs):
+        client.calls.append(endpoint)
+        response = routes[endpoint](params or {})
+        response.request = httpx.Request(method, f"http://test{endpoint}")
+        return response
+
+    client._perform_request = perform
+    return client
+
+
+class TestBlocklist:
+    """Tests for blocklist loading."""
+
+    @pytest.mark.asyncio
+    async def test_radarr_blocklist_all_pages_one_listing(self):
+        """All blocklist pages are read and IDs resolved from one movie listing."""
+        blocklist = [{"movieId": i % 3 + 1} for i in range(5)]
+        movies = [{"id": 1, "tmdbId": 101}, {"id": 2, "tmdbId": 102}, {"id": 4, "tmdbId": 104}]
+        client = make_client(RadarrClient, {
+            "/api/v3/blocklist": lambda p: paged(p, blocklist),
+            "/api/v3/movie": lambda p: httpx.Response(200, json=movies),
+        })
+
+        client_blocklist = await client.get_blocklist(page_size=2)
+        assert len(client_blocklist) == 5
+
+        assert await client.load_blocklist() == {101, 102}
+        assert await client.is_blocklisted(101)
+        assert client.calls.count("/api/v3/movie") == 1
+
+    @pytest.mark.asyncio
+    async def test_sonarr_empty_blocklist_skips_listing(self):
+        """No series listing is needed when nothing is blocklisted."""
+        client = make_client(SonarrClient, {
+            "/api/v3/blocklist": lambda p: paged(p, []),
+        })
+
+        assert await client.load_blocklist() == set()
+        assert client.calls == ["/api/v3/blocklist"]
+
+
+class TestMetadataCache:
+    """Tests for the per-run Radarr/Sonarr metadata cache."""
+
+    @pytest.mark.asyncio
+    async def test_lookups_by_name_after_warm_up(self):
+        """Profiles and tags resolve per name from one fetch each."""
+        client = make_client(RadarrClient, {
+            "/api/v3/qualityprofile": lambda p: httpx.Response(
+                200, json=[{"name": "HD-1080p", "id": 1}, {"name": "Ultra-HD", "id": 2}]
+            ),
+            "/api/v3/rootfolder": lambda p: httpx.Response(200, json=[{"path": "/movies"}]),
+            "/api/v3/tag": lambda p: httpx.Response(
+                200, json=[{"label": "jfc", "id": 5}, {"label": "kids", "id": 6}]
+            ),
+            "/api/v3/movie": lambda p: httpx.Response(200, json=[{"id": 1, "tmdbId": 101}]),
+            "/api/v3/exclusions": lambda p: httpx.Response(200, json=[]),
+            "/api/v3/blocklist": lambda p: paged(p, []),
+        })
+
+        await client.warm_up()
+        calls = len(client.calls)
+
+        assert await client.get_quality_profile_id("HD-1080p") == 1
+        assert await client.get_quality_profile_id("ultra-hd") == 2
+        assert await client.get_or_create_tag("jfc") == 5
+        assert await client.get_or_create_tag("kids") == 6
+        assert await client.get_root_folder_path("/movies") == "/movies"
+        assert await client.movie_exists(101)
+        assert not await client.movie_exists(102)
+        assert len(client.calls) == calls
+
+        client.reset_cache()
+        assert await client.get_quality_profile_id("HD-1080p") == 1
+        assert len(client.calls) == calls + 1
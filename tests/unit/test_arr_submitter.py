@@ -0,0 +1,103 @@
+"""Unit tests for ArrSubmitter."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from jfc.models.collection import Collection, CollectionConfig, CollectionItem
+from jfc.models.report import CollectionReport
+from jfc.services.arr_submitter import ArrSubmitter
+
+
+def make_collection(name: str, items: list[CollectionItem], **config) -> Collection:
+    """Create a synced collection."""
+    return Collection(
+        config=CollectionConfig(name=name, **config),
+        library_name="Films",
+        items=items,
+    )
+
+
+def make_report(name: str) -> CollectionReport:
+    """Create an empty collection report."""
+    return CollectionReport(name=name, library="Films", schedule="daily", source_provider="TMDb")
+
+
+@pytest.fixture
+def radarr():
+    """Create a mock Radarr client that adds every prepared movie."""
+    client = MagicMock()
+    client.default_tag = "jfc"
+    client.warm_up = AsyncMock()
+    client.prepare_movie = AsyncMock(
+        side_effect=lambda tmdb_id, **kwargs: {"tmdbId": tmdb_id, **kwargs}
+    )
+    client.import_movies = AsyncMock(side_effect=lambda movies, chunk_size: movies)
+    return client
+
+
+@pytest.fixture
+def sonarr():
+    """Create a mock Sonarr client that adds every prepared series."""
+    client = MagicMock()
+    client.default_tag = "jfc"
+    client.warm_up = AsyncMock()
+    client.prepare_series = AsyncMock(
+        side_effect=lambda tvdb_id, **kwargs: {"tvdbId": tvdb_id, **kwargs}
+    )
+    client.import_series = AsyncMock(side_effect=lambda series, chunk_size: series)
+    return client
+
+
+class TestArrSubmitter:
+    """Tests for run-wide Radarr/Sonarr submission."""
+
+    @pytest.mark.asyncio
+    async def test_title_missing_from_several_collections_is_sent_once(self, radarr):
+        """A shared missing movie is submitted once and credited to each collection."""
+        submitter = ArrSubmitter(tmdb=MagicMock(), radarr=radarr)
+        dune = CollectionItem(title="Dune", tmdb_id=1, media_type="movie")
+        owned = CollectionItem(title="Owned", tmdb_id=2, media_type="movie", in_library=True)
+        reports = [make_report("A"), make_report("B")]
+
+        submitter.queue_collection(make_collection("A", [dune, owned]), reports[0])
+        submitter.queue_collection(make_collection("B", [dune], radarr_tag="kids"), reports[1])
+
+        assert await submitter.flush() == (1, 0)
+
+        radarr.prepare_movie.assert_called_once()
+        assert radarr.prepare_movie.call_args.kwargs["tags"] == ["jfc", "kids"]
+        assert [r.radarr_titles for r in reports] == [["Dune"], ["Dune"]]
+        assert [r.items_sent_to_radarr for r in reports] == [1, 1]
+        assert len(submitter) == 0
+
+    @pytest.mark.asyncio
+    async def test_series_tvdb_ids_resolved_from_tmdb(self, sonarr):
+        """Series without TVDB ID are resolved and merged when they share one."""
+        tmdb = MagicMock()
+        tmdb.get_tvdb_id = AsyncMock(return_value=42)
+        submitter = ArrSubmitter(tmdb=tmdb, sonarr=sonarr)
+        by_tmdb = CollectionItem(title="Show", tmdb_id=7, media_type="series")
+        by_tvdb = CollectionItem(title="Show", tvdb_id=42, media_type="series")
+        report = make_report("A")
+
+        submitter.queue_collection(make_collection("A", [by_tmdb, by_tvdb]), report)
+
+        assert await submitter.flush() == (0, 1)
+        sonarr.prepare_series.assert_called_once()
+        assert report.sonarr_titles == ["Show"]
+
+    @pytest.mark.asyncio
+    async def test_skipped_titles_are_not_reported(self, radarr):
+        """Excluded or existing movies (nothing prepared) are not reported as sent."""
+        radarr.prepare_movie = AsyncMock(return_value=None)
+        submitter = ArrSubmitter(tmdb=MagicMock(), radarr=radarr)
+        report = make_report("A")
+
+        submitter.queue_collection(
+            make_collection("A", [CollectionItem(title="Dune", tmdb_id=1, media_type="movie")]),
+            report,
+        )
+
+        assert await submitter.flush() == (0, 0)
+        assert report.items_sent_to_radarr == 0
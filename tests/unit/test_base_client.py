@@ -0,0 +1,63 @@
+"""Unit tests for BaseClient request handling."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from jfc.clients.base import BaseClient
+
+
+@pytest.fixture
+def client():
+    """Create a BaseClient whose requests are counted."""
+    client = BaseClient("http://test")
+    client.calls = 0
+
+    async def perform(method, endpoint, params=None, json=None, **kwargs):
+        client.calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"endpoint": endpoint})
+
+    client._perform_request = perform
+    return client
+
+
+class TestSingleFlight:
+    """Tests for coalescing identical concurrent GETs."""
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_share_one_request(self, client):
+        """Concurrent identical GETs are sent once."""
+        responses = await asyncio.gather(
+            *(client.get("/items", params={"a": 1, "b": 2}) for _ in range(5))
+        )
+
+        assert client.calls == 1
+        assert all(r.json() == {"endpoint": "/items"} for r in responses)
+        assert client.retry_stats.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_not_shared(self, client):
+        """Different params produce separate requests."""
+        await asyncio.gather(
+            client.get("/items", params={"page": 1}),
+            client.get("/items", params={"page": 2}),
+        )
+
+        assert client.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_are_not_shared(self, client):
+        """Non-GET requests are never coalesced."""
+        await asyncio.gather(client.post("/items"), client.post("/items"))
+
+        assert client.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_gets_are_not_shared(self, client):
+        """Coalescing only applies to requests in flight at the same time."""
+        await client.get("/items")
+        await client.get("/items")
+
+        assert client.calls == 2
@@ -0,0 +1,128 @@
+"""Unit tests for collection reorder planning."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from jfc.models.collection import Collection, CollectionConfig, CollectionItem, CollectionOrder
+from jfc.models.report import CollectionReport
+from jfc.services.collection_builder import CollectionBuilder
+from jfc.services.collection_order import plan_reorder
+from jfc.services.collection_state import CollectionStateStore
+
+
+def apply(current: list[str], remove: list[str], append: list[str]) -> list[str]:
+    """Simulate Jellyfin: removals, then appends at the end."""
+    return [i for i in current if i not in remove] + append
+
+
+class TestPlanReorder:
+    """Tests for plan_reorder."""
+
+    def test_unchanged(self):
+        """Test an ordered collection needs no edits."""
+        plan = plan_reorder(["a", "b", "c"], ["a", "b", "c"])
+        assert plan.edits == 0
+        assert plan.kept == 3
+
+    def test_new_item_at_end(self):
+        """Test appending a new last item touches only that item."""
+        plan = plan_reorder(["a", "b", "c"], ["a", "b", "c", "d"])
+        assert (plan.remove, plan.append) == ([], ["d"])
+
+    def test_removed_item(self):
+        """Test a dropped item is removed without touching the others."""
+        plan = plan_reorder(["a", "b", "c"], ["a", "c"])
+        assert (plan.remove, plan.append) == (["b"], [])
+
+    def test_new_item_in_middle(self):
+        """Test inserting re-appends only the items after it."""
+        current = ["a", "b", "c", "d"]
+        target = ["a", "b", "x", "c", "d"]
+        plan = plan_reorder(current, target)
+
+        assert plan.kept == 2
+        assert plan.append == ["x", "c", "d"]
+        assert apply(current, plan.remove, plan.append) == target
+
+    def test_reversed(self):
+        """Test a fully reversed order still reaches the target."""
+        current = ["a", "b", "c"]
+        target = ["c", "b", "a"]
+        plan = plan_reorder(current, target)
+
+        assert apply(current, plan.remove, plan.append) == target
+
+
+def make_builder(listed: list[str], **kwargs) -> CollectionBuilder:
+    """Create a builder whose Jellyfin collection lists members in the given order."""
+    jellyfin = MagicMock()
+    jellyfin.get_collections = AsyncMock(return_value=[{"Id": "col", "Name": "Top"}])
+    jellyfin.get_collection_items = AsyncMock(return_value=listed)
+    jellyfin.add_to_collection = AsyncMock(return_value=True)
+    jellyfin.remove_from_collection = AsyncMock(return_value=True)
+    jellyfin.update_collection_metadata = AsyncMock(return_value=True)
+    builder = CollectionBuilder(jellyfin, MagicMock(), **kwargs)
+    builder.posters.submit = AsyncMock()
+    return builder
+
+
+def make_collection(item_ids: list[str]) -> tuple[Collection, CollectionReport]:
+    """Create a name-sorted collection whose titles match its item IDs."""
+    collection = Collection(
+        config=CollectionConfig(name="Top", collection_order=CollectionOrder.SORT_NAME),
+        library_name="Films",
+        items=[CollectionItem(title=i, jellyfin_id=i) for i in item_ids],
+    )
+    report = CollectionReport(name="Top", library="Films", schedule="daily", source_provider="TMDb")
+    return collection, report
+
+
+class TestSyncReorder:
+    """Tests for reordering during collection sync."""
+
+    @pytest.mark.asyncio
+    async def test_listing_order_is_not_trusted(self):
+        """Members listed in a different order than added are fully rewritten."""
+        # Added as b, a, c but listed by Jellyfin as a, b, c
+        builder = make_builder(["a", "b", "c"])
+        collection, report = make_collection(["a", "b", "c", "d"])
+
+        await builder.sync_collection(collection, report)
+
+        builder.jellyfin.remove_from_collection.assert_awaited_once_with("col", ["a", "b", "c"])
+        builder.jellyfin.add_to_collection.assert_awaited_once_with("col", ["a", "b", "c", "d"])
+
+    @pytest.mark.asyncio
+    async def test_recorded_order_is_used(self, tmp_path):
+        """The order recorded after the last write is planned against instead."""
+        state = CollectionStateStore(tmp_path / "state.json")
+        state.record_order("col", ["b", "a", "c"])
+        builder = make_builder(
+            ["a", "b", "c"], collection_state=state, reorder_rewrite_threshold=1.0
+        )
+        collection, report = make_collection(["a", "b", "c", "d"])
+
+        await builder.sync_collection(collection, report)
+
+        builder.jellyfin.remove_from_collection.assert_awaited_once_with("col", ["b", "c"])
+        builder.jellyfin.add_to_collection.assert_awaited_once_with("col", ["b", "c", "d"])
+        assert state.get_order("col") == ["a", "b", "c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_not_recorded(self, tmp_path):
+        """A failed chunk drops the recorded members and order instead of updating them."""
+        state = CollectionStateStore(tmp_path / "state.json")
+        state.record_order("col", ["b", "a", "c"])
+        state.record("col", CollectionStateStore.MEMBERS, "previous")
+        builder = make_builder(
+            ["a", "b", "c"], collection_state=state, reorder_rewrite_threshold=1.0
+        )
+        builder.jellyfin.add_to_collection = AsyncMock(return_value=False)
+        collection, report = make_collection(["a", "b", "c", "d"])
+
+        await builder.sync_collection(collection, report)
+
+        assert state.get("col", CollectionStateStore.MEMBERS) is None
+        assert state.get_order("col") is None
+        assert not builder.collections.get_by_id("col").ordered
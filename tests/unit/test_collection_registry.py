@@ -0,0 +1,71 @@
+"""Unit tests for CollectionRegistry."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from jfc.services.collection_registry import CollectionRegistry
+
+
+@pytest.fixture
+def mock_jellyfin():
+    """Create a mock Jellyfin client with two collections."""
+    client = MagicMock()
+    client.get_collections = AsyncMock(return_value=[
+        {"Id": "col-1", "Name": "Trending"},
+        {"Id": "col-2", "Name": "Popular"},
+    ])
+    client.get_collection_items = AsyncMock(
+        side_effect=lambda collection_id: {"col-1": ["a", "b"], "col-2": ["c"]}[collection_id]
+    )
+    client.create_collection = AsyncMock(return_value="col-3")
+    client.delete_collection = AsyncMock(return_value=True)
+    return client
+
+
+class TestCollectionRegistry:
+    """Tests for CollectionRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_load_once_with_members(self, mock_jellyfin):
+        """Test collections and members are loaded by a single listing."""
+        registry = CollectionRegistry(mock_jellyfin)
+
+        results = await asyncio.gather(
+            registry.get_or_create("Trending"),
+            registry.get_or_create("Popular"),
+        )
+
+        assert [(c.id, existed) for c, existed in results] == [("col-1", True), ("col-2", True)]
+        assert registry.get("Trending").member_ids == ["a", "b"]
+        assert registry.get_by_id("col-2").name == "Popular"
+        assert mock_jellyfin.get_collections.call_count == 1
+        assert mock_jellyfin.get_collection_items.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_and_delete_update_in_place(self, mock_jellyfin):
+        """Test created and deleted collections are tracked without reloading."""
+        registry = CollectionRegistry(mock_jellyfin)
+
+        created, existed = await registry.get_or_create("New")
+        again, existed_again = await registry.get_or_create("New")
+
+        assert (created.id, existed) == ("col-3", False)
+        assert again is created and existed_again
+        mock_jellyfin.create_collection.assert_called_once_with("New")
+
+        assert await registry.delete("col-1")
+        assert registry.get("Trending") is None
+        assert registry.get_by_id("col-1") is None
+        assert mock_jellyfin.get_collections.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reloads(self, mock_jellyfin):
+        """Test invalidate forces a fresh listing on next use."""
+        registry = CollectionRegistry(mock_jellyfin)
+        await registry.load()
+        registry.invalidate()
+        await registry.load()
+
+        assert mock_jellyfin.get_collections.call_count == 2
@@ -0,0 +1,49 @@
+"""Unit tests for the collection state store."""
+
+from jfc.services.collection_state import CollectionStateStore, fingerprint
+
+
+class TestFingerprint:
+    """Tests for fingerprint()."""
+
+    def test_stable_and_order_sensitive(self):
+        """Equal inputs give equal fingerprints; list order matters."""
+        assert fingerprint(["a", "b"], None) == fingerprint(["a", "b"], None)
+        assert fingerprint(["a", "b"]) != fingerprint(["b", "a"])
+
+
+class TestCollectionStateStore:
+    """Tests for CollectionStateStore."""
+
+    def test_record_and_reload(self, tmp_path):
+        """Recorded fingerprints survive a save and reload."""
+        path = tmp_path / "collection_state.json"
+        store = CollectionStateStore(path)
+        store.record("col-1", CollectionStateStore.METADATA, "abc")
+        store.save()
+
+        reloaded = CollectionStateStore(path)
+        assert reloaded.matches("col-1", CollectionStateStore.METADATA, "abc")
+        assert not reloaded.matches("col-1", CollectionStateStore.METADATA, "def")
+        assert reloaded.get("col-1", CollectionStateStore.POSTER) is None
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_forget(self, tmp_path):
+        """Forgotten fingerprints no longer match."""
+        store = CollectionStateStore(tmp_path / "collection_state.json")
+        store.record("col-1", CollectionStateStore.POSTER, "abc")
+        store.record("col-1", CollectionStateStore.MEMBERS, "def")
+
+        store.forget("col-1", CollectionStateStore.POSTER)
+        assert store.get("col-1", CollectionStateStore.POSTER) is None
+        assert store.matches("col-1", CollectionStateStore.MEMBERS, "def")
+
+        store.forget("col-1")
+        assert store.get("col-1", CollectionStateStore.MEMBERS) is None
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        """A corrupt state file starts an empty state."""
+        path = tmp_path / "collection_state.json"
+        path.write_text("{not json")
+
+        assert CollectionStateStore(path).get("col-1", CollectionStateStore.METADATA) is None
@@ -0,0 +1,88 @@
+"""Unit tests for the persistent TMDb/TVDB/IMDb ID map."""
+
+import httpx
+import pytest
+
+from jfc.clients.id_map import ExternalIds, IdMapStore
+from jfc.clients.tmdb import TMDbClient
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create an ID map in a temp directory."""
+    store = IdMapStore(tmp_path / "id_map.sqlite")
+    yield store
+    store.close()
+
+
+def make_client(store: IdMapStore, routes: dict) -> TMDbClient:
+    """Create a TMDb client whose requests are served from routes."""
+    client = TMDbClient("key")
+    client.id_map = store
+    client.calls = []
+
+    async def perform(method, endpoint, params=None, json=None, **kwargs):
+        client.calls.append(endpoint)
+        response = httpx.Response(200, json=routes[endpoint])
+        response.request = httpx.Request(method, f"http://test{endpoint}")
+        return response
+
+    client._perform_request = perform
+    return client
+
+
+class TestIdMapStore:
+    """Tests for the ID map store."""
+
+    def test_lookup_in_every_direction(self, store):
+        """A recorded title is found by any of its IDs."""
+        store.record("series", 1399, tvdb_id=121361, imdb_id="tt0944947")
+
+        expected = ExternalIds(1399, 121361, "tt0944947")
+        assert store.get("series", 1399) == expected
+        assert store.find_by_tvdb("series", 121361) == expected
+        assert store.find_by_imdb("series", "tt0944947") == expected
+        assert store.get("movie", 1399) is None
+
+    def test_unknown_ids_keep_known_values(self, store):
+        """A later response without an ID does not erase it."""
+        store.record("series", 1, tvdb_id=10)
+        store.record("series", 1, imdb_id="tt1")
+
+        assert store.get("series", 1) == ExternalIds(1, 10, "tt1")
+
+    def test_persists_across_instances(self, store, tmp_path):
+        """Entries are read back after reopening the database."""
+        store.record("movie", 603, imdb_id="tt0133093")
+        store.close()
+
+        reopened = IdMapStore(tmp_path / "id_map.sqlite")
+        assert reopened.get("movie", 603).imdb_id == "tt0133093"
+        reopened.close()
+
+
+class TestTvdbResolution:
+    """Tests for TVDB ID resolution through TMDb."""
+
+    @pytest.mark.asyncio
+    async def test_external_ids_fetched_once(self, store):
+        """A miss uses the external_ids endpoint; the next lookup is served from the map."""
+        client = make_client(store, {
+            "/tv/7/external_ids": {"id": 7, "tvdb_id": 42, "imdb_id": "tt7"},
+        })
+
+        assert await client.get_tvdb_id(7) == 42
+        assert await client.get_tvdb_id(7) == 42
+        assert client.calls == ["/tv/7/external_ids"]
+
+    @pytest.mark.asyncio
+    async def test_details_fill_the_map(self, store):
+        """IDs seen in a details response are recorded."""
+        client = make_client(store, {
+            "/tv/9": {"id": 9, "name": "Show", "external_ids": {"tvdb_id": 90}},
+        })
+
+        await client.get_series_details(9)
+
+        assert await client.get_tvdb_id(9) == 90
+        assert client.calls == ["/tv/9"]
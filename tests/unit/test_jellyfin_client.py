@@ -0,0 +1,114 @@
+"""Unit tests for JellyfinClient writes and uploads."""
+
+import asyncio
+import base64
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from jfc.clients.jellyfin import JellyfinClient
+
+
+@pytest.fixture
+def client():
+    """Create a JellyfinClient that records collection writes."""
+    client = JellyfinClient("http://test", "key", collection_chunk_size=2)
+    client.writes = []
+
+    async def perform(method, endpoint, params=None, json=None, **kwargs):
+        ids = params["Ids"].split(",")
+        await asyncio.sleep(0.01 if "a" in ids else 0)
+        client.writes.append((method, ids))
+        return httpx.Response(500 if "bad" in ids else 204)
+
+    client._perform_request = perform
+    return client
+
+
+class TestCollectionWrites:
+    """Tests for chunked collection membership writes."""
+
+    @pytest.mark.asyncio
+    async def test_add_is_chunked_in_order(self, client):
+        """Ordered adds are split into chunks sent one after another."""
+        assert await client.add_to_collection("col", ["a", "b", "c", "d", "e"])
+
+        assert client.writes == [
+            ("POST", ["a", "b"]),
+            ("POST", ["c", "d"]),
+            ("POST", ["e"]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_remove_reports_each_chunk(self, client):
+        """A failed chunk is reported without failing the others."""
+        results = await client.bulk_remove_from_collection("col", ["a", "b", "bad", "c"])
+
+        assert [(r.item_ids, r.ok) for r in results] == [
+            (["a", "b"], True),
+            (["bad", "c"], False),
+        ]
+        assert len(client.writes) == 2
+        assert not await client.remove_from_collection("col", ["bad"])
+
+
+class TestPosterUpload:
+    """Tests for streamed poster uploads."""
+
+    @pytest.mark.asyncio
+    async def test_body_is_streamed_base64(self, tmp_path):
+        """The poster is sent base64-encoded with an exact Content-Length."""
+        image = tmp_path / "poster.png"
+        image.write_bytes(bytes(range(256)) * 3000 + b"x")
+        sent = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent["headers"] = request.headers
+            sent["body"] = request.read()
+            return httpx.Response(204)
+
+        client = JellyfinClient("http://test", "key")
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client._get_client = AsyncMock(return_value=http)
+
+        assert await client.upload_collection_poster("col", image)
+        assert sent["body"] == base64.b64encode(image.read_bytes())
+        assert sent["headers"]["Content-Length"] == str(len(sent["body"]))
+        assert sent["headers"]["Content-Type"] == "image/png"
+        await http.aclose()
+
+
+class TestLibraryScan:
+    """Tests for paged library scans."""
+
+    @pytest.mark.asyncio
+    async def test_every_page_is_sorted(self):
+        """All concurrent pages request the same deterministic sort."""
+        client = JellyfinClient("http://test", "key")
+        requests = []
+
+        async def perform(method, endpoint, params=None, json=None, **kwargs):
+            requests.append(params)
+            start = params["StartIndex"]
+            items = [
+                {"Id": f"id{i}", "Name": f"Item {i}", "Type": "Movie"}
+                for i in range(start, min(start + params["Limit"], 5))
+            ]
+            response = httpx.Response(200, json={"Items": items, "TotalRecordCount": 5})
+            response.request = httpx.Request(method, f"http://test{endpoint}")
+            return response
+
+        client._perform_request = perform
+
+        ids = [
+            item.jellyfin_id
+            async for page in client.iter_library_items("lib", page_size=2)
+            for item in page
+        ]
+
+        assert sorted(ids) == [f"id{i}" for i in range(5)]
+        assert sorted(p["StartIndex"] for p in requests) == [0, 2, 4]
+        for params in requests:
+            assert params["SortBy"] == "SortName,Id"
+            assert params["SortOrder"] == "Ascending"
@@ -0,0 +1,59 @@
+"""Unit tests for LibraryIndex."""
+
+from jfc.models.media import LibraryItem, MediaItem, MediaType
+from jfc.services.library_index import LibraryIndex, normalize_title
+
+
+def make_item(jellyfin_id: str, title: str, year: int, **ids) -> LibraryItem:
+    """Create a library item."""
+    return LibraryItem(
+        jellyfin_id=jellyfin_id,
+        title=title,
+        year=year,
+        media_type=MediaType.SERIES,
+        library_id="lib-1",
+        library_name="Séries",
+        **ids,
+    )
+
+
+class TestLibraryIndex:
+    """Tests for LibraryIndex lookups."""
+
+    def test_lookup_by_each_provider_id(self):
+        """Items resolve by TMDb, IMDb or TVDB ID."""
+        item = make_item("jf-1", "Severance", 2022, tmdb_id=95396, imdb_id="tt11280740", tvdb_id=371980)
+        index = LibraryIndex([item])
+
+        assert index.find(MediaItem(title="x", media_type=MediaType.SERIES, tmdb_id=95396)) is item
+        assert index.find(MediaItem(title="x", media_type=MediaType.SERIES, imdb_id="tt11280740")) is item
+        assert index.find(MediaItem(title="x", media_type=MediaType.SERIES, tvdb_id=371980)) is item
+
+    def test_lookup_by_normalized_title_and_year(self):
+        """Title lookup ignores articles and punctuation, and tolerates one year."""
+        item = make_item("jf-1", "The Office", 2005)
+        index = LibraryIndex([item])
+
+        assert index.find(MediaItem(title="Office!", year=2006, media_type=MediaType.SERIES)) is item
+        assert index.find(MediaItem(title="Office", year=2001, media_type=MediaType.SERIES)) is None
+
+    def test_conflicting_tmdb_id_does_not_match_by_title(self):
+        """Same title but different TMDb IDs are different works."""
+        index = LibraryIndex([make_item("jf-1", "The Office", 2005, tmdb_id=2316)])
+
+        item = MediaItem(title="The Office", year=2005, media_type=MediaType.SERIES, tmdb_id=2996)
+        assert index.find(item) is None
+
+    def test_remove(self):
+        """Removed items disappear from every table."""
+        item = make_item("jf-1", "Severance", 2022, tmdb_id=95396)
+        index = LibraryIndex([item])
+
+        assert index.remove("jf-1") is item
+        assert len(index) == 0
+        assert index.by_tmdb == {}
+        assert index.by_title == {}
+
+    def test_normalize_title(self):
+        """Articles, case and punctuation are normalized."""
+        assert normalize_title("The  Lord of the Rings: Part II") == "lord of the rings part ii"
@@ -0,0 +1,137 @@
+"""Unit tests for persisted library snapshots."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from jfc.models.media import LibraryItem, MediaItem, MediaType
+from jfc.services.library_snapshot import LibrarySnapshotStore
+from jfc.services.media_matcher import MediaMatcher
+
+
+def make_item(jellyfin_id: str, tmdb_id: int) -> LibraryItem:
+    """Create a library item."""
+    return LibraryItem(
+        jellyfin_id=jellyfin_id,
+        title=f"Movie {tmdb_id}",
+        media_type=MediaType.MOVIE,
+        tmdb_id=tmdb_id,
+        library_id="lib-1",
+        library_name="Films",
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a snapshot store in a temp directory."""
+    store = LibrarySnapshotStore(tmp_path / "library_snapshot.sqlite")
+    yield store
+    store.close()
+
+
+def mock_jellyfin(pages_by_call: list[list[LibraryItem]], library_ids: set[str]) -> MagicMock:
+    """Create a Jellyfin mock returning one page per iter_library_items call."""
+    client = MagicMock()
+    calls = iter(pages_by_call)
+
+    async def iter_library_items(*args, **kwargs):
+        yield next(calls)
+
+    client.iter_library_items = MagicMock(side_effect=iter_library_items)
+    client.get_library_item_ids = AsyncMock(return_value=library_ids)
+    client.get_items_by_ids = AsyncMock(return_value=[])
+    return client
+
+
+class TestLibrarySnapshotStore:
+    """Tests for LibrarySnapshotStore."""
+
+    def test_save_and_load(self, store):
+        """Items and watermark round-trip."""
+        watermark = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        store.save("lib-1", [make_item("jf-1", 1)], watermark)
+
+        items, loaded_watermark = store.load("lib-1")
+        assert [i.jellyfin_id for i in items] == ["jf-1"]
+        assert loaded_watermark == watermark
+
+    def test_upsert_keeps_existing_items(self, store):
+        """Delta saves add to the snapshot instead of replacing it."""
+        store.save("lib-1", [make_item("jf-1", 1)], datetime.now(timezone.utc))
+        store.save("lib-1", [make_item("jf-2", 2)], datetime.now(timezone.utc), replace=False)
+
+        items, _ = store.load("lib-1")
+        assert {i.jellyfin_id for i in items} == {"jf-1", "jf-2"}
+
+    def test_remove_items(self, store):
+        """Removed items are dropped from the snapshot."""
+        store.save("lib-1", [make_item("jf-1", 1), make_item("jf-2", 2)], datetime.now(timezone.utc))
+        store.remove("lib-1", ["jf-1"])
+
+        items, _ = store.load("lib-1")
+        assert [i.jellyfin_id for i in items] == ["jf-2"]
+
+    def test_missing_library(self, store):
+        """No snapshot yields None."""
+        assert store.load("unknown") is None
+
+
+class TestMatcherDeltaLoad:
+    """Tests for MediaMatcher loading from a snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_delta_load_fetches_changed_items_only(self, store):
+        """Snapshot items plus the delta are indexed; only the delta is fetched."""
+        store.save("lib-1", [make_item("jf-1", 1)], datetime.now(timezone.utc))
+        jellyfin = mock_jellyfin([[make_item("jf-2", 2)]], {"jf-1", "jf-2"})
+        matcher = MediaMatcher(jellyfin, snapshot_store=store)
+
+        found = await matcher.find_in_library(
+            MediaItem(title="Movie 1", media_type=MediaType.MOVIE, tmdb_id=1), library_id="lib-1"
+        )
+
+        assert found is not None
+        assert len(matcher.get_library_index("lib-1")) == 2
+        assert "min_date_last_saved" in jellyfin.iter_library_items.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_deletions_are_reconciled(self, store):
+        """Items missing from the ID listing are dropped from index and snapshot."""
+        store.save("lib-1", [make_item("jf-1", 1), make_item("jf-2", 2)], datetime.now(timezone.utc))
+        jellyfin = mock_jellyfin([[]], {"jf-2"})
+        matcher = MediaMatcher(jellyfin, snapshot_store=store)
+
+        await matcher._ensure_library_loaded("lib-1", MediaType.MOVIE)
+
+        assert jellyfin.iter_library_items.call_count == 1
+        assert [i.jellyfin_id for i in matcher.get_library_index("lib-1").items()] == ["jf-2"]
+        assert [i.jellyfin_id for i in store.load("lib-1")[0]] == ["jf-2"]
+
+    @pytest.mark.asyncio
+    async def test_balanced_add_and_delete(self, store):
+        """One item added and one removed (same count) still drops the removed one."""
+        store.save("lib-1", [make_item("jf-1", 1), make_item("jf-2", 2)], datetime.now(timezone.utc))
+        jellyfin = mock_jellyfin([[make_item("jf-3", 3)]], {"jf-2", "jf-3"})
+        matcher = MediaMatcher(jellyfin, snapshot_store=store)
+
+        gone = await matcher.find_in_library(
+            MediaItem(title="Movie 1", media_type=MediaType.MOVIE, tmdb_id=1), library_id="lib-1"
+        )
+
+        assert gone is None
+        assert {i.jellyfin_id for i in matcher.get_library_index("lib-1").items()} == {"jf-2", "jf-3"}
+        assert {i.jellyfin_id for i in store.load("lib-1")[0]} == {"jf-2", "jf-3"}
+
+    @pytest.mark.asyncio
+    async def test_items_missed_by_delta_are_fetched(self, store):
+        """IDs listed by Jellyfin but absent from the index are fetched by ID."""
+        store.save("lib-1", [make_item("jf-1", 1)], datetime.now(timezone.utc))
+        jellyfin = mock_jellyfin([[]], {"jf-1", "jf-4"})
+        jellyfin.get_items_by_ids = AsyncMock(return_value=[make_item("jf-4", 4)])
+        matcher = MediaMatcher(jellyfin, snapshot_store=store)
+
+        await matcher._ensure_library_loaded("lib-1", MediaType.MOVIE)
+
+        assert jellyfin.get_items_by_ids.call_args.args[0] == ["jf-4"]
+        assert {i.jellyfin_id for i in store.load("lib-1")[0]} == {"jf-1", "jf-4"}
@@ -0,0 +1,57 @@
+"""Unit tests for LibraryWatcher change batching."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from jfc.services.library_watcher import LibraryWatcher
+
+
+def make_watcher(apply) -> LibraryWatcher:
+    """Create a watcher whose matcher applies changes with the given coroutine."""
+    matcher = MagicMock()
+    matcher.apply_library_changes = apply
+    return LibraryWatcher("http://test", "key", matcher, debounce=0)
+
+
+class TestLibraryWatcher:
+    """Tests for LibraryWatcher."""
+
+    @pytest.mark.asyncio
+    async def test_event_during_apply_is_flushed(self):
+        """Changes received while a batch is being applied get their own flush."""
+        applied = []
+        gate = asyncio.Event()
+
+        async def apply(changed, removed):
+            applied.append((changed, removed))
+            if len(applied) == 1:
+                await gate.wait()
+
+        watcher = make_watcher(apply)
+        watcher._on_library_changed({"ItemsAdded": ["a"]})
+        await asyncio.sleep(0.01)  # first batch is blocked in apply
+
+        watcher._on_library_changed({"ItemsRemoved": ["b"]})
+        gate.set()
+        await watcher._flush_task
+
+        assert applied == [({"a"}, set()), (set(), {"b"})]
+
+    @pytest.mark.asyncio
+    async def test_failed_apply_is_retried(self):
+        """A batch that fails to apply is requeued, not dropped."""
+        applied = []
+
+        async def apply(changed, removed):
+            applied.append((changed, removed))
+            if len(applied) == 1:
+                raise RuntimeError("Jellyfin unavailable")
+
+        watcher = make_watcher(apply)
+        watcher._on_library_changed({"ItemsAdded": ["a"], "ItemsRemoved": ["b"]})
+        await watcher._flush_task
+
+        assert applied == [({"a"}, {"b"}), ({"a"}, {"b"})]
+        assert not watcher._changed and not watcher._removed
@@ -1,5 +1,7 @@
 """Unit tests for MediaMatcher service."""
 
+import asyncio
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -14,6 +16,12 @@ def mock_jellyfin():
     client = MagicMock()
     client.get_library_items = AsyncMock(return_value=[])
     client.search_items = AsyncMock(return_value=[])
+
+    async def iter_library_items(*args, **kwargs):
+        """Yield the mocked library items as a single page."""
+        yield await client.get_library_items(*args, **kwargs)
+
+    client.iter_library_items = MagicMock(side_effect=iter_library_items)
     return client
 
 
@@ -128,9 +136,78 @@ class TestMediaMatcher:
         # Library should only be loaded once
         assert mock_jellyfin.get_library_items.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_load_library_once(
+        self, matcher, mock_jellyfin, sample_library_items
+    ):
+        """Test concurrent builds share a single library load."""
+        mock_jellyfin.get_library_items.return_value = sample_library_items
+
+        items = [
+            MediaItem(title="Dune: Part Two", year=2024, media_type=MediaType.MOVIE, tmdb_id=693134),
+            MediaItem(title="Oppenheimer", year=2023, media_type=MediaType.MOVIE, tmdb_id=872585),
+        ]
+
+        results = await asyncio.gather(
+            *(matcher.find_in_library(item, library_id="lib-001") for item in items)
+        )
+
+        assert all(r is not None for r in results)
+        assert mock_jellyfin.iter_library_items.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_find_in_library_by_other_ids_and_title(
+        self, matcher, mock_jellyfin, sample_library_items
+    ):
+        """Test items without TMDb ID resolve from the index without searching."""
+        mock_jellyfin.get_library_items.return_value = sample_library_items
+        lib_item = sample_library_items[0]
+
+        by_title = MediaItem(title=lib_item.title, year=lib_item.year, media_type=MediaType.MOVIE)
+        other_year = MediaItem(title=lib_item.title, year=1990, media_type=MediaType.MOVIE)
+
+        assert await matcher.find_in_library(by_title, library_id="lib-001") == lib_item
+        assert await matcher.find_in_library(other_year, library_id="lib-001") is None
+        mock_jellyfin.search_items.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_apply_library_changes(self, matcher, mock_jellyfin, sample_library_items):
+        """Test library events patch the index and drop stale misses."""
+        mock_jellyfin.get_library_items.return_value = sample_library_items[:2]
+        missing = MediaItem(title="The Batman", year=2022, media_type=MediaType.MOVIE, tmdb_id=414906)
+        removed = MediaItem(title="Oppenheimer", year=2023, media_type=MediaType.MOVIE, tmdb_id=872585)
+
+        assert await matcher.find_in_library(missing, library_id="lib-001") is None
+        assert await matcher.find_in_library(removed, library_id="lib-001") is not None
+
+        mock_jellyfin.get_items_by_ids = AsyncMock(return_value=[sample_library_items[2]])
+        await matcher.apply_library_changes(changed={"jf-003"}, removed={"jf-002"})
+
+        assert (await matcher.find_in_library(missing, library_id="lib-001")).jellyfin_id == "jf-003"
+        assert await matcher.find_in_library(removed, library_id="lib-001") is None
+        assert mock_jellyfin.iter_library_items.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_library_refreshed_after_ttl(self, mock_jellyfin, sample_library_items):
+        """Test an expired library is refreshed with a delta load."""
+        matcher = MediaMatcher(mock_jellyfin, library_ttl=60)
+        mock_jellyfin.get_library_items.return_value = sample_library_items
+        mock_jellyfin.get_library_item_ids = AsyncMock(
+            return_value={i.jellyfin_id for i in sample_library_items}
+        )
+        item = MediaItem(title="Dune: Part Two", year=2024, media_type=MediaType.MOVIE, tmdb_id=693134)
+
+        await matcher.find_in_library(item, library_id="lib-001")
+        matcher._library_loaded["lib-001"] -= timedelta(seconds=120)
+        mock_jellyfin.get_library_items.return_value = []
+
+        assert await matcher.find_in_library(item, library_id="lib-001") is not None
+        assert mock_jellyfin.iter_library_items.call_count == 2
+        assert "min_date_last_saved" in mock_jellyfin.iter_library_items.call_args.kwargs
+
     @pytest.mark.asyncio
     async def test_find_in_library_by_title_fallback(self, matcher, mock_jellyfin):
-        """Test fallback to title search when no TMDb ID."""
+        """Test fallback to title search when no TMDb ID and no library index."""
         search_result = LibraryItem(
             jellyfin_id="jf-100",
             title="Old Movie",
@@ -148,7 +225,7 @@ class TestMediaMatcher:
             # No tmdb_id
         )
 
-        result = await matcher.find_in_library(item, library_id="lib-001")
+        result = await matcher.find_in_library(item)
 
         assert result is not None
         assert result.jellyfin_id == "jf-100"
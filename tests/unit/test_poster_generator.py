@@ -1,7 +1,8 @@
 """Unit tests for PosterGenerator service (prompt generation only, no API calls)."""
 
+import asyncio
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -37,7 +38,7 @@ class TestPosterGeneratorInit:
                 cache_dir=cache_dir,
             )
 
-        assert generator.signatures_cache_path == cache_dir / "visual_signatures_cache.json"
+        assert generator.signatures_cache_path == cache_dir / "visual_signatures.sqlite"
 
     def test_init_with_custom_logo(self, tmp_path: Path):
         """Test init with custom logo text."""
@@ -339,3 +340,237 @@ class TestTemplateLoading:
 
         with pytest.raises(FileNotFoundError):
             generator._get_template("nonexistent.j2")
+
+    def test_compiled_template_reloaded_on_change(self, tmp_path: Path):
+        """Compiled templates are reused until their file changes."""
+        import os
+
+        from jfc.services.poster_generator import PosterGenerator
+
+        generator = PosterGenerator(api_key="test-key", output_dir=tmp_path)
+        generator.templates_dir = tmp_path / "user_templates"
+        generator.templates_dir.mkdir()
+        path = generator.templates_dir / "test.j2"
+        path.write_text("Hello {{ name }}")
+
+        template = generator._get_compiled_template("test.j2")
+        assert template.render(name="A") == "Hello A"
+        assert generator._get_compiled_template("test.j2") is template
+
+        path.write_text("Bye {{ name }}")
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 10))
+        assert generator._get_compiled_template("test.j2").render(name="A") == "Bye A"
+        generator.close()
+
+    def test_yaml_config_reloaded_on_change(self, tmp_path: Path):
+        """YAML configs are parsed once per file version."""
+        import os
+
+        from jfc.services.poster_generator import PosterGenerator
+
+        user_dir = tmp_path / "user_templates"
+        user_dir.mkdir()
+        path = user_dir / "collection_themes.yaml"
+        path.write_text("horror:\n  mood_hint: dread\n")
+        generator = PosterGenerator(api_key="test-key", output_dir=tmp_path, templates_dir=user_dir)
+
+        themes = generator.collection_themes
+        assert themes["horror"]["mood_hint"] == "dread"
+        assert generator.collection_themes is themes
+
+        path.write_text("horror:\n  mood_hint: fear\n")
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 10))
+        assert generator.collection_themes["horror"]["mood_hint"] == "fear"
+        generator.close()
+
+
+def chat_response(content: str) -> MagicMock:
+    """Create a chat completion response with the given content."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    return response
+
+
+class TestVisualSignatureGeneration:
+    """Tests for batched visual signature generation."""
+
+    @pytest.fixture
+    def generator(self, tmp_path: Path):
+        """Create a generator with a mocked OpenAI client."""
+        from jfc.services.poster_generator import PosterGenerator
+
+        generator = PosterGenerator(api_key="test-key", output_dir=tmp_path)
+        generator.client = MagicMock()
+        yield generator
+        generator.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_signatures_in_one_request(self, generator):
+        """Items missing from the batch answer are generated one by one."""
+        import json
+
+        from jfc.models.media import MediaItem, MediaType
+
+        items = [
+            MediaItem(title=t, media_type=MediaType.MOVIE, tmdb_id=i, genres=[28])
+            for i, t in enumerate("ABC", 1)
+        ]
+        batch = {"signatures": [{"id": 0, "signature": "sig A"}, {"id": 2, "signature": "sig C"}]}
+        generator.client.chat.completions.create = AsyncMock(
+            side_effect=[chat_response(json.dumps(batch)), chat_response("sig B")]
+        )
+
+        signatures = await generator._generate_signatures_from_metadata(items)
+
+        assert signatures == {
+            ("movie", 1): "sig A",
+            ("movie", 2): "sig B",
+            ("movie", 3): "sig C",
+        }
+        calls = generator.client.chat.completions.create.call_args_list
+        assert len(calls) == 2
+        assert calls[0].kwargs["response_format"]["type"] == "json_schema"
+        assert generator._cached_signatures(items[1:2]) == {("movie", 2): "sig B"}
+
+    @pytest.mark.asyncio
+    async def test_shared_items_generated_once(self, generator):
+        """Concurrent posters sharing an item request its signature once."""
+        from jfc.models.media import MediaItem, MediaType
+
+        async def create(**kwargs):
+            await asyncio.sleep(0.01)
+            return chat_response("shared signature")
+
+        generator.client.chat.completions.create = AsyncMock(side_effect=create)
+        item = MediaItem(title="Dune", media_type=MediaType.MOVIE)
+
+        first, second = await asyncio.gather(
+            generator._extract_visual_signatures([item]),
+            generator._extract_visual_signatures([item]),
+        )
+
+        assert first == second
+        assert "shared signature" in first
+        generator.client.chat.completions.create.assert_called_once()
+
+
+class TestSmartRegeneration:
+    """Tests for input-fingerprint based poster regeneration."""
+
+    @pytest.fixture
+    def generator(self, tmp_path: Path):
+        """Create a generator whose poster pipeline is mocked."""
+        from jfc.services.poster_generator import PosterGenerator
+
+        generator = PosterGenerator(api_key="test-key", output_dir=tmp_path)
+        generator._extract_visual_signatures = AsyncMock(return_value="sigs")
+        generator._generate_scene_description = AsyncMock(return_value="scene")
+
+        async def generate_image(prompt, output_path, use_dalle3=False):
+            output_path.write_bytes(b"png")
+            return output_path
+
+        generator._generate_image = AsyncMock(side_effect=generate_image)
+        yield generator
+        generator.close()
+
+    @staticmethod
+    def items(*tmdb_ids: int) -> list:
+        """Create movie items."""
+        from jfc.models.media import MediaItem, MediaType
+
+        return [
+            MediaItem(title=f"Movie {i}", media_type=MediaType.MOVIE, tmdb_id=i)
+            for i in tmdb_ids
+        ]
+
+    async def generate(self, generator, items, **kwargs):
+        """Generate the test collection poster in smart mode."""
+        from jfc.models.collection import CollectionConfig
+
+        return await generator.generate_poster(
+            config=CollectionConfig(name="Trending"),
+            items=items,
+            category="FILMS",
+            library="Films",
+            smart_regenerate=True,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_unchanged_inputs_keep_poster(self, generator):
+        """A poster is only regenerated when its top items change."""
+        await self.generate(generator, self.items(1, 2, 3, 4, 5))
+        assert generator._generate_image.call_count == 1
+
+        # Same top items, different tail: kept
+        await self.generate(generator, self.items(1, 2, 3, 4, 5, 6, 7))
+        assert generator._generate_image.call_count == 1
+
+        # New top item: regenerated
+        await self.generate(generator, self.items(9, 1, 2, 3, 4))
+        assert generator._generate_image.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_logo_change_and_max_age_regenerate(self, generator, tmp_path: Path):
+        """Changed logo text or an expired poster triggers regeneration."""
+        import json
+
+        await self.generate(generator, self.items(1))
+        generator.logo_text = "OTHER"
+        await self.generate(generator, self.items(1))
+        assert generator._generate_image.call_count == 2
+
+        prompts = sorted((tmp_path / "films" / "trending" / "prompts").glob("*.json"))
+        data = json.loads(prompts[-1].read_text())
+        data["timestamp"] = "2000-01-01T00:00:00"
+        prompts[-1].write_text(json.dumps(data))
+
+        await self.generate(generator, self.items(1))
+        assert generator._generate_image.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_no_fingerprint_without_smart_mode(self, generator):
+        """An existing poster is kept without fingerprinting when smart mode is off."""
+        from jfc.models.collection import CollectionConfig
+
+        await self.generate(generator, self.items(1))
+        generator.poster_fingerprint = MagicMock(return_value="fp")
+
+        await generator.generate_poster(
+            config=CollectionConfig(name="Trending"),
+            items=self.items(2),
+            category="FILMS",
+            library="Films",
+        )
+
+        generator.poster_fingerprint.assert_not_called()
+        assert generator._generate_image.call_count == 1
+
+    def test_templates_hashed_once_until_changed(self, generator, tmp_path: Path):
+        """Template files are only rehashed when their mtime changes."""
+        import os
+
+        from jfc.models.collection import CollectionConfig
+        from jfc.services.collection_state import file_fingerprint
+
+        user_templates = tmp_path / "templates"
+        user_templates.mkdir()
+        template = user_templates / "scene_description.j2"
+        template.write_text("scene v1")
+        generator.templates_dir = user_templates
+        args = (CollectionConfig(name="Trending"), self.items(1), "FILMS")
+
+        with patch(
+            "jfc.services.poster_generator.file_fingerprint", wraps=file_fingerprint
+        ) as hashed:
+            first = generator.poster_fingerprint(*args)
+            assert generator.poster_fingerprint(*args) == first
+            calls = hashed.call_count
+
+            template.write_text("scene v2")
+            os.utime(template, (template.stat().st_atime, template.stat().st_mtime + 10))
+
+            assert generator.poster_fingerprint(*args) != first
+            assert hashed.call_count == calls + 1
@@ -0,0 +1,83 @@
+"""Unit tests for the background poster queue."""
+
+import asyncio
+
+import pytest
+
+from jfc.models.collection import Collection, CollectionConfig
+from jfc.models.report import CollectionReport
+from jfc.services.poster_queue import PosterJob, PosterQueue
+
+
+def make_job_args(name: str) -> tuple[Collection, CollectionReport]:
+    """Create a collection and its report."""
+    collection = Collection(config=CollectionConfig(name=name), library_name="Films")
+    report = CollectionReport(name=name, library="Films", schedule="daily", source_provider="TMDb")
+    return collection, report
+
+
+class TestPosterQueue:
+    """Tests for PosterQueue."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_by_priority(self):
+        """Waiting jobs are processed lowest priority value first."""
+        order = []
+        gate = asyncio.Event()
+
+        async def handler(job: PosterJob) -> bool:
+            await gate.wait()
+            order.append(job.collection.config.name)
+            return True
+
+        queue = PosterQueue(handler, concurrency=1)
+        await queue.submit(*make_job_args("first"))
+        await asyncio.sleep(0)  # worker picks up "first"
+        await queue.submit(*make_job_args("forced"), priority=PosterQueue.PRIORITY_FORCED)
+        await queue.submit(*make_job_args("normal"))
+        await queue.submit(*make_job_args("new"), priority=PosterQueue.PRIORITY_NEW)
+        gate.set()
+        await queue.join()
+
+        assert order == ["first", "new", "normal", "forced"]
+
+    @pytest.mark.asyncio
+    async def test_submit_waits_when_full(self):
+        """Submitting blocks while max_pending jobs are waiting."""
+        gate = asyncio.Event()
+
+        async def handler(job: PosterJob) -> bool:
+            await gate.wait()
+            return True
+
+        queue = PosterQueue(handler, concurrency=1, max_pending=1)
+        await queue.submit(*make_job_args("a"))
+        await asyncio.sleep(0)
+        await queue.submit(*make_job_args("b"))
+
+        blocked = asyncio.create_task(queue.submit(*make_job_args("c")))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        gate.set()
+        await blocked
+        await queue.join()
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_retried(self):
+        """A failing job is retried up to max_attempts and timed on its report."""
+        attempts = []
+
+        async def handler(job: PosterJob) -> bool:
+            attempts.append(job.attempts)
+            if job.attempts == 1:
+                raise RuntimeError("timeout")
+            return True
+
+        queue = PosterQueue(handler, max_attempts=3, retry_delay=0)
+        collection, report = make_job_args("a")
+        await queue.submit(collection, report)
+        await queue.join()
+
+        assert attempts == [1, 2]
+        assert report.poster_duration_seconds > 0
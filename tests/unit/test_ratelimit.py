@@ -0,0 +1,48 @@
+"""Unit tests for token-bucket rate limiting."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from jfc.clients.ratelimit import TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_passes_without_waiting(self):
+        """Requests within the burst capacity are not delayed."""
+        bucket = TokenBucket("test", rate=10.0)
+
+        with patch("jfc.clients.ratelimit.asyncio.sleep", new=AsyncMock()) as sleep:
+            for _ in range(10):
+                await bucket.acquire()
+
+        sleep.assert_not_awaited()
+        assert bucket.stats.acquired == 10
+        assert bucket.stats.delayed == 0
+
+    @pytest.mark.asyncio
+    async def test_excess_requests_are_queued_in_order(self):
+        """Each request beyond the burst waits one more token interval."""
+        bucket = TokenBucket("test", rate=10.0, burst=1)
+
+        with patch("jfc.clients.ratelimit.asyncio.sleep", new=AsyncMock()):
+            waits = [await bucket.acquire() for _ in range(3)]
+
+        assert waits[0] == 0
+        assert waits[1] == pytest.approx(0.1, abs=0.01)
+        assert waits[2] == pytest.approx(0.2, abs=0.01)
+        assert bucket.stats.delayed == 2
+        assert bucket.stats.max_wait_seconds == pytest.approx(0.2, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_is_unlimited(self):
+        """A rate of 0 disables limiting."""
+        bucket = TokenBucket("test", rate=0)
+
+        for _ in range(100):
+            assert await bucket.acquire() == 0
+
+        assert bucket.stats.acquired == 0
@@ -0,0 +1,70 @@
+"""Unit tests for the disk response cache."""
+
+import time
+
+import pytest
+
+from jfc.clients.cache import ResponseCache, make_cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temp directory."""
+    cache = ResponseCache(tmp_path / "http_cache.sqlite", max_bytes=1000)
+    yield cache
+    cache.close()
+
+
+class TestCacheKey:
+    """Tests for cache key normalization."""
+
+    def test_param_order_does_not_matter(self):
+        """Same params in a different order produce the same key."""
+        a = make_cache_key("tmdb", "/discover/movie", {"page": 1, "sort_by": "popularity.desc"})
+        b = make_cache_key("tmdb", "/discover/movie", {"sort_by": "popularity.desc", "page": 1})
+        assert a == b
+
+    def test_api_key_is_excluded(self):
+        """Secrets are not part of the key."""
+        key = make_cache_key("tmdb", "/movie/popular", {"api_key": "secret", "language": "fr"})
+        assert "secret" not in key
+        assert key == make_cache_key("tmdb", "/movie/popular", {"language": "fr"})
+
+
+class TestResponseCache:
+    """Tests for ResponseCache storage."""
+
+    def test_put_and_get(self, cache):
+        """Stored bodies are returned with their validators."""
+        cache.put("k", b'{"results": []}', ttl=60, etag='"abc"')
+
+        cached = cache.get("k")
+        assert cached.body == b'{"results": []}'
+        assert cached.etag == '"abc"'
+        assert cached.fresh
+
+    def test_expired_entry_is_kept_for_revalidation(self, cache):
+        """Stale entries are still returned, flagged as not fresh."""
+        cache.put("k", b"{}", ttl=-1)
+
+        cached = cache.get("k")
+        assert cached is not None
+        assert not cached.fresh
+
+        cache.refresh("k", ttl=60)
+        assert cache.get("k").fresh
+
+    def test_lru_eviction(self, cache):
+        """Least recently used entries go first when over max_bytes."""
+        cache.put("old", b"x" * 400, ttl=60)
+        time.sleep(0.01)
+        cache.put("recent", b"x" * 400, ttl=60)
+        time.sleep(0.01)
+        cache.get("old")  # Touch: "recent" is now least recently used
+        time.sleep(0.01)
+        cache.put("new", b"x" * 400, ttl=60)
+
+        assert cache.get("recent") is None
+        assert cache.get("old") is not None
+        assert cache.get("new") is not None
+        assert cache.stats.evicted == 1
@@ -0,0 +1,89 @@
+"""Unit tests for client retry policy."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from jfc.clients.base import BaseClient
+from jfc.clients.retry import RetryPolicy, server_retry_delay
+
+
+def make_response(status_code: int, headers: dict | None = None) -> httpx.Response:
+    """Build a response bound to a dummy request."""
+    return httpx.Response(
+        status_code,
+        headers=headers,
+        request=httpx.Request("GET", "http://test/items"),
+    )
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy decisions."""
+
+    def test_retries_server_errors_for_idempotent_methods_only(self):
+        """5xx is retried for GET but not for POST."""
+        policy = RetryPolicy()
+        assert policy.should_retry_status("GET", 503)
+        assert not policy.should_retry_status("POST", 503)
+        assert not policy.should_retry_status("GET", 404)
+
+    def test_retries_rate_limit_for_any_method(self):
+        """429 means the request was not processed."""
+        policy = RetryPolicy()
+        assert policy.should_retry_status("POST", 429)
+
+    def test_backoff_is_bounded(self):
+        """Jittered delay never exceeds the exponential ceiling or the max."""
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+        for attempt in range(1, 10):
+            delay = policy.backoff(attempt)
+            assert 0 <= delay <= min(5.0, 2 ** (attempt - 1))
+
+    def test_retry_after_header_takes_precedence(self):
+        """Server hint overrides computed backoff, capped at backoff_max."""
+        policy = RetryPolicy(backoff_max=10.0)
+        assert policy.delay_for(1, make_response(429, {"Retry-After": "3"})) == 3.0
+        assert policy.delay_for(1, make_response(429, {"Retry-After": "60"})) == 10.0
+
+    def test_rate_limit_reset_header(self):
+        """X-RateLimit-Reset is used only once the quota is exhausted."""
+        exhausted = make_response(429, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"})
+        remaining = make_response(429, {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "2"})
+        assert server_retry_delay(exhausted) == 2.0
+        assert server_retry_delay(remaining) is None
+
+
+class TestClientRetry:
+    """Tests for BaseClient retry loop."""
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        """Transient failures are retried and counted."""
+        client = BaseClient("http://test")
+        client.retry_policy = RetryPolicy(backoff_base=0.0)
+        send = AsyncMock(side_effect=[make_response(502), make_response(200)])
+
+        with patch("jfc.clients.base.asyncio.sleep", new=AsyncMock()):
+            response = await client._send_with_retry("GET", "/items", send)
+
+        assert response.status_code == 200
+        assert send.await_count == 2
+        assert client.retry_stats.retries == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_stops_retries(self):
+        """Once the budget is spent, failures are returned immediately."""
+        client = BaseClient("http://test")
+        client.retry_policy = RetryPolicy(backoff_base=0.0, budget=1)
+        send = AsyncMock(return_value=make_response(503))
+
+        with patch("jfc.clients.base.asyncio.sleep", new=AsyncMock()):
+            first = await client._send_with_retry("GET", "/items", send)
+            second = await client._send_with_retry("GET", "/items", send)
+
+        assert first.status_code == 503
+        assert second.status_code == 503
+        # 2 attempts for the first request, 1 for the second
+        assert send.await_count == 3
+        assert client.retry_stats.budget_exhausted == 2
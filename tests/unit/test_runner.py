@@ -0,0 +1,143 @@
+"""Unit tests for concurrent collection processing in Runner.run."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from jfc.core.config import Settings
+from jfc.models.report import CollectionReport
+from jfc.services.runner import Runner
+
+# Collections of the sample Films.yml, in config order
+FILMS = ["Trending Movies", "Popular Action", "Netflix Originals"]
+SERIES = ["Trending Series", "Anime Exclus"]
+
+
+@pytest.fixture
+def make_runner(
+    monkeypatch, tmp_path, temp_config_dir, sample_config_yml, sample_films_yml, sample_series_yml
+):
+    """Create runners whose collection builds are simulated by a delay table."""
+    monkeypatch.setenv("CONFIG_PATH", str(temp_config_dir))
+    runners = []
+
+    def factory(delays: dict[str, float], failing: frozenset = frozenset(), **settings) -> Runner:
+        runner = Runner(Settings(
+            config_path=temp_config_dir, data_path=tmp_path / "data", **settings
+        ))
+        runner._startup_done = True
+        runner.jellyfin.get_libraries = AsyncMock(return_value=[
+            {"Name": "Films", "ItemId": "lib-films"},
+            {"Name": "Séries", "ItemId": "lib-series"},
+        ])
+        runner.discord = MagicMock()
+        for method in ("send_run_start", "send_run_end", "send_collection_report", "send_error"):
+            setattr(runner.discord, method, AsyncMock())
+        runner.report_generator = MagicMock()
+        runner.builder.sync_collection = AsyncMock(return_value=(0, 0))
+
+        runner.active = {}
+        runner.peak = {"total": 0}
+
+        async def build_collection(config, library_name, library_id, media_type):
+            active = runner.active
+            active[library_name] = active.get(library_name, 0) + 1
+            runner.peak[library_name] = max(runner.peak.get(library_name, 0), active[library_name])
+            runner.peak["total"] = max(runner.peak["total"], sum(active.values()))
+            try:
+                await asyncio.sleep(delays.get(config.name, 0.01))
+            finally:
+                active[library_name] -= 1
+
+            if config.name in failing:
+                raise ValueError("source unavailable")
+            collection = MagicMock(items=[], source_items=[])
+            report = CollectionReport(
+                name=config.name, library=library_name, schedule="daily", source_provider="TMDb"
+            )
+            return collection, report
+
+        runner.builder.build_collection = build_collection
+        runners.append(runner)
+        return runner
+
+    yield factory
+
+    for runner in runners:
+        runner.id_map.close()
+        if runner.library_snapshot:
+            runner.library_snapshot.close()
+
+
+def collection_results(report) -> dict[str, list[tuple[str, bool]]]:
+    """Get (name, success) of each collection report, by library."""
+    return {
+        library.name: [(c.name, c.success) for c in library.collections]
+        for library in report.libraries
+    }
+
+
+class TestConcurrentRun:
+    """Tests for Runner.run processing collections concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_reports_in_config_order(self, make_runner):
+        """Reports follow the config order, not completion order."""
+        runner = make_runner({"Trending Movies": 0.06, "Popular Action": 0.03})
+
+        report = await runner.run()
+
+        assert collection_results(report) == {
+            "Films": [(name, True) for name in FILMS],
+            "Séries": [(name, True) for name in SERIES],
+        }
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_abort_others(self, make_runner):
+        """A failing collection gets an error report; the others still complete."""
+        runner = make_runner({}, failing=frozenset({"Popular Action"}))
+
+        report = await runner.run()
+
+        films = collection_results(report)["Films"]
+        assert films == [
+            ("Trending Movies", True),
+            ("Popular Action", False),
+            ("Netflix Originals", True),
+        ]
+        assert report.libraries[0].collections[1].error_message == "source unavailable"
+        runner.discord.send_error.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_timeout_produces_error_report(self, make_runner):
+        """A collection exceeding the timeout is reported as an error."""
+        runner = make_runner({"Netflix Originals": 5}, runner_collection_timeout=0.1)
+
+        report = await runner.run(libraries=["Films"])
+
+        timed_out = report.libraries[0].collections[2]
+        assert (timed_out.name, timed_out.success) == ("Netflix Originals", False)
+        assert timed_out.error_message == "Timed out after 0.1s"
+        assert [c.success for c in report.libraries[0].collections[:2]] == [True, True]
+
+    @pytest.mark.asyncio
+    async def test_global_limit(self, make_runner):
+        """No more than max_concurrent_collections run at once across libraries."""
+        runner = make_runner({}, runner_max_concurrent_collections=2)
+
+        await runner.run()
+
+        assert runner.peak["total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_library_limit(self, make_runner):
+        """A library's own limit applies below the global one."""
+        runner = make_runner({}, runner_max_concurrent_collections=4)
+        runner.parser.get_library_concurrency = MagicMock(return_value={"Films": 1})
+
+        await runner.run()
+
+        assert runner.peak["Films"] == 1
+        assert runner.peak["Séries"] == 2
+        assert runner.peak["total"] == 3
@@ -0,0 +1,53 @@
+"""Unit tests for the visual signature store."""
+
+import time
+
+import pytest
+
+from jfc.services.signature_store import SignatureStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a signature store in a temp directory."""
+    store = SignatureStore(tmp_path / "visual_signatures.sqlite", max_entries=3, max_age_days=30)
+    yield store
+    store.close()
+
+
+class TestSignatureStore:
+    """Tests for SignatureStore."""
+
+    def test_keyed_by_tmdb_id_and_media_type(self, store):
+        """Same-titled items of different IDs or types do not collide."""
+        store.put_many([
+            (("movie", 1), "Dune", "desert"),
+            (("movie", 2), "Dune", "spice"),
+            (("series", 1), "Dune", "prophecy"),
+        ])
+
+        assert store.get_many([("movie", 1), ("movie", 2), ("series", 1), ("series", 2)]) == {
+            ("movie", 1): "desert",
+            ("movie", 2): "spice",
+            ("series", 1): "prophecy",
+        }
+
+    def test_oldest_entries_evicted_above_max(self, store, monkeypatch):
+        """Only the newest max_entries signatures are kept."""
+        now = time.time()
+        for i in range(5):
+            monkeypatch.setattr(time, "time", lambda i=i: now + i)
+            store.put_many([(("movie", i), f"Movie {i}", f"sig {i}")])
+
+        assert len(store) == 3
+        assert set(store.get_many(("movie", i) for i in range(5))) == {
+            ("movie", 2), ("movie", 3), ("movie", 4)
+        }
+
+    def test_expired_entries_ignored(self, store, monkeypatch):
+        """Signatures older than max_age_days are treated as missing."""
+        store.put_many([(("movie", 1), "Old", "sig")])
+        later = time.time() + 31 * 86400
+        monkeypatch.setattr(time, "time", lambda: later)
+
+        assert store.get_many([("movie", 1)]) == {}
@@ -0,0 +1,83 @@
+"""Unit tests for TMDb concurrent pagination."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from jfc.clients.tmdb import TMDbClient
+
+
+def make_client(total_pages: int, per_page: int = 10, delay=None) -> TMDbClient:
+    """Create a TMDb client serving numbered results from fake pages."""
+    client = TMDbClient("key")
+    client.pages = []
+    client.in_flight = 0
+    client.max_in_flight = 0
+
+    async def perform(method, endpoint, params=None, json=None, **kwargs):
+        page = params["page"]
+        client.pages.append(page)
+        client.in_flight += 1
+        client.max_in_flight = max(client.max_in_flight, client.in_flight)
+        try:
+            await asyncio.sleep(delay(page) if delay else 0.01)
+        finally:
+            client.in_flight -= 1
+
+        start = (page - 1) * per_page
+        response = httpx.Response(200, json={
+            "page": page,
+            "total_pages": total_pages,
+            "results": [{"id": i} for i in range(start, start + per_page)],
+        })
+        response.request = httpx.Request(method, f"http://test{endpoint}")
+        return response
+
+    client._perform_request = perform
+    return client
+
+
+async def fetch(client: TMDbClient, limit: int) -> list[int]:
+    """Fetch result IDs from the fake discover endpoint."""
+    return await client._fetch_pages("/discover/movie", {}, limit, lambda r: r["id"])
+
+
+class TestFetchPages:
+    """Tests for TMDbClient._fetch_pages."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_page_order(self):
+        """Later pages finishing first do not change the result order."""
+        client = make_client(total_pages=5, delay=lambda page: 0.05 / page)
+
+        assert await fetch(client, limit=50) == list(range(50))
+
+    @pytest.mark.asyncio
+    async def test_limit_truncates_and_bounds_pages(self):
+        """Only the pages needed for limit are fetched, then results are cut."""
+        client = make_client(total_pages=10)
+
+        assert await fetch(client, limit=25) == list(range(25))
+        assert sorted(client.pages) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_total_pages_cap(self):
+        """No page beyond total_pages (or MAX_PAGES) is requested."""
+        client = make_client(total_pages=2)
+        assert len(await fetch(client, limit=100)) == 20
+        assert sorted(client.pages) == [1, 2]
+
+        client = make_client(total_pages=50)
+        client.MAX_PAGES = 3
+        assert len(await fetch(client, limit=100)) == 30
+        assert sorted(client.pages) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """At most PAGE_CONCURRENCY pages are in flight."""
+        client = make_client(total_pages=20)
+        client.PAGE_CONCURRENCY = 3
+
+        assert len(await fetch(client, limit=200)) == 200
+        assert client.max_in_flight == 3
@@ -0,0 +1,53 @@
+"""Unit tests for the shared HTTP transport."""
+
+import asyncio
+
+import pytest
+
+from jfc.clients.transport import TransportManager
+
+
+class TestTransportManager:
+    """Tests for TransportManager."""
+
+    @pytest.mark.asyncio
+    async def test_one_pool_per_origin(self):
+        """URLs on the same origin share a client; other origins get their own."""
+        manager = TransportManager()
+
+        first = manager.get_client("https://api.example.com/3/movie/1")
+        same = manager.get_client("HTTPS://API.example.com/3/tv/2?page=3")
+        other_port = manager.get_client("https://api.example.com:8443/")
+        other_host = manager.get_client("http://jellyfin:8096/Items")
+
+        assert first is same
+        assert len({id(first), id(other_port), id(other_host)}) == 3
+        await manager.aclose()
+
+    def test_new_pool_after_loop_change(self):
+        """A pool opened under one event loop is not reused under the next."""
+        manager = TransportManager()
+
+        async def get_client():
+            return manager.get_client("https://api.example.com/")
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+        asyncio.run(manager.aclose())
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_every_client(self):
+        """Closing the manager closes all pools; the next request opens a new one."""
+        manager = TransportManager()
+        clients = [
+            manager.get_client("https://a.example.com/"),
+            manager.get_client("https://b.example.com/"),
+        ]
+
+        await manager.aclose()
+
+        assert all(client.is_closed for client in clients)
+        assert manager.get_client("https://a.example.com/") not in clients
+        await manager.aclose()